@@ -0,0 +1,105 @@
+"""
+Задержка Diary.write в зависимости от размера дневника.
+
+Запуск: python -m benchmarks.diary_write
+База по умолчанию - sqlite в памяти, для PostgreSQL задать BENCHMARK_DATABASE_URL.
+"""
+
+import os
+
+from datetime import date, timedelta
+from statistics import median
+from sys import stdout
+from time import perf_counter
+from uuid import UUID
+
+from sqlalchemy import insert
+
+from src.domain.entities import NoteEntity
+from src.domain.exceptions import NonUniqueNoteBedtimeDateException
+from src.domain.services import DiaryService
+from src.domain.values.points import Points
+from src.infra.database import Database
+from src.infra.orm import ORMNote, ORMUser, metadata
+from src.infra.repository import ORMNotesRepository, ORMStatisticsRepository
+from src.service_layer import Diary
+from tests.use_cases import points_order_desc_from_went_to_bed
+
+
+DIARY_SIZES = (10, 1_000, 100_000)
+WRITES = 50
+LEGACY_WRITES = 3
+FIRST_DATE = date(1700, 1, 1)
+
+_, *TIME_POINTS = points_order_desc_from_went_to_bed
+
+
+def prepare_database(url: str, size: int) -> tuple[Database, UUID]:
+    database = Database(url=url)
+    metadata.drop_all(database.engine)
+    metadata.create_all(database.engine)
+
+    user = ORMUser(username="benchmark", password="benchmark")
+    with database.get_session() as session:
+        session.add(user)
+        session.flush()
+        owner_oid = user.oid
+        rows = [
+            ORMNote.values_from_entity(
+                NoteEntity(
+                    owner_oid=owner_oid,
+                    points=Points(FIRST_DATE + timedelta(days=day), *TIME_POINTS),
+                ),
+            )
+            for day in range(size)
+        ]
+        if rows:
+            session.execute(insert(ORMNote), rows)
+    return database, owner_oid
+
+
+def legacy_write(repository: ORMNotesRepository, note: NoteEntity) -> None:
+    """Прежний путь записи: чтение всего дневника ради проверки уникальности."""
+    diary = DiaryService.create(repository.get_all_notes(note.owner_oid))
+    if not diary.can_write(note):
+        raise NonUniqueNoteBedtimeDateException(note.points.bedtime_date)
+    repository.add(note)
+
+
+def measure(size: int, url: str) -> tuple[float, float]:
+    database, owner_oid = prepare_database(url, size)
+    repository = ORMNotesRepository(database)
+    diary = Diary(repository, ORMStatisticsRepository(database))
+    next_date = FIRST_DATE + timedelta(days=size)
+
+    timings = []
+    for day in range(WRITES):
+        bedtime_date = next_date + timedelta(days=day)
+        started_at = perf_counter()
+        diary.write(owner_oid, bedtime_date, *TIME_POINTS)
+        timings.append(perf_counter() - started_at)
+
+    legacy_timings = []
+    for day in range(WRITES, WRITES + LEGACY_WRITES):
+        note = NoteEntity(
+            owner_oid=owner_oid,
+            points=Points(next_date + timedelta(days=day), *TIME_POINTS),
+        )
+        started_at = perf_counter()
+        legacy_write(repository, note)
+        legacy_timings.append(perf_counter() - started_at)
+
+    database.engine.dispose()
+    return median(timings), median(legacy_timings)
+
+
+def main() -> None:
+    url = os.environ.get("BENCHMARK_DATABASE_URL", "sqlite://")
+    stdout.write(f"{'notes':>10} {'write, ms':>12} {'legacy write, ms':>18}\n")
+    for size in DIARY_SIZES:
+        write, legacy = measure(size, url)
+        stdout.write(f"{size:>10} {write * 1000:>12.3f} {legacy * 1000:>18.3f}\n")
+
+
+if __name__ == "__main__":
+    main()
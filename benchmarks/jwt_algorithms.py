@@ -0,0 +1,114 @@
+"""
+Выпуск и проверка JWT по алгоритмам: ключи, разобранные один раз, против
+прежней передачи PEM строк в PyJWT при каждом вызове, и полный круг сервиса
+create_access + authenticate. Кэш проверенных токенов отключен.
+
+Запуск: python -m benchmarks.jwt_algorithms
+"""
+
+from sys import stdout
+from time import perf_counter
+from typing import Callable
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+from jwt import decode, encode
+
+from src.domain.entities import UserEntity
+from src.infra.authorization import UserJWTService
+from src.project.settings import AuthJWTSettings
+
+
+TOKENS = 1_000
+PEM_TOKENS = 50
+HMAC_SECRET = "benchmark-secret-" + "0" * 32
+
+PrivateKey = (
+    rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey
+)
+
+
+def pem_keys(algorithm: str) -> tuple[str, str]:
+    private_key: PrivateKey
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif algorithm == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    private_pem = private_key.private_bytes(
+        Encoding.PEM,
+        PrivateFormat.PKCS8,
+        NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        Encoding.PEM,
+        PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem.decode(), public_pem.decode()
+
+
+def per_token(action: Callable[[int], object], tokens: int = TOKENS) -> float:
+    started_at = perf_counter()
+    for index in range(tokens):
+        action(index)
+    return (perf_counter() - started_at) / tokens
+
+
+def measure(algorithm: str, user: UserEntity) -> str:
+    if algorithm == "HS256":
+        private_pem = public_pem = HMAC_SECRET
+    else:
+        private_pem, public_pem = pem_keys(algorithm)
+    settings = AuthJWTSettings(
+        ALGORITHM=algorithm,
+        PRIVATE_KEY=private_pem,
+        PUBLIC_KEY=public_pem,
+        JWT_VERIFIED_CACHE_SIZE=0,
+    )
+    service = UserJWTService(settings)
+    key = service.signing_key
+    tokens = [service.create_access(user).access_token for _ in range(TOKENS)]
+    claims = decode(tokens[0], key.verify_key, algorithms=[algorithm])
+
+    encoded = per_token(lambda _: encode(claims, key.sign_key, algorithm))
+    decoded = per_token(
+        lambda index: decode(tokens[index], key.verify_key, [algorithm]),
+    )
+    pem_encoded = per_token(
+        lambda _: encode(claims, private_pem, algorithm),
+        PEM_TOKENS,
+    )
+    pem_decoded = per_token(
+        lambda index: decode(tokens[index], public_pem, [algorithm]),
+        PEM_TOKENS,
+    )
+    service_round = per_token(
+        lambda _: service.authenticate(service.create_access(user).access_token),
+    )
+    return (
+        f"{algorithm:>10} {encoded * 1e6:>11.1f} {decoded * 1e6:>11.1f} "
+        f"{pem_encoded * 1e6:>11.1f} {pem_decoded * 1e6:>11.1f} "
+        f"{service_round * 1e6:>11.1f} {len(tokens[0]):>9}\n"
+    )
+
+
+def main() -> None:
+    user = UserEntity(username="benchmark", password="password")
+
+    stdout.write(
+        f"{'algorithm':>10} {'encode, us':>11} {'decode, us':>11} "
+        f"{'pem encode':>11} {'pem decode':>11} "
+        f"{'issue+auth':>11} {'token, B':>9}\n",
+    )
+    for algorithm in ("RS256", "ES256", "EdDSA", "HS256"):
+        stdout.write(measure(algorithm, user))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Поиск в MemoryNotesRepository: индексы против прежнего перебора всех записей.
+
+Запуск: python -m benchmarks.memory_notes
+"""
+
+import random
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import partial
+from sys import stdout
+from time import perf_counter
+from typing import Callable
+from typing_extensions import Self
+from uuid import UUID, uuid4
+
+from benchmarks.diary_write import FIRST_DATE, TIME_POINTS
+
+from src.domain.entities import NoteEntity
+from src.domain.values.points import Points
+from src.infra.repository import MemoryNotesRepository
+
+
+NIGHTS = 1_000
+OWNERS = (10, 100, 1_000)
+LOOKUPS = 1_000
+LEGACY_LOOKUPS = 20
+
+
+@dataclass
+class LegacyMemoryNotesRepository:
+    """Прежняя реализация: одно множество записей и перебор при каждом поиске."""
+
+    _saved_notes: set[NoteEntity] = field(default_factory=set)
+
+    def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
+        return next((note for note in self._saved_notes if note.oid == oid), None)
+
+    def get_by_bedtime_date(
+        self: Self,
+        bedtime_date: date,
+        owner_oid: UUID,
+    ) -> NoteEntity | None:
+        return next(
+            (
+                note
+                for note in self._saved_notes
+                if note.points.bedtime_date == bedtime_date
+                and note.owner_oid == owner_oid
+            ),
+            None,
+        )
+
+    def get_all_notes(self: Self, owner_oid: UUID) -> set[NoteEntity]:
+        return {note for note in self._saved_notes if note.owner_oid == owner_oid}
+
+
+def measure(
+    lookup: Callable[[NoteEntity], object],
+    notes: list[NoteEntity],
+) -> float:
+    started_at = perf_counter()
+    for note in notes:
+        lookup(note)
+    return (perf_counter() - started_at) / len(notes)
+
+
+def main() -> None:
+    points = [
+        Points(FIRST_DATE + timedelta(days=night), *TIME_POINTS)
+        for night in range(NIGHTS)
+    ]
+    lookups = {
+        "get_by_oid": lambda repository, note: repository.get_by_oid(note.oid),
+        "get_by_bedtime_date": lambda repository, note: (
+            repository.get_by_bedtime_date(note.points.bedtime_date, note.owner_oid)
+        ),
+        "get_all_notes": lambda repository, note: (
+            repository.get_all_notes(note.owner_oid)
+        ),
+    }
+
+    stdout.write(
+        f"{'notes':>10} {'lookup':>20} {'indexed, us':>12} {'legacy, us':>12}\n",
+    )
+    for owners in OWNERS:
+        notes = [
+            NoteEntity(owner_oid=owner_oid, points=note_points)
+            for owner_oid in (uuid4() for _ in range(owners))
+            for note_points in points
+        ]
+        repository = MemoryNotesRepository()
+        repository.add_many(notes)
+        legacy_repository = LegacyMemoryNotesRepository(set(notes))
+        sample = random.sample(notes, LOOKUPS)
+
+        for name, lookup in lookups.items():
+            indexed = measure(partial(lookup, repository), sample)
+            legacy = measure(
+                partial(lookup, legacy_repository),
+                sample[:LEGACY_LOOKUPS],
+            )
+            stdout.write(
+                f"{len(notes):>10} {name:>20} "
+                f"{indexed * 1e6:>12.2f} {legacy * 1e6:>12.2f}\n",
+            )
+
+
+if __name__ == "__main__":
+    main()
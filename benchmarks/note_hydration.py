@@ -0,0 +1,100 @@
+"""
+Создание NoteEntity из строк БД: Points.trusted против Points с проверками
+validate. Время на строку для чтения 100k записей и профиль обоих путей.
+
+Запуск: python -m benchmarks.note_hydration
+База по умолчанию - sqlite в памяти, для PostgreSQL задать BENCHMARK_DATABASE_URL.
+"""
+
+import os
+
+from cProfile import Profile
+from pstats import SortKey, Stats
+from sys import stdout
+from time import perf_counter
+from typing import Callable
+from unittest.mock import patch
+
+from benchmarks.diary_write import prepare_database
+
+from sqlalchemy import select
+
+from src.domain.entities import NoteEntity
+from src.domain.services.batch import minutes_to_point
+from src.domain.values.points import Points
+from src.infra.orm import ORMNote
+from src.infra.repository import ORMNotesRepository
+
+
+NOTES = 100_000
+PROFILE_LINES = 8
+
+
+def legacy_to_entity(note: ORMNote) -> NoteEntity:
+    """Прежний путь: Points заново проверяются для каждой строки."""
+    return NoteEntity(
+        oid=note.oid,
+        owner_oid=note.owner_oid,
+        created_at=note.created_date,
+        updated_at=note.updated_date,
+        points=Points(
+            note.bedtime_date,
+            minutes_to_point(note.went_to_bed),
+            minutes_to_point(note.fell_asleep),
+            minutes_to_point(note.woke_up),
+            minutes_to_point(note.got_up),
+            minutes_to_point(note.no_sleep),
+        ),
+    )
+
+
+def per_row(action: Callable[[], object]) -> float:
+    started_at = perf_counter()
+    action()
+    return (perf_counter() - started_at) / NOTES
+
+
+def profile(action: Callable[[], object]) -> None:
+    with Profile() as profiler:
+        action()
+    Stats(profiler).sort_stats(SortKey.TIME).print_stats(PROFILE_LINES)
+
+
+def main() -> None:
+    url = os.environ.get("BENCHMARK_DATABASE_URL", "sqlite://")
+    database, owner_oid = prepare_database(url, NOTES)
+    repository = ORMNotesRepository(database)
+
+    def legacy_read() -> set[NoteEntity]:
+        with patch.object(ORMNote, "to_entity", legacy_to_entity):
+            return repository.get_all_notes(owner_oid)
+
+    with database.get_read_only_session() as session:
+        notes = session.scalars(
+            select(ORMNote).where(ORMNote.owner_oid == owner_oid),
+        ).all()
+        hydration = {
+            "trusted": lambda: [note.to_entity() for note in notes],
+            "legacy": lambda: [legacy_to_entity(note) for note in notes],
+        }
+
+        stdout.write(
+            f"{'path':>8} {'hydration, us/row':>18} "
+            f"{'get_all_notes, us/row':>22}\n",
+        )
+        for name, read in (
+            ("trusted", lambda: repository.get_all_notes(owner_oid)),
+            ("legacy", legacy_read),
+        ):
+            stdout.write(
+                f"{name:>8} {per_row(hydration[name]) * 1e6:>18.2f} "
+                f"{per_row(read) * 1e6:>22.2f}\n",
+            )
+
+        for name, hydrate in hydration.items():
+            stdout.write(f"\nПрофиль создания {NOTES} записей, {name}:\n")
+            profile(hydrate)
+
+
+if __name__ == "__main__":
+    main()
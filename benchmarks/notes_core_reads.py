@@ -0,0 +1,67 @@
+"""
+Чтение записей через Core со сборкой NoteEntity из строк против прежнего
+чтения экземпляров ORMNote (identity map, to_entity) для 1, 100 и 100k строк.
+
+Запуск: python -m benchmarks.notes_core_reads
+База по умолчанию - sqlite в памяти, для PostgreSQL задать BENCHMARK_DATABASE_URL.
+"""
+
+import os
+
+from functools import partial
+from statistics import median
+from sys import stdout
+from time import perf_counter
+from typing import Callable
+from uuid import UUID
+
+from benchmarks.diary_write import prepare_database
+
+from sqlalchemy import select
+
+from src.domain.entities import NoteEntity
+from src.infra.database import Database
+from src.infra.orm import ORMNote
+from src.infra.repository import ORMNotesRepository
+
+
+ROWS = {1: 1_000, 100: 200, 100_000: 5}
+
+
+def legacy_get_all_notes(database: Database, owner_oid: UUID) -> set[NoteEntity]:
+    """Прежний путь: экземпляры ORMNote и ORMNote.to_entity для каждой строки."""
+    with database.get_read_only_session() as session:
+        stmt = select(ORMNote).where(ORMNote.owner_oid == owner_oid)
+        return {note.to_entity() for note in session.scalars(stmt)}
+
+
+def measure(read: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started_at = perf_counter()
+        read()
+        timings.append(perf_counter() - started_at)
+    return median(timings)
+
+
+def main() -> None:
+    url = os.environ.get("BENCHMARK_DATABASE_URL", "sqlite://")
+
+    stdout.write(
+        f"{'rows':>8} {'core, ms':>10} {'orm, ms':>10} {'core, us/row':>13}\n",
+    )
+    for rows, repeats in ROWS.items():
+        database, owner_oid = prepare_database(url, rows)
+        repository = ORMNotesRepository(database)
+
+        core = measure(partial(repository.get_all_notes, owner_oid), repeats)
+        orm = measure(partial(legacy_get_all_notes, database, owner_oid), repeats)
+        stdout.write(
+            f"{rows:>8} {core * 1000:>10.3f} {orm * 1000:>10.3f} "
+            f"{core / rows * 1e6:>13.2f}\n",
+        )
+        database.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
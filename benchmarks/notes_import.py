@@ -0,0 +1,57 @@
+"""
+Импорт истории дневника: Diary.import_notes против построчного Diary.write.
+
+Запуск: python -m benchmarks.notes_import
+База по умолчанию - sqlite в памяти, для PostgreSQL задать BENCHMARK_DATABASE_URL.
+"""
+
+import os
+
+from datetime import timedelta
+from sys import stdout
+from time import perf_counter
+
+from benchmarks.diary_write import FIRST_DATE, TIME_POINTS, prepare_database
+
+from src.infra.repository import ORMNotesRepository, ORMStatisticsRepository
+from src.service_layer import Diary
+
+
+NIGHTS = 100_000
+WRITES = 1_000
+FIELDS = ("went_to_bed", "fell_asleep", "woke_up", "got_up")
+
+
+def main() -> None:
+    url = os.environ.get("BENCHMARK_DATABASE_URL", "sqlite://")
+    database, owner_oid = prepare_database(url, 0)
+    diary = Diary(ORMNotesRepository(database), ORMStatisticsRepository(database))
+
+    rows = (
+        (
+            night,
+            {
+                "bedtime_date": FIRST_DATE + timedelta(days=night),
+                **dict(zip(FIELDS, TIME_POINTS)),
+            },
+        )
+        for night in range(NIGHTS)
+    )
+    started_at = perf_counter()
+    report = diary.import_notes(owner_oid, rows)
+    imported_in = perf_counter() - started_at
+    assert report.imported == NIGHTS, report.errors[:10]
+
+    started_at = perf_counter()
+    for night in range(NIGHTS, NIGHTS + WRITES):
+        diary.write(owner_oid, FIRST_DATE + timedelta(days=night), *TIME_POINTS)
+    written_in = (perf_counter() - started_at) * NIGHTS / WRITES
+
+    stdout.write(f"import_notes, {NIGHTS} nights: {imported_in:.2f} s\n")
+    stdout.write(
+        f"write x {NIGHTS} (extrapolated from {WRITES}): {written_in:.2f} s\n",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Память на Points и время Durations: минуты в слотах против прежних пяти
+datetime.time в __dict__ объекта.
+
+Запуск: python -m benchmarks.points_memory
+"""
+
+import tracemalloc
+
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from sys import stdout
+from time import perf_counter
+from typing import Callable, TypeVar
+
+from benchmarks.diary_write import FIRST_DATE, TIME_POINTS
+
+from src.domain.services import Durations
+from src.domain.values.points import Points
+
+
+NIGHTS = 100_000
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class LegacyPoints:
+    """Прежнее представление: пять datetime.time, без проверок."""
+
+    bedtime_date: date
+    went_to_bed: time
+    fell_asleep: time
+    woke_up: time
+    got_up: time
+    no_sleep: time = field(default=time())
+
+
+def legacy_sleep(points: LegacyPoints) -> timedelta:
+    """Прежний расчет Durations.sleep через часы и минуты time."""
+    duration = timedelta(
+        hours=points.woke_up.hour - points.fell_asleep.hour,
+        minutes=points.woke_up.minute - points.fell_asleep.minute,
+    )
+    return timedelta(seconds=duration.seconds)
+
+
+def allocated(create: Callable[[date], T]) -> tuple[list[T], float]:
+    # Время в точках свое для каждой записи, как у строк из БД.
+    tracemalloc.start()
+    objects = [create(FIRST_DATE + timedelta(days=night)) for night in range(NIGHTS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, size / NIGHTS
+
+
+def per_object(action: Callable[[T], object], objects: list[T]) -> float:
+    started_at = perf_counter()
+    for obj in objects:
+        action(obj)
+    return (perf_counter() - started_at) / len(objects)
+
+
+def main() -> None:
+    points, points_size = allocated(
+        lambda bedtime_date: Points(
+            bedtime_date,
+            *(point.replace() for point in TIME_POINTS),
+        ),
+    )
+    legacy, legacy_size = allocated(
+        lambda bedtime_date: LegacyPoints(
+            bedtime_date,
+            *(point.replace() for point in TIME_POINTS),
+        ),
+    )
+    sleep = per_object(lambda obj: Durations(obj).sleep, points)
+    legacy_sleep_time = per_object(legacy_sleep, legacy)
+
+    stdout.write(f"{'':>14} {'minutes':>9} {'legacy':>9}\n")
+    stdout.write(f"{'bytes/object':>14} {points_size:>9.0f} {legacy_size:>9.0f}\n")
+    stdout.write(
+        f"{'sleep, us':>14} {sleep * 1e6:>9.3f} {legacy_sleep_time * 1e6:>9.3f}\n",
+    )
+
+
+if __name__ == "__main__":
+    main()
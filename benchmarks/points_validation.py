@@ -0,0 +1,71 @@
+"""
+Проверка Points: один проход по минутам и пакетная проверка массивов против
+прежних спецификаций (четыре сортировки последовательностей и Durations).
+
+Запуск: python -m benchmarks.points_validation
+"""
+
+from datetime import timedelta
+from sys import stdout
+from time import perf_counter
+from typing import Callable
+from typing_extensions import Self
+
+from benchmarks.diary_write import FIRST_DATE, TIME_POINTS
+
+from src.domain.exceptions import (
+    NoSleepDurationException,
+    TimePointsSequenceException,
+)
+from src.domain.services import Durations, PointsColumns
+from src.domain.specifications import (
+    NoSleepHasValidTime,
+    PointsHasValidAnyAllowedSortedSequences,
+    find_invalid_points,
+)
+from src.domain.values.points import Points
+
+
+NIGHTS = 100_000
+
+
+class LegacyPoints(Points):
+    """Прежняя проверка через спецификации."""
+
+    def validate(self: Self) -> None:
+        if not NoSleepHasValidTime(Durations(self)):
+            raise NoSleepDurationException
+
+        if not PointsHasValidAnyAllowedSortedSequences(self):
+            raise TimePointsSequenceException
+
+
+def per_night(action: Callable[[], object]) -> float:
+    started_at = perf_counter()
+    action()
+    return (perf_counter() - started_at) / NIGHTS
+
+
+def main() -> None:
+    dates = [FIRST_DATE + timedelta(days=night) for night in range(NIGHTS)]
+    points = [Points(bedtime_date, *TIME_POINTS) for bedtime_date in dates]
+    columns = PointsColumns.from_points(points)
+
+    timings = {
+        "single pass": per_night(
+            lambda: [Points(bedtime_date, *TIME_POINTS) for bedtime_date in dates],
+        ),
+        "specifications": per_night(
+            lambda: [
+                LegacyPoints(bedtime_date, *TIME_POINTS) for bedtime_date in dates
+            ],
+        ),
+        "batch": per_night(lambda: find_invalid_points(columns)),
+    }
+    stdout.write(f"{'validation':>15} {'us/points':>10}\n")
+    for name, timing in timings.items():
+        stdout.write(f"{name:>15} {timing * 1e6:>10.3f}\n")
+
+
+if __name__ == "__main__":
+    main()
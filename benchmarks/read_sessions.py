@@ -0,0 +1,115 @@
+"""
+Чтения репозиториев в сессии только для чтения против прежней сессии с COMMIT:
+число обращений к БД на вызов и медианная задержка.
+
+Запуск: python -m benchmarks.read_sessions
+База по умолчанию - sqlite в памяти, для PostgreSQL задать BENCHMARK_DATABASE_URL.
+"""
+
+import os
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from statistics import median
+from sys import stdout
+from time import perf_counter
+from typing import Callable, ContextManager, cast
+from typing_extensions import Self
+
+from benchmarks.diary_write import FIRST_DATE, prepare_database
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from src.domain.services import Period
+from src.infra.database import Database
+from src.infra.instrumentation import StatementCounter
+from src.infra.repository import (
+    ORMNotesRepository,
+    ORMStatisticsRepository,
+    ORMUsersRepository,
+)
+
+
+NOTES = 1_000
+READS = 200
+
+
+@dataclass
+class LegacyDatabase:
+    """Прежнее поведение: чтения в обычной сессии с BEGIN и COMMIT."""
+
+    database: Database
+
+    def get_session(self: Self) -> ContextManager[Session]:
+        return self.database.get_session()
+
+    def get_read_only_session(self: Self) -> ContextManager[Session]:
+        return self.database.get_session()
+
+    @property
+    def engine(self: Self) -> Engine:
+        return self.database.engine
+
+
+def measure(
+    database: Database | LegacyDatabase,
+    read: Callable[[], object],
+) -> tuple[float, float]:
+    with StatementCounter(database.engine) as counter:
+        read()
+
+    timings = []
+    for _ in range(READS):
+        started_at = perf_counter()
+        read()
+        timings.append(perf_counter() - started_at)
+    return counter.total, median(timings)
+
+
+def main() -> None:
+    url = os.environ.get("BENCHMARK_DATABASE_URL", "sqlite://")
+    database, owner_oid = prepare_database(url, NOTES)
+    legacy_database = LegacyDatabase(database)
+    bedtime_date = FIRST_DATE + timedelta(days=NOTES // 2)
+
+    def reads(database: Database) -> dict[str, Callable[[], object]]:
+        notes = ORMNotesRepository(database)
+        statistics = ORMStatisticsRepository(database)
+        return {
+            "get_by_bedtime_date": lambda: notes.get_by_bedtime_date(
+                bedtime_date,
+                owner_oid,
+            ),
+            "get_all_notes": lambda: notes.get_all_notes(owner_oid),
+            "get_by_username": lambda: (
+                ORMUsersRepository(database).get_by_username("benchmark")
+            ),
+            "get_statistics": lambda: statistics.get_statistics(
+                owner_oid,
+                Period.MONTH,
+                date.min,
+                date.max,
+            ),
+        }
+
+    stdout.write(
+        f"{'read':>20} {'statements':>11} {'legacy':>7} "
+        f"{'read, ms':>9} {'legacy, ms':>11}\n",
+    )
+    # LegacyDatabase повторяет интерфейс Database, репозиториям он подходит.
+    legacy_reads = reads(cast(Database, legacy_database))
+    for name, read in reads(database).items():
+        statements, timing = measure(database, read)
+        legacy_statements, legacy_timing = measure(
+            legacy_database,
+            legacy_reads[name],
+        )
+        stdout.write(
+            f"{name:>20} {statements:>11} {legacy_statements:>7} "
+            f"{timing * 1000:>9.3f} {legacy_timing * 1000:>11.3f}\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+MemoryRevokedTokensStore с миллионом отозванных jti: revoke, проверка
+отозванного и неотозванного jti, очистка колеса времени и память.
+
+Запуск: python -m benchmarks.token_revocation
+"""
+
+import tracemalloc
+
+from datetime import UTC, datetime
+from sys import stdout
+from time import perf_counter
+from typing import Callable
+from unittest.mock import patch
+from uuid import uuid4
+
+from src.infra.authorization import MemoryRevokedTokensStore
+
+
+REVOKED = 1_000_000
+LOOKUPS = 1_000_000
+# exp отозванных токенов равномерно в ближайшие сутки, как у refresh токенов.
+EXPIRE_SECONDS = 24 * 60 * 60
+
+
+def per_call(action: Callable[[str], object], jtis: list[str]) -> float:
+    started_at = perf_counter()
+    for jti in jtis:
+        action(jti)
+    return (perf_counter() - started_at) / len(jtis)
+
+
+def main() -> None:
+    now = datetime.now(UTC).timestamp()
+    jtis = [str(uuid4()) for _ in range(REVOKED)]
+    unknown = [str(uuid4()) for _ in range(LOOKUPS)]
+    exps = [now + 1 + index * EXPIRE_SECONDS / REVOKED for index in range(REVOKED)]
+
+    store = MemoryRevokedTokensStore()
+    started_at = perf_counter()
+    for jti, exp in zip(jtis, exps):
+        store.revoke(jti, exp)
+    revoke = (perf_counter() - started_at) / REVOKED
+
+    tracemalloc.start()
+    measured_store = MemoryRevokedTokensStore()
+    for jti, exp in zip(jtis, exps):
+        measured_store.revoke(jti, exp)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del measured_store
+
+    # Цикл и вызов пустой функции вычитаются из времени проверки.
+    loop = per_call(lambda jti: None, unknown)
+    revoked_hit = per_call(store.is_revoked, jtis[:LOOKUPS]) - loop
+    revoked_miss = per_call(store.is_revoked, unknown) - loop
+
+    # Через час истекает 1/24 записей.
+    with patch.object(store, "_now", lambda: now + 3600):
+        started_at = perf_counter()
+        store.purge_expired()
+        purge = perf_counter() - started_at
+
+    stdout.write(f"revoked jti:              {REVOKED:>12}\n")
+    stdout.write(f"revoke, us:               {revoke * 1e6:>12.2f}\n")
+    stdout.write(f"is_revoked (hit), ns:     {revoked_hit * 1e9:>12.1f}\n")
+    stdout.write(f"is_revoked (miss), ns:    {revoked_miss * 1e9:>12.1f}\n")
+    stdout.write(f"memory, MB:               {memory / 2 ** 20:>12.1f}\n")
+    stdout.write(f"purge 1h ({REVOKED - len(store)} jti), ms: {purge * 1e3:>6.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
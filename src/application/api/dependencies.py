@@ -0,0 +1,63 @@
+from typing import AsyncGenerator
+from uuid import UUID
+
+from fastapi import Depends, HTTPException
+from fastapi.security import OAuth2PasswordBearer
+from punq import Container
+from starlette import status
+
+from src.domain.services import IAsyncUnitOfWork
+from src.infra.authorization import (
+    IUserTokenService,
+    JWTAuthorizationException,
+    Principal,
+)
+from src.project.containers import get_container
+
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login/")
+
+
+async def get_unit_of_work(
+    container: Container = Depends(get_container),
+) -> AsyncGenerator[IAsyncUnitOfWork, None]:
+    """
+    Единица работы запроса: одна сессия и транзакция на все вызовы
+    репозиториев, фиксация после успешного завершения обработчика.
+    """
+    async with container.resolve(IAsyncUnitOfWork) as unit_of_work:
+        yield unit_of_work
+
+
+async def get_read_only_unit_of_work(
+    container: Container = Depends(get_container),
+) -> AsyncGenerator[IAsyncUnitOfWork, None]:
+    """Единица работы эндпоинтов чтения: запросы без BEGIN/COMMIT."""
+    async with container.resolve(IAsyncUnitOfWork, read_only=True) as unit_of_work:
+        yield unit_of_work
+
+
+def get_principal(
+    token: str = Depends(oauth2_scheme),
+    container: Container = Depends(get_container),
+) -> Principal:
+    """
+    Пользователь по access токену. FastAPI вызывает зависимость один раз на
+    запрос, проверенные токены token_service берет из кэша.
+    """
+    token_service: IUserTokenService = container.resolve(IUserTokenService)
+    try:
+        return token_service.authenticate(token)
+    except JWTAuthorizationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def get_owner_oid(principal: Principal = Depends(get_principal)) -> UUID:
+    """
+    Владелец записей - sub проверенного токена, без чтения пользователя из БД.
+    """
+    return principal.user_oid
@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from starlette import status
 
-from src.application.api.routers import about, auth, notes
+from src.application.api.routers import about, auth, metrics, notes
 from src.application.api.schemas import ErrorSchema
 
 
@@ -19,6 +19,9 @@ def create_app() -> FastAPI:
     app.include_router(about.router, prefix="/about")
     app.include_router(notes.router, prefix="/notes")
     app.include_router(auth.router_login, prefix="/auth")
+    app.include_router(auth.router_logout, prefix="/auth")
+    app.include_router(auth.router_refresh, prefix="/auth")
     app.include_router(auth.router_me, prefix="/auth")
     app.include_router(auth.router_register, prefix="/auth")
+    app.include_router(metrics.router, prefix="/metrics")
     return app
@@ -1,10 +1,14 @@
 from src.application.api.routers.auth.login import router as router_login
+from src.application.api.routers.auth.logout import router as router_logout
+from src.application.api.routers.auth.refresh import router as router_refresh
 from src.application.api.routers.auth.register import router as router_register
 from src.application.api.routers.auth.user_info import router as router_me
 
 
 __all__ = (
     "router_login",
+    "router_logout",
     "router_me",
+    "router_refresh",
     "router_register",
 )
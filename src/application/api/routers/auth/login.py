@@ -1,26 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from punq import Container
 from starlette import status
 
+from src.application.api.dependencies import get_unit_of_work
 from src.application.api.routers.auth.schemas import (
-    AccessJWTResponseSchema,
+    JWTResponseSchema,
     PasswordForm,
     UserNameForm,
 )
-from src.infra.authorization import IUserTokenService
-from src.infra.authorization.base import AccessToken
+from src.application.api.schemas import ErrorSchema
+from src.domain.services import IAsyncUnitOfWork
+from src.infra.authorization import AsyncRefreshTokenRotation, TokenPair
 from src.project.containers import get_container
 from src.service_layer.exceptions import (
     AuthenticationException,
+    LoginThrottledException,
+    PasswordHashingBusyException,
     UserCredentialsFormatException,
 )
-from src.service_layer.services import IUserAuthenticationService
+from src.service_layer.services import IAsyncUserAuthenticationService, LoginThrottle
 
 
 router = APIRouter(
     tags=["Authentication", "JWT"],
     responses={
-        status.HTTP_201_CREATED: {"model": AccessJWTResponseSchema},
+        status.HTTP_201_CREATED: {"model": JWTResponseSchema},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": ErrorSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorSchema},
     },
 )
 
@@ -29,29 +35,57 @@ router = APIRouter(
     path="/login/",
     description=(
         "Эндпоинт для аутентификации пользователя по имени пользователя и паролю. "
-        "И выпуска JWT токена для дальнейшей авторизации пользователя."
+        "И выпуска access и refresh JWT токенов для дальнейшей авторизации "
+        "пользователя. Попытки входа ограничены по имени пользователя и IP."
     ),
     status_code=status.HTTP_201_CREATED,
-    response_model=AccessJWTResponseSchema,
+    response_model=JWTResponseSchema,
 )
-def authenticate_user_and_issue_jwt(
+async def authenticate_user_and_issue_jwt(
+    request: Request,
     username: str = UserNameForm,
     password: str = PasswordForm,
     container: Container = Depends(get_container),
-) -> AccessToken:
-    authentication_service: IUserAuthenticationService
-    authentication_service = container.resolve(IUserAuthenticationService)
+    unit_of_work: IAsyncUnitOfWork = Depends(get_unit_of_work),
+) -> TokenPair:
+    authentication_service: IAsyncUserAuthenticationService
+    authentication_service = container.resolve(
+        IAsyncUserAuthenticationService,
+        unit_of_work=unit_of_work,
+    )
 
-    token_service: IUserTokenService = container.resolve(IUserTokenService)
+    token_rotation: AsyncRefreshTokenRotation = container.resolve(
+        AsyncRefreshTokenRotation,
+        unit_of_work=unit_of_work,
+    )
+
+    throttle: LoginThrottle = container.resolve(LoginThrottle)
+    # За reverse proxy адрес клиента берется из X-Forwarded-For только при
+    # uvicorn --proxy-headers и адресе proxy в FORWARDED_ALLOW_IPS.
+    client_ip = request.client.host if request.client else "unknown"
 
     try:
-        authentication_service.login(username, password)
-        return token_service.create_access(authentication_service.user)
+        throttle.acquire(username, client_ip)
+        await authentication_service.login(username, password)
+        throttle.reset(username)
+        return await token_rotation.issue(authentication_service.user)
     except UserCredentialsFormatException as exception:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail={"error": exception.message},
         )
+    except LoginThrottledException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={"error": exception.message},
+            headers={"Retry-After": str(exception.retry_after_seconds)},
+        )
+    except PasswordHashingBusyException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"error": exception.message},
+            headers={"Retry-After": "1"},
+        )
     except AuthenticationException as exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends
+from punq import Container
+from starlette import status
+
+from src.application.api.dependencies import get_principal, get_unit_of_work
+from src.domain.services import IAsyncUnitOfWork
+from src.infra.authorization import (
+    AsyncRefreshTokenRotation,
+    IUserTokenService,
+    JWTAuthorizationException,
+    Principal,
+)
+from src.project.containers import get_container
+
+
+router = APIRouter(
+    tags=["Authentication", "JWT"],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": JWTAuthorizationException},
+    },
+)
+
+
+@router.post(
+    path="/logout/",
+    description=(
+        "Эндпоинт для выхода: токен запроса отзывается до истечения срока, "
+        "refresh токен того же входа больше не обменивается."
+    ),
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+)
+async def logout_user(
+    principal: Principal = Depends(get_principal),
+    container: Container = Depends(get_container),
+    unit_of_work: IAsyncUnitOfWork = Depends(get_unit_of_work),
+) -> None:
+    token_service: IUserTokenService = container.resolve(IUserTokenService)
+    token_rotation: AsyncRefreshTokenRotation = container.resolve(
+        AsyncRefreshTokenRotation,
+        unit_of_work=unit_of_work,
+    )
+    await token_rotation.end(principal)
+    token_service.deauthorize(principal)
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException
+from punq import Container
+from starlette import status
+
+from src.application.api.routers.auth.schemas import (
+    JWTResponseSchema,
+    RefreshTokenForm,
+)
+from src.domain.services import IAsyncUnitOfWork
+from src.infra.authorization import (
+    AsyncRefreshTokenRotation,
+    JWTAuthorizationException,
+    RefreshTokenReuseException,
+    TokenPair,
+)
+from src.project.containers import get_container
+
+
+router = APIRouter(
+    tags=["Authentication", "JWT"],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": JWTAuthorizationException},
+    },
+)
+
+
+@router.post(
+    path="/refresh/",
+    description=(
+        "Эндпоинт для обмена refresh токена на новую пару access и refresh "
+        "токенов. Каждый refresh токен принимается один раз."
+    ),
+    status_code=status.HTTP_201_CREATED,
+    response_model=JWTResponseSchema,
+)
+async def refresh_jwt(
+    refresh_token: str = RefreshTokenForm,
+    container: Container = Depends(get_container),
+) -> TokenPair:
+    # Своя единица работы вместо get_unit_of_work: удаление семейства при
+    # повторном использовании токена фиксируется до ответа 401.
+    error: JWTAuthorizationException | None = None
+    async with container.resolve(IAsyncUnitOfWork) as unit_of_work:
+        token_rotation: AsyncRefreshTokenRotation = container.resolve(
+            AsyncRefreshTokenRotation,
+            unit_of_work=unit_of_work,
+        )
+        try:
+            return await token_rotation.refresh(refresh_token)
+        except RefreshTokenReuseException as exception:
+            error = exception
+        except JWTAuthorizationException as exception:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={"error": exception.message},
+            )
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={"error": error.message},
+    )
@@ -2,17 +2,24 @@ from fastapi import APIRouter, Depends, HTTPException
 from punq import Container
 from starlette import status
 
+from src.application.api.dependencies import get_unit_of_work
 from src.application.api.routers.auth.schemas import PasswordForm, UserNameForm
+from src.application.api.schemas import ErrorSchema
+from src.domain.services import IAsyncUnitOfWork
 from src.project.containers import get_container
 from src.service_layer.exceptions import (
+    PasswordHashingBusyException,
     UserCredentialsFormatException,
     UserRegisterException,
 )
-from src.service_layer.services import IUserAuthenticationService
+from src.service_layer.services import IAsyncUserAuthenticationService
 
 
 router = APIRouter(
     tags=["Authentication"],
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorSchema},
+    },
 )
 
 
@@ -24,21 +31,31 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
     response_model=None,
 )
-def register_user(
+async def register_user(
     username: str = UserNameForm,
     password: str = PasswordForm,
     container: Container = Depends(get_container),
+    unit_of_work: IAsyncUnitOfWork = Depends(get_unit_of_work),
 ) -> None:
-    authentication_service: IUserAuthenticationService
-    authentication_service = container.resolve(IUserAuthenticationService)
+    authentication_service: IAsyncUserAuthenticationService
+    authentication_service = container.resolve(
+        IAsyncUserAuthenticationService,
+        unit_of_work=unit_of_work,
+    )
 
     try:
-        authentication_service.register(username, password)
+        await authentication_service.register(username, password)
     except UserCredentialsFormatException as exception:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail={"error": exception.message},
         )
+    except PasswordHashingBusyException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"error": exception.message},
+            headers={"Retry-After": "1"},
+        )
     except UserRegisterException as exception:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,11 +1,7 @@
 from fastapi import Form
-from fastapi.security import OAuth2PasswordBearer
 from pydantic import UUID4, BaseModel
 
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
-
-
 class AccessJWTResponseSchema(BaseModel):
     access_token: str
     token_type: str = "Bearer"
@@ -23,6 +19,10 @@ PasswordForm: str = Form(
     title="User password",
     description="Пароль пользователя",
 )
+RefreshTokenForm: str = Form(
+    title="Refresh token",
+    description="Refresh токен из входа или обмена",
+)
 
 
 class MeInfoResponse(BaseModel):
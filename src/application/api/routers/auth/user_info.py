@@ -1,13 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from punq import Container
+from fastapi import APIRouter, Depends
 from starlette import status
 
+from src.application.api.dependencies import get_principal
 from src.application.api.routers.auth.schemas import (
     MeInfoResponse,
 )
-from src.infra.authorization import IUserTokenService, JWTAuthorizationException
-from src.infra.authorization.base import UserJWTPayload
-from src.project.containers import get_container
+from src.infra.authorization import JWTAuthorizationException, Principal
 
 
 router = APIRouter(
@@ -27,14 +25,5 @@ router = APIRouter(
     status_code=status.HTTP_200_OK,
     response_model=MeInfoResponse,
 )
-def me_info(
-    container: Container = Depends(get_container),
-) -> UserJWTPayload:
-    token_service: IUserTokenService = container.resolve(IUserTokenService)
-    try:
-        return token_service.payload
-    except JWTAuthorizationException as exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={"error": exception.message},
-        )
+def me_info(principal: Principal = Depends(get_principal)) -> MeInfoResponse:
+    return MeInfoResponse(oid=principal.user_oid, username=principal.username)
@@ -0,0 +1,4 @@
+from src.application.api.routers.metrics.metrics import router
+
+
+__all__ = ("router",)
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends
+from punq import Container
+from starlette import status
+
+from src.application.api.dependencies import get_principal
+from src.application.api.routers.metrics.schemas import (
+    LoginThrottleMetricsSchema,
+    PasswordHashingMetricsSchema,
+    UsersCacheMetricsSchema,
+)
+from src.infra.repository import UsersCache
+from src.project.containers import get_container
+from src.service_layer.services import LoginThrottle, PasswordHashingPool
+
+
+# Метрики процесса не относятся к пользователю, но открывать их без
+# аутентификации незачем.
+router = APIRouter(tags=["Metrics"], dependencies=[Depends(get_principal)])
+
+
+@router.get(
+    path="/password-hashing/",
+    description="Очередь и задержки пула потоков bcrypt для входа и регистрации.",
+    status_code=status.HTTP_200_OK,
+    response_model=PasswordHashingMetricsSchema,
+)
+def get_password_hashing_metrics(
+    container: Container = Depends(get_container),
+) -> PasswordHashingMetricsSchema:
+    metrics = container.resolve(PasswordHashingPool).metrics
+    return PasswordHashingMetricsSchema.model_validate(metrics, from_attributes=True)
+
+
+@router.get(
+    path="/login-throttle/",
+    description="Пропущенные и отклоненные ограничением попытки входа.",
+    status_code=status.HTTP_200_OK,
+    response_model=LoginThrottleMetricsSchema,
+)
+def get_login_throttle_metrics(
+    container: Container = Depends(get_container),
+) -> LoginThrottleMetricsSchema:
+    metrics = container.resolve(LoginThrottle).metrics
+    return LoginThrottleMetricsSchema.model_validate(metrics, from_attributes=True)
+
+
+@router.get(
+    path="/users-cache/",
+    description="Попадания и промахи кэша пользователей для входа и регистрации.",
+    status_code=status.HTTP_200_OK,
+    response_model=UsersCacheMetricsSchema,
+)
+def get_users_cache_metrics(
+    container: Container = Depends(get_container),
+) -> UsersCacheMetricsSchema:
+    metrics = container.resolve(UsersCache).metrics
+    return UsersCacheMetricsSchema.model_validate(metrics, from_attributes=True)
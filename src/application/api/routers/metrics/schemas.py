@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+
+class PasswordHashingMetricsSchema(BaseModel):
+    queue_depth: int = Field(title="Задачи, ожидающие поток bcrypt")
+    in_progress: int = Field(title="Задачи в потоках bcrypt")
+    completed: int = Field(title="Выполненные задачи")
+    rejected: int = Field(title="Отклоненные с 503 задачи")
+    wait_seconds_avg: float = Field(title="Среднее ожидание потока, с")
+    wait_seconds_max: float = Field(title="Наибольшее ожидание потока, с")
+    hash_seconds_avg: float = Field(title="Среднее время bcrypt, с")
+    hash_seconds_max: float = Field(title="Наибольшее время bcrypt, с")
+
+
+class LoginThrottleMetricsSchema(BaseModel):
+    allowed: int = Field(title="Пропущенные попытки входа")
+    rejected_by_username: int = Field(title="Отклоненные по имени пользователя")
+    rejected_by_ip: int = Field(title="Отклоненные по IP клиента")
+
+
+class UsersCacheMetricsSchema(BaseModel):
+    hits: int = Field(title="Найденные в кэше пользователи")
+    negative_hits: int = Field(title="Найденные в кэше отсутствующие имена")
+    misses: int = Field(title="Чтения пользователя из БД")
+    invalidations: int = Field(title="Удаленные при изменении записи")
+    size: int = Field(title="Записи в кэше")
@@ -1,21 +1,38 @@
 from datetime import date
-from typing import Annotated
+from json import dumps
+from typing import Annotated, AsyncIterator
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from punq import Container
 from pydantic import UUID4
 from starlette import status
 
+from src.application.api.dependencies import (
+    get_owner_oid,
+    get_read_only_unit_of_work,
+    get_unit_of_work,
+)
+from src.application.api.routers.notes.parsers import ROWS_PARSERS, iter_lines
 from src.application.api.routers.notes.schemas import (
     CreatePointsRequestSchema,
+    ImportNotesResponseSchema,
     NoteResponseSchema,
+    NotesPageResponseSchema,
+    PeriodStatisticsResponseSchema,
 )
 from src.domain.exceptions import ApplicationException
+from src.domain.services import IAsyncUnitOfWork, Period
+from src.infra.converters import convert_points_to_json
 from src.project.containers import get_container
-from src.service_layer.services.diary import Diary
+from src.service_layer.services.diary import AsyncDiary, ImportReport, ImportRowError
 
 
-HeaderOwnerOid = Annotated[UUID4, Header(convert_underscores=False)]
+OwnerOid = Annotated[UUID, Depends(get_owner_oid)]
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+DEFAULT_PAGE_LIMIT = 30
+MAX_PAGE_LIMIT = 100
 router = APIRouter(
     tags=["Notes"],
     responses={
@@ -34,15 +51,16 @@ router = APIRouter(
         status.HTTP_201_CREATED: {"model": None},
     },
 )
-def add_note(
+async def add_note(
     schema: CreatePointsRequestSchema,
-    owner_oid: HeaderOwnerOid,
+    owner_oid: OwnerOid,
     container: Container = Depends(get_container),
+    unit_of_work: IAsyncUnitOfWork = Depends(get_unit_of_work),
 ) -> None:
-    diary: Diary = container.resolve(Diary)
+    diary: AsyncDiary = container.resolve(AsyncDiary, unit_of_work=unit_of_work)
 
     try:
-        diary.write(
+        await diary.write(
             owner_oid,
             schema.bedtime_date,
             schema.went_to_bed,
@@ -58,6 +76,214 @@ def add_note(
         )
 
 
+@router.get(
+    path="/",
+    name="Получить записи",
+    description=(
+        "Записи дневника сна от новых к старым страницами по limit записей. "
+        "Для следующей страницы передать next_cursor из ответа в cursor."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=NotesPageResponseSchema,
+    responses={
+        status.HTTP_200_OK: {"model": NotesPageResponseSchema},
+    },
+)
+async def get_notes(
+    owner_oid: OwnerOid,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)] = DEFAULT_PAGE_LIMIT,
+    cursor: date | None = None,
+    container: Container = Depends(get_container),
+    unit_of_work: IAsyncUnitOfWork = Depends(get_read_only_unit_of_work),
+) -> NotesPageResponseSchema:
+    diary: AsyncDiary = container.resolve(AsyncDiary, unit_of_work=unit_of_work)
+    page = await diary.get_notes_page(owner_oid, limit, cursor)
+    return NotesPageResponseSchema.model_validate(page, from_attributes=True)
+
+
+@router.post(
+    path="/import/",
+    name="Импортировать записи",
+    description=(
+        "Импорт истории дневника сна одним запросом. Тело запроса - NDJSON "
+        "(application/x-ndjson) или CSV с заголовком (text/csv) с полями записи. "
+        "Некорректные строки и строки с уже существующей датой не прерывают "
+        "импорт и возвращаются в списке ошибок."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=ImportNotesResponseSchema,
+    responses={
+        status.HTTP_200_OK: {"model": ImportNotesResponseSchema},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": None},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                media_type: {"schema": {"type": "string"}}
+                for media_type in ROWS_PARSERS
+            },
+        },
+    },
+)
+async def import_notes(
+    request: Request,
+    owner_oid: OwnerOid,
+    container: Container = Depends(get_container),
+    unit_of_work: IAsyncUnitOfWork = Depends(get_unit_of_work),
+) -> ImportReport:
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if (parse_rows := ROWS_PARSERS.get(media_type)) is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail={"error": f"Поддерживаемые форматы: {', '.join(ROWS_PARSERS)}."},
+        )
+
+    diary: AsyncDiary = container.resolve(AsyncDiary, unit_of_work=unit_of_work)
+    report = ImportReport()
+    batch, errors = [], []
+
+    async for line, row in parse_rows(iter_lines(request.stream())):
+        if isinstance(row, str):
+            errors.append(ImportRowError(line, row))
+            continue
+
+        batch.append((line, row.model_dump()))
+        if len(batch) == diary.IMPORT_BATCH_SIZE:
+            report.extend(await diary.import_notes(owner_oid, batch), errors)
+            batch, errors = [], []
+
+    report.extend(await diary.import_notes(owner_oid, batch), errors)
+    return report
+
+
+@router.get(
+    path="/export/",
+    name="Экспортировать записи",
+    description=(
+        "Все записи дневника сна в NDJSON по возрастанию bedtime_date, строки "
+        "в формате импорта. Записи читаются из БД и отправляются по мере "
+        "чтения, весь дневник в памяти не собирается."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {NDJSON_MEDIA_TYPE: {}}},
+    },
+)
+async def export_notes(
+    owner_oid: OwnerOid,
+    container: Container = Depends(get_container),
+) -> StreamingResponse:
+    async def lines() -> AsyncIterator[str]:
+        # Зависимости с yield закрываются до отправки тела ответа, поэтому
+        # единица работы открывается на время самой выгрузки.
+        async with container.resolve(IAsyncUnitOfWork) as unit_of_work:
+            diary: AsyncDiary = container.resolve(
+                AsyncDiary,
+                unit_of_work=unit_of_work,
+            )
+            async for note in diary.export_notes(owner_oid):
+                yield dumps(convert_points_to_json(note.points)) + "\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _get_statistics(
+    container: Container,
+    unit_of_work: IAsyncUnitOfWork,
+    owner_oid: UUID,
+    period: Period,
+    first_date: date,
+    last_date: date,
+) -> list[PeriodStatisticsResponseSchema]:
+    diary: AsyncDiary = container.resolve(AsyncDiary, unit_of_work=unit_of_work)
+
+    try:
+        statistics = await diary.get_statistics(
+            owner_oid,
+            period,
+            first_date,
+            last_date,
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": exception.message},
+        )
+    return [
+        PeriodStatisticsResponseSchema.model_validate(
+            period_statistics,
+            from_attributes=True,
+        )
+        for period_statistics in statistics
+    ]
+
+
+@router.get(
+    path="/statistics/weekly/",
+    name="Получить недельную статистику",
+    description=(
+        "Средние время сна, время в кровати и эффективность сна по ISO неделям, "
+        "пересекающимся с периодом [first_date, last_date]. Недели без записей "
+        "не возвращаются."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=list[PeriodStatisticsResponseSchema],
+    responses={
+        status.HTTP_200_OK: {"model": list[PeriodStatisticsResponseSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": None},
+    },
+)
+async def get_weekly_statistics(
+    first_date: date,
+    last_date: date,
+    owner_oid: OwnerOid,
+    container: Container = Depends(get_container),
+    unit_of_work: IAsyncUnitOfWork = Depends(get_read_only_unit_of_work),
+) -> list[PeriodStatisticsResponseSchema]:
+    return await _get_statistics(
+        container,
+        unit_of_work,
+        owner_oid,
+        Period.WEEK,
+        first_date,
+        last_date,
+    )
+
+
+@router.get(
+    path="/statistics/monthly/",
+    name="Получить месячную статистику",
+    description=(
+        "Средние время сна, время в кровати и эффективность сна по месяцам, "
+        "пересекающимся с периодом [first_date, last_date]. Месяцы без записей "
+        "не возвращаются."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=list[PeriodStatisticsResponseSchema],
+    responses={
+        status.HTTP_200_OK: {"model": list[PeriodStatisticsResponseSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": None},
+    },
+)
+async def get_monthly_statistics(
+    first_date: date,
+    last_date: date,
+    owner_oid: OwnerOid,
+    container: Container = Depends(get_container),
+    unit_of_work: IAsyncUnitOfWork = Depends(get_read_only_unit_of_work),
+) -> list[PeriodStatisticsResponseSchema]:
+    return await _get_statistics(
+        container,
+        unit_of_work,
+        owner_oid,
+        Period.MONTH,
+        first_date,
+        last_date,
+    )
+
+
 @router.get(
     path="/{note_oid}",
     name="Получить запись по oid",
@@ -71,7 +297,7 @@ def add_note(
 )
 def get_note_by_oid(
     note_oid: UUID4,
-    owner_oid: HeaderOwnerOid,
+    owner_oid: OwnerOid,
 ) -> NoteResponseSchema: ...
 
 
@@ -102,7 +328,7 @@ def get_note_by_oid(
 )
 def get_note_by_bedtime_date(
     bedtime_date: date,
-    owner_oid: HeaderOwnerOid,
+    owner_oid: OwnerOid,
 ) -> None: ...
 
 
@@ -133,7 +359,7 @@ def get_note_by_bedtime_date(
 )
 def update_note(
     note_oid: UUID4,
-    owner_oid: HeaderOwnerOid,
+    owner_oid: OwnerOid,
 ) -> None: ...
 
 
@@ -150,5 +376,5 @@ def update_note(
 )
 def delete_note(
     note_oid: UUID4,
-    owner_oid: HeaderOwnerOid,
+    owner_oid: OwnerOid,
 ) -> None: ...
@@ -0,0 +1,80 @@
+import csv
+
+from typing import AsyncIterator, Callable
+
+from pydantic import ValidationError
+
+from src.application.api.routers.notes.schemas import CreatePointsRequestSchema
+
+
+# Вместо строки не в UTF-8 - None, парсер сообщает о ней как об ошибке строки.
+Line = tuple[int, str | None]
+ParsedRow = tuple[int, CreatePointsRequestSchema | str]
+RowsParser = Callable[[AsyncIterator[Line]], AsyncIterator[ParsedRow]]
+UNDECODABLE_LINE_ERROR = "Строка не в кодировке UTF-8."
+
+
+def _decode(line: bytes) -> str | None:
+    try:
+        return line.decode().rstrip("\r")
+    except UnicodeDecodeError:
+        return None
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[Line]:
+    """Нумерованные строки тела запроса без накопления всего тела в памяти."""
+    line_number = 0
+    buffer = b""
+    async for chunk in stream:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, _decode(line)
+    if buffer:
+        yield line_number + 1, _decode(buffer)
+
+
+def _validation_error_message(exception: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+        for error in exception.errors()
+    )
+
+
+async def parse_ndjson_rows(lines: AsyncIterator[Line]) -> AsyncIterator[ParsedRow]:
+    async for line_number, line in lines:
+        if line is None:
+            yield line_number, UNDECODABLE_LINE_ERROR
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield line_number, CreatePointsRequestSchema.model_validate_json(line)
+        except ValidationError as exception:
+            yield line_number, _validation_error_message(exception)
+
+
+async def parse_csv_rows(lines: AsyncIterator[Line]) -> AsyncIterator[ParsedRow]:
+    header: list[str] | None = None
+    async for line_number, line in lines:
+        if line is None:
+            yield line_number, UNDECODABLE_LINE_ERROR
+            continue
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        try:
+            yield line_number, CreatePointsRequestSchema.model_validate(
+                dict(zip(header, values, strict=False)),
+            )
+        except ValidationError as exception:
+            yield line_number, _validation_error_message(exception)
+
+
+ROWS_PARSERS: dict[str, RowsParser] = {
+    "application/x-ndjson": parse_ndjson_rows,
+    "text/csv": parse_csv_rows,
+}
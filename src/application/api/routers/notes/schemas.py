@@ -1,6 +1,14 @@
 from datetime import date, datetime, time
+from typing import Annotated
 
-from pydantic import UUID4, BaseModel, Field
+from pydantic import UUID4, AfterValidator, BaseModel, Field
+
+
+# Репозитории отдают даты записей как в БД, в ответе - с точностью до секунды.
+Timestamp = Annotated[
+    datetime,
+    AfterValidator(lambda value: value.replace(microsecond=0, tzinfo=None)),
+]
 
 
 class CreatePointsRequestSchema(BaseModel):
@@ -31,9 +39,40 @@ class CreatePointsRequestSchema(BaseModel):
     )
 
 
+class ImportRowErrorSchema(BaseModel):
+    line: int = Field(title="Номер строки")
+    error: str = Field(title="Причина, по которой строка не импортирована")
+
+
+class ImportNotesResponseSchema(BaseModel):
+    imported: int = Field(title="Количество импортированных записей")
+    errors: list[ImportRowErrorSchema]
+
+
+class PeriodStatisticsResponseSchema(BaseModel):
+    period_start: date = Field(
+        title="Первый день периода",
+        description="Понедельник ISO недели или первое число месяца",
+    )
+    notes_count: int = Field(title="Количество записей за период")
+    average_sleep: time = Field(title="Среднее время сна")
+    average_in_bed: time = Field(title="Среднее время в кровати")
+    sleep_efficiency: float = Field(title="Эффективность сна за период")
+
+
 class NoteResponseSchema(BaseModel):
     oid: UUID4
-    created_at: datetime
-    updated_at: datetime
+    created_at: Timestamp
+    updated_at: Timestamp
     owner_oid: UUID4
     points: CreatePointsRequestSchema
+
+
+class NotesPageResponseSchema(BaseModel):
+    notes: list[NoteResponseSchema] = Field(title="Записи от новых к старым")
+    next_cursor: date | None = Field(
+        title="Курсор следующей страницы",
+        description=(
+            "Передать в cursor для следующей страницы, null - записей больше нет"
+        ),
+    )
@@ -4,13 +4,19 @@ from src.domain.exceptions.note import (
     NoteException,
     TimePointsSequenceException,
 )
+from src.domain.exceptions.read import (
+    InvalidDateRangeException,
+    NoteNotFoundException,
+)
 from src.domain.exceptions.write import NonUniqueNoteBedtimeDateException
 
 
 __all__ = [
     "ApplicationException",
+    "InvalidDateRangeException",
     "NonUniqueNoteBedtimeDateException",
     "NoteException",
+    "NoteNotFoundException",
     "TimePointsSequenceException",
     "NoSleepDurationException",
 ]
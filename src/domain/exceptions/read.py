@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import date
+from typing_extensions import Self
+
+from src.domain.exceptions.base import ApplicationException
+
+
+@dataclass(eq=False)
+class InvalidDateRangeException(ApplicationException):
+    first_date: date
+    last_date: date
+
+    @property
+    def message(self: Self) -> str:
+        return (
+            f"Начало периода {self.first_date} позже его окончания {self.last_date}."
+        )
+
+
+@dataclass(eq=False)
+class NoteNotFoundException(ApplicationException):
+    bedtime_date: date
+
+    @property
+    def message(self: Self) -> str:
+        return f"Запись о сне с датой {self.bedtime_date} не найдена в дневнике."
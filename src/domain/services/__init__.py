@@ -1,20 +1,42 @@
 from src.domain.services.base import (
+    IAsyncNotesRepository,
+    IAsyncRefreshTokensRepository,
+    IAsyncStatisticsRepository,
+    IAsyncUnitOfWork,
+    IAsyncUsersRepository,
     IDurations,
     INotesRepository,
+    IRefreshTokensRepository,
     IStatistics,
+    IStatisticsRepository,
+    IUnitOfWork,
     IUsersRepository,
 )
+from src.domain.services.batch import BatchStatistics, PointsColumns
 from src.domain.services.diary import DiaryService
 from src.domain.services.durations import Durations
+from src.domain.services.periods import Period, PeriodStatistics
 from src.domain.services.statistics_ import Statistics
 
 
 __all__ = (
+    "BatchStatistics",
+    "PointsColumns",
     "Durations",
     "DiaryService",
     "Statistics",
+    "Period",
+    "PeriodStatistics",
     "IDurations",
     "IStatistics",
     "IUsersRepository",
     "INotesRepository",
+    "IStatisticsRepository",
+    "IAsyncNotesRepository",
+    "IAsyncStatisticsRepository",
+    "IAsyncUsersRepository",
+    "IRefreshTokensRepository",
+    "IAsyncRefreshTokensRepository",
+    "IUnitOfWork",
+    "IAsyncUnitOfWork",
 )
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, time, timedelta
-from typing import TYPE_CHECKING
+from types import TracebackType
+from typing import TYPE_CHECKING, AsyncIterator, Generator, Iterable
 from typing_extensions import Self
 from uuid import UUID
 
 from src.domain.entities import NoteEntity, UserEntity
+from src.domain.services.periods import Period, PeriodStatistics
 
 
 if TYPE_CHECKING:
@@ -68,6 +70,20 @@ class INotesRepository(ABC):
     def add(self: Self, note: NoteEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def add_many(self: Self, notes: Iterable[NoteEntity]) -> set[NoteEntity]:
+        """Возвращает записи, которые не добавлены из-за совпадения bedtime_date."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self: Self, note: NoteEntity) -> NoteEntity | None:
+        """Заменяет точки записи с той же bedtime_date, возвращает прежнюю запись."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self: Self, owner_oid: UUID, bedtime_date: date) -> NoteEntity | None:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
         raise NotImplementedError
@@ -84,6 +100,146 @@ class INotesRepository(ABC):
     def get_all_notes(self: Self, owner_oid: UUID) -> set[NoteEntity]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_notes(
+        self: Self,
+        owner_oid: UUID,
+    ) -> Generator[NoteEntity, None, None]:
+        """
+        Все записи владельца по возрастанию bedtime_date. Записи читаются и
+        создаются по мере перебора, весь дневник в памяти не собирается.
+        close() прерванного перебора освобождает сессию.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_date_range(
+        self: Self,
+        owner_oid: UUID,
+        first_date: date,
+        last_date: date,
+    ) -> list[NoteEntity]:
+        """Записи с bedtime_date в [first_date, last_date] по возрастанию даты."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_latest(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        before: date | None = None,
+    ) -> list[NoteEntity]:
+        """
+        Не больше limit записей от новых к старым. before - keyset курсор:
+        только записи с bedtime_date раньше него.
+        """
+        raise NotImplementedError
+
+
+@dataclass
+class IStatisticsRepository(ABC):
+    """
+    Статистика по периодам, которую INotesRepository обновляет вместе с записями.
+    """
+
+    @abstractmethod
+    def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        """Периоды, пересекающиеся с [first_date, last_date], по возрастанию."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild(self: Self, owner_oid: UUID | None = None) -> int:
+        """Пересчет статистики по записям владельца (или всех), число периодов."""
+        raise NotImplementedError
+
+
+@dataclass
+class IAsyncNotesRepository(ABC):
+    """Асинхронный вариант INotesRepository с той же семантикой методов."""
+
+    @abstractmethod
+    async def add(self: Self, note: NoteEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_many(self: Self, notes: Iterable[NoteEntity]) -> set[NoteEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self: Self, note: NoteEntity) -> NoteEntity | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(
+        self: Self,
+        owner_oid: UUID,
+        bedtime_date: date,
+    ) -> NoteEntity | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_bedtime_date(
+        self: Self,
+        bedtime_date: date,
+        owner_oid: UUID,
+    ) -> NoteEntity | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all_notes(self: Self, owner_oid: UUID) -> set[NoteEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_notes(self: Self, owner_oid: UUID) -> AsyncIterator[NoteEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_date_range(
+        self: Self,
+        owner_oid: UUID,
+        first_date: date,
+        last_date: date,
+    ) -> list[NoteEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_latest(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        before: date | None = None,
+    ) -> list[NoteEntity]:
+        raise NotImplementedError
+
+
+@dataclass
+class IAsyncStatisticsRepository(ABC):
+    """Асинхронный вариант IStatisticsRepository."""
+
+    @abstractmethod
+    async def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rebuild(self: Self, owner_oid: UUID | None = None) -> int:
+        raise NotImplementedError
+
 
 @dataclass
 class IUsersRepository(ABC):
@@ -95,6 +251,181 @@ class IUsersRepository(ABC):
     def add_user(self: Self, user: UserEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        """
+        Атомарно добавляет пользователя, если имя свободно. False - имя уже
+        занято, в том числе параллельной регистрацией.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_password(self: Self, username: str, password: str) -> None:
+        """Заменяет хэш пароля, например при смене стоимости bcrypt."""
+        raise NotImplementedError
+
     @abstractmethod
     def delete_user(self: Self, username: str) -> None:
         raise NotImplementedError
+
+    def is_known_username(self: Self, username: str) -> bool:
+        """
+        True, если имя известно как занятое без запроса к БД, например из
+        кэша. False не означает, что имя свободно.
+        """
+        return False
+
+
+@dataclass
+class IAsyncUsersRepository(ABC):
+    """Асинхронный вариант IUsersRepository."""
+
+    @abstractmethod
+    async def get_by_username(self: Self, username: str) -> UserEntity | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_user(self: Self, user: UserEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_password(self: Self, username: str, password: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_user(self: Self, username: str) -> None:
+        raise NotImplementedError
+
+    def is_known_username(self: Self, username: str) -> bool:
+        """
+        True, если имя известно как занятое без запроса к БД, например из
+        кэша. False не означает, что имя свободно.
+        """
+        return False
+
+
+@dataclass
+class IRefreshTokensRepository(ABC):
+    """
+    Семейства refresh токенов: цепочка ротаций от одного входа, у семейства
+    один действующий jti до exp последнего выпущенного токена.
+    """
+
+    @abstractmethod
+    def add_family(
+        self: Self,
+        family_oid: UUID,
+        owner_oid: UUID,
+        jti: str,
+        exp: float,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rotate(
+        self: Self,
+        family_oid: UUID,
+        jti: str,
+        new_jti: str,
+        exp: float,
+    ) -> bool:
+        """
+        Атомарно заменяет действующий jti на new_jti. False - jti уже заменен
+        (повторное использование) или семейства нет.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_family(self: Self, family_oid: UUID) -> bool:
+        """False - семейства уже нет: завершено выходом или истекло."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_expired(self: Self, now: float) -> int:
+        raise NotImplementedError
+
+
+@dataclass
+class IAsyncRefreshTokensRepository(ABC):
+    """Асинхронный вариант IRefreshTokensRepository."""
+
+    @abstractmethod
+    async def add_family(
+        self: Self,
+        family_oid: UUID,
+        owner_oid: UUID,
+        jti: str,
+        exp: float,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rotate(
+        self: Self,
+        family_oid: UUID,
+        jti: str,
+        new_jti: str,
+        exp: float,
+    ) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_family(self: Self, family_oid: UUID) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_expired(self: Self, now: float) -> int:
+        raise NotImplementedError
+
+
+@dataclass
+class IUnitOfWork(ABC):
+    """
+    Репозитории с общей сессией и транзакцией на время блока with: при выходе
+    без исключения изменения фиксируются, иначе откатываются.
+    """
+
+    notes: INotesRepository = field(init=False)
+    statistics: IStatisticsRepository = field(init=False)
+    users: IUsersRepository = field(init=False)
+    refresh_tokens: IRefreshTokensRepository = field(init=False)
+
+    @abstractmethod
+    def __enter__(self: Self) -> Self:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        raise NotImplementedError
+
+
+@dataclass
+class IAsyncUnitOfWork(ABC):
+    """Асинхронный вариант IUnitOfWork."""
+
+    notes: IAsyncNotesRepository = field(init=False)
+    statistics: IAsyncStatisticsRepository = field(init=False)
+    users: IAsyncUsersRepository = field(init=False)
+    refresh_tokens: IAsyncRefreshTokensRepository = field(init=False)
+
+    @abstractmethod
+    async def __aenter__(self: Self) -> Self:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def __aexit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        raise NotImplementedError
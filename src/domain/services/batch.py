@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from datetime import time
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable
+from typing_extensions import Self
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+
+if TYPE_CHECKING:
+    from src.domain.values.points import Points
+
+
+MINUTES_IN_DAY = 24 * 60
+
+Minutes = NDArray[np.int16]
+
+
+def point_to_minutes(point: time) -> int:
+    return point.hour * 60 + point.minute
+
+
+def minutes_to_point(minutes: int) -> time:
+    return time(*divmod(minutes, 60))
+
+
+def round_efficiency(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Векторный round(value, 2) с результатом, совпадающим с builtins.round.
+    np.round умножает на 100 с округлением и ошибается на границах вида 0.025,
+    поэтому ошибка умножения вычисляется точно (Dekker two-product).
+    """
+    scale = 100.0
+    scaled = values * scale
+    splitter = 2.0**27 + 1
+    high = splitter * values - (splitter * values - values)
+    low = values - high
+    error = (high * scale - scaled) + low * scale
+
+    floor = np.floor(scaled)
+    above_half = (scaled - floor - 0.5) + error
+    is_odd_floor = np.mod(floor, 2) == 1
+    rounded = floor + ((above_half > 0) | ((above_half == 0) & is_odd_floor))
+    return rounded / scale
+
+
+@dataclass(frozen=True)
+class PointsColumns:
+    """Временные точки N записей - массивы минут от полуночи."""
+
+    went_to_bed: Minutes
+    fell_asleep: Minutes
+    woke_up: Minutes
+    got_up: Minutes
+    no_sleep: Minutes
+
+    @classmethod
+    def from_points(
+        cls: type["PointsColumns"],
+        points: Iterable["Points"],
+    ) -> "PointsColumns":
+        rows = np.array(
+            [
+                (
+                    note_points.went_to_bed_minutes,
+                    note_points.fell_asleep_minutes,
+                    note_points.woke_up_minutes,
+                    note_points.got_up_minutes,
+                    note_points.no_sleep_minutes,
+                )
+                for note_points in points
+            ],
+            dtype=np.int16,
+        ).reshape(-1, 5)
+        return cls(*rows.T)
+
+    def __len__(self: Self) -> int:
+        return len(self.went_to_bed)
+
+
+@dataclass(frozen=True)
+class BatchStatistics:
+    """
+    Durations и Statistics для всех записей сразу. Длительности - в минутах,
+    переход через полночь считается так же, как в Durations.
+    """
+
+    columns: PointsColumns
+
+    @staticmethod
+    def _duration(first_point: Minutes, second_point: Minutes) -> Minutes:
+        return np.mod(first_point - second_point, MINUTES_IN_DAY)
+
+    @cached_property
+    def sleep(self: Self) -> Minutes:
+        return self._duration(self.columns.woke_up, self.columns.fell_asleep)
+
+    @cached_property
+    def in_bed(self: Self) -> Minutes:
+        return self._duration(self.columns.got_up, self.columns.went_to_bed)
+
+    @property
+    def without_sleep(self: Self) -> Minutes:
+        return self.columns.no_sleep
+
+    @cached_property
+    def sleep_minus_no_sleep(self: Self) -> Minutes:
+        return np.maximum(self.sleep - self.without_sleep, 0)
+
+    @cached_property
+    def sleep_efficiency(self: Self) -> NDArray[np.float64]:
+        in_bed = self.in_bed
+        efficiency = np.divide(
+            self.sleep_minus_no_sleep,
+            in_bed,
+            out=np.zeros(len(self.columns), dtype=np.float64),
+            where=in_bed != 0,
+        )
+        return round_efficiency(efficiency)
@@ -1,69 +1,43 @@
 from dataclasses import dataclass
-from datetime import time, timedelta
-from operator import ge, sub
+from datetime import timedelta
 from typing_extensions import Self
 
 from src.domain.services import IDurations
+from src.domain.services.batch import MINUTES_IN_DAY
 
 
 @dataclass
 class Durations(IDurations):
+    """Длительности по минутам точек, переход через полночь - по модулю суток."""
+
     @property
     def sleep(self: Self) -> timedelta:
-        return self._get_duration(self.points.woke_up, self.points.fell_asleep)
+        return timedelta(minutes=self.sleep_minutes)
 
     @property
     def in_bed(self: Self) -> timedelta:
-        return self._get_duration(self.points.got_up, self.points.went_to_bed)
+        return timedelta(minutes=self.in_bed_minutes)
 
     @property
     def without_sleep(self: Self) -> timedelta:
-        return self._get_duration(self.points.no_sleep)
+        return timedelta(minutes=self.points.no_sleep_minutes)
 
     @property
     def sleep_minus_without_sleep(self: Self) -> timedelta:
-        return self._get_sub_of_durations(self.sleep, self.without_sleep)
-
-    @staticmethod
-    def _point_time_to_duration(point: time) -> timedelta:
-        return timedelta(hours=point.hour, minutes=point.minute)
-
-    @staticmethod
-    def _get_duration_seconds_only(duration: timedelta) -> timedelta:
-        return timedelta(seconds=duration.seconds)
+        return timedelta(minutes=self.sleep_minus_without_sleep_minutes)
 
-    def _get_duration_between_two_points(
-        self: Self,
-        first_point: time,
-        second_point: time,
-    ) -> timedelta:
-        duration = timedelta(
-            hours=sub(first_point.hour, second_point.hour),
-            minutes=sub(first_point.minute, second_point.minute),
-        )
-        return self._get_duration_seconds_only(duration)
+    @property
+    def sleep_minutes(self: Self) -> int:
+        return (
+            self.points.woke_up_minutes - self.points.fell_asleep_minutes
+        ) % MINUTES_IN_DAY
 
-    def _get_duration(
-        self: Self,
-        first_point: time,
-        second_point: time | None = None,
-    ) -> timedelta:
-        if second_point is not None:
-            duration = self._get_duration_between_two_points(
-                first_point,
-                second_point,
-            )
-        else:
-            duration = self._point_time_to_duration(first_point)
-        return self._get_duration_seconds_only(duration)
+    @property
+    def in_bed_minutes(self: Self) -> int:
+        return (
+            self.points.got_up_minutes - self.points.went_to_bed_minutes
+        ) % MINUTES_IN_DAY
 
-    def _get_sub_of_durations(
-        self: Self,
-        first_duration: timedelta,
-        second_duration: timedelta,
-    ) -> timedelta:
-        if ge(second_duration, first_duration):
-            duration = self._get_duration_seconds_only(timedelta())
-        else:
-            duration = sub(first_duration, second_duration)
-        return self._get_duration_seconds_only(duration)
+    @property
+    def sleep_minus_without_sleep_minutes(self: Self) -> int:
+        return max(self.sleep_minutes - self.points.no_sleep_minutes, 0)
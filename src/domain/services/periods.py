@@ -0,0 +1,110 @@
+from dataclasses import dataclass, replace
+from datetime import date, time, timedelta
+from enum import StrEnum
+from itertools import groupby
+from typing import Iterable
+from typing_extensions import Self
+
+from src.domain.entities import NoteEntity
+from src.domain.services.batch import BatchStatistics, PointsColumns
+
+
+class Period(StrEnum):
+    WEEK = "week"
+    MONTH = "month"
+
+    def start_of(self: Self, bedtime_date: date) -> date:
+        """Первый день периода (понедельник ISO недели или 1 число месяца)."""
+        if self is Period.WEEK:
+            return bedtime_date - timedelta(days=bedtime_date.weekday())
+        return bedtime_date.replace(day=1)
+
+
+@dataclass(frozen=True)
+class PeriodStatistics:
+    """
+    Суммарные длительности записей одного периода в минутах.
+    Эффективность периода - отношение суммарного сна без учета времени без сна
+    к суммарному времени в кровати.
+    """
+
+    period_start: date
+    notes_count: int
+    sleep: int
+    in_bed: int
+    no_sleep: int
+    sleep_minus_no_sleep: int
+
+    @property
+    def average_sleep(self: Self) -> time:
+        return self._average(self.sleep)
+
+    @property
+    def average_in_bed(self: Self) -> time:
+        return self._average(self.in_bed)
+
+    @property
+    def sleep_efficiency(self: Self) -> float:
+        if self.in_bed == 0:
+            return 0.0
+        return round(self.sleep_minus_no_sleep / self.in_bed, 2)
+
+    def __add__(self: Self, other: object) -> Self:
+        if not isinstance(other, PeriodStatistics):
+            return NotImplemented
+        return replace(
+            self,
+            notes_count=self.notes_count + other.notes_count,
+            sleep=self.sleep + other.sleep,
+            in_bed=self.in_bed + other.in_bed,
+            no_sleep=self.no_sleep + other.no_sleep,
+            sleep_minus_no_sleep=self.sleep_minus_no_sleep
+            + other.sleep_minus_no_sleep,
+        )
+
+    def __neg__(self: Self) -> Self:
+        return replace(
+            self,
+            notes_count=-self.notes_count,
+            sleep=-self.sleep,
+            in_bed=-self.in_bed,
+            no_sleep=-self.no_sleep,
+            sleep_minus_no_sleep=-self.sleep_minus_no_sleep,
+        )
+
+    def _average(self: Self, total: int) -> time:
+        minutes = round(total / self.notes_count)
+        return time(hour=minutes // 60, minute=minutes % 60)
+
+    @classmethod
+    def from_notes(
+        cls: type["PeriodStatistics"],
+        notes: Iterable[NoteEntity],
+        period: Period,
+    ) -> list["PeriodStatistics"]:
+        """Статистика записей одного владельца по периодам, по возрастанию даты."""
+        notes = sorted(notes, key=lambda note: note.points.bedtime_date)
+        statistics = BatchStatistics(
+            PointsColumns.from_points(note.points for note in notes),
+        )
+        periods = []
+        start = 0
+        for period_start, period_notes in groupby(
+            notes,
+            key=lambda note: period.start_of(note.points.bedtime_date),
+        ):
+            end = start + len(list(period_notes))
+            periods.append(
+                cls(
+                    period_start=period_start,
+                    notes_count=end - start,
+                    sleep=int(statistics.sleep[start:end].sum()),
+                    in_bed=int(statistics.in_bed[start:end].sum()),
+                    no_sleep=int(statistics.without_sleep[start:end].sum()),
+                    sleep_minus_no_sleep=int(
+                        statistics.sleep_minus_no_sleep[start:end].sum(),
+                    ),
+                ),
+            )
+            start = end
+        return periods
@@ -1,3 +1,8 @@
+from src.domain.specifications.cyclic_order import (
+    find_invalid_points,
+    no_sleep_fits_sleep,
+    points_in_cyclic_order,
+)
 from src.domain.specifications.no_sleep_duration import NoSleepHasValidTime
 from src.domain.specifications.sequences import (
     FellAsleepPointFirstInOrder,
@@ -17,4 +22,7 @@ __all__ = [
     "FellAsleepPointFirstInOrder",
     "PointsHasValidAnyAllowedSortedSequences",
     "UserCredentialsSpecification",
+    "points_in_cyclic_order",
+    "no_sleep_fits_sleep",
+    "find_invalid_points",
 ]
@@ -0,0 +1,73 @@
+from typing import TypeVar
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from src.domain.exceptions import (
+    NoSleepDurationException,
+    NoteException,
+    TimePointsSequenceException,
+)
+from src.domain.services.batch import MINUTES_IN_DAY, Minutes, PointsColumns
+
+
+# Проверки работают и с минутами одной записи (int), и с массивами минут
+# PointsColumns: результат - bool или массив bool.
+MinutesT = TypeVar("MinutesT", int, Minutes)
+
+
+def points_in_cyclic_order(
+    went_to_bed: MinutesT,
+    fell_asleep: MinutesT,
+    woke_up: MinutesT,
+    got_up: MinutesT,
+) -> bool | NDArray[np.bool_]:
+    """
+    True если точки идут по кругу суток: в замкнутой последовательности
+    went_to_bed, fell_asleep, woke_up, got_up не больше одного убывания.
+    Равносильно PointsHasValidAnyAllowedSortedSequences за один проход.
+    """
+    descents = sum(
+        (
+            went_to_bed > fell_asleep,
+            fell_asleep > woke_up,
+            woke_up > got_up,
+            got_up > went_to_bed,
+        ),
+    )
+    return descents <= 1
+
+
+def no_sleep_fits_sleep(
+    fell_asleep: MinutesT,
+    woke_up: MinutesT,
+    no_sleep: MinutesT,
+) -> bool | NDArray[np.bool_]:
+    """Равносильно NoSleepHasValidTime: время без сна не больше времени сна."""
+    return no_sleep <= (woke_up - fell_asleep) % MINUTES_IN_DAY
+
+
+def find_invalid_points(
+    columns: PointsColumns,
+) -> list[type[NoteException] | None]:
+    """
+    Проверка Points.validate для всех записей сразу: исключение, которое
+    вызвал бы Points для записи, или None для корректной.
+    """
+    no_sleep_fits = no_sleep_fits_sleep(
+        columns.fell_asleep,
+        columns.woke_up,
+        columns.no_sleep,
+    )
+    in_cyclic_order = points_in_cyclic_order(
+        columns.went_to_bed,
+        columns.fell_asleep,
+        columns.woke_up,
+        columns.got_up,
+    )
+    # Порядок как в Points.validate: время без сна проверяется первым.
+    exceptions = np.full(len(columns.went_to_bed), None, dtype=object)
+    exceptions[~in_cyclic_order] = TimePointsSequenceException
+    exceptions[~no_sleep_fits] = NoSleepDurationException
+    return exceptions.tolist()
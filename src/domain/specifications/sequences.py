@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import time
 from typing import TYPE_CHECKING
 from typing_extensions import Self
 
@@ -21,12 +20,12 @@ class PointsSpecification(BaseSpecification, ABC):
 @dataclass
 class PointsSequenceIsSortedAsc(PointsSpecification, ABC):
     """
-    True если каждая временная точка из последовательности меньше или равна
-    следующей.
+    True если каждая временная точка из последовательности (минуты от полуночи)
+    меньше или равна следующей.
     """
 
     @abstractmethod
-    def _sequence_of_points(self: Self) -> tuple[time, time, time, time]:
+    def _sequence_of_points(self: Self) -> tuple[int, int, int, int]:
         raise NotImplementedError
 
     def _is_sorted(self: Self) -> bool:
@@ -38,45 +37,45 @@ class PointsSequenceIsSortedAsc(PointsSpecification, ABC):
 
 @dataclass
 class WentToBedPointFirstInOrder(PointsSequenceIsSortedAsc):
-    def _sequence_of_points(self: Self) -> tuple[time, time, time, time]:
+    def _sequence_of_points(self: Self) -> tuple[int, int, int, int]:
         return (
-            self._points.went_to_bed,
-            self._points.fell_asleep,
-            self._points.woke_up,
-            self._points.got_up,
+            self._points.went_to_bed_minutes,
+            self._points.fell_asleep_minutes,
+            self._points.woke_up_minutes,
+            self._points.got_up_minutes,
         )
 
 
 @dataclass
 class FellAsleepPointFirstInOrder(PointsSequenceIsSortedAsc):
-    def _sequence_of_points(self: Self) -> tuple[time, time, time, time]:
+    def _sequence_of_points(self: Self) -> tuple[int, int, int, int]:
         return (
-            self._points.fell_asleep,
-            self._points.woke_up,
-            self._points.got_up,
-            self._points.went_to_bed,
+            self._points.fell_asleep_minutes,
+            self._points.woke_up_minutes,
+            self._points.got_up_minutes,
+            self._points.went_to_bed_minutes,
         )
 
 
 @dataclass
 class WokUpPointFirstInOrder(PointsSequenceIsSortedAsc):
-    def _sequence_of_points(self: Self) -> tuple[time, time, time, time]:
+    def _sequence_of_points(self: Self) -> tuple[int, int, int, int]:
         return (
-            self._points.woke_up,
-            self._points.got_up,
-            self._points.went_to_bed,
-            self._points.fell_asleep,
+            self._points.woke_up_minutes,
+            self._points.got_up_minutes,
+            self._points.went_to_bed_minutes,
+            self._points.fell_asleep_minutes,
         )
 
 
 @dataclass
 class GotUpPointFirstInOrder(PointsSequenceIsSortedAsc):
-    def _sequence_of_points(self: Self) -> tuple[time, time, time, time]:
+    def _sequence_of_points(self: Self) -> tuple[int, int, int, int]:
         return (
-            self._points.got_up,
-            self._points.went_to_bed,
-            self._points.fell_asleep,
-            self._points.woke_up,
+            self._points.got_up_minutes,
+            self._points.went_to_bed_minutes,
+            self._points.fell_asleep_minutes,
+            self._points.woke_up_minutes,
         )
 
 
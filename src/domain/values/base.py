@@ -1,13 +1,28 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Any
 from typing_extensions import Self
 
 
 @dataclass(frozen=True)
 class BaseValueObject(ABC):
+    __slots__ = ()
+
     def __post_init__(self: Self) -> None:
         self.validate()
 
+    @classmethod
+    def trusted(cls: type[Self], *args: Any) -> Self:
+        """
+        Создание из значений всех полей без validate: для значений, уже
+        проверенных раньше, например строк из БД.
+        """
+        obj = object.__new__(cls)
+        names: tuple[str, ...] = cls.__match_args__
+        for name, value in zip(names, args, strict=True):
+            object.__setattr__(obj, name, value)
+        return obj
+
     @abstractmethod
     def validate(self: Self) -> None:
         raise NotImplementedError
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date, time
 from typing_extensions import Self
 
@@ -6,26 +6,76 @@ from src.domain.exceptions import (
     NoSleepDurationException,
     TimePointsSequenceException,
 )
-from src.domain.services import Durations
-from src.domain.specifications import (
-    NoSleepHasValidTime,
-    PointsHasValidAnyAllowedSortedSequences,
-)
+from src.domain.services.batch import minutes_to_point, point_to_minutes
+from src.domain.specifications import no_sleep_fits_sleep, points_in_cyclic_order
 from src.domain.values.base import BaseValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class Points(BaseValueObject):
+    """
+    Временные точки записи хранятся минутами от полуночи в слотах объекта.
+    Создаются и читаются как datetime.time, секунды отбрасываются.
+    """
+
     bedtime_date: date
-    went_to_bed: time
-    fell_asleep: time
-    woke_up: time
-    got_up: time
-    no_sleep: time = field(default=time())
+    went_to_bed_minutes: int
+    fell_asleep_minutes: int
+    woke_up_minutes: int
+    got_up_minutes: int
+    no_sleep_minutes: int
+
+    def __init__(
+        self: Self,
+        bedtime_date: date,
+        went_to_bed: time,
+        fell_asleep: time,
+        woke_up: time,
+        got_up: time,
+        no_sleep: time | None = None,
+    ) -> None:
+        if no_sleep is None:
+            no_sleep = time()
+        minutes = map(
+            point_to_minutes,
+            (went_to_bed, fell_asleep, woke_up, got_up, no_sleep),
+        )
+        for name, value in zip(self.__match_args__, (bedtime_date, *minutes)):
+            object.__setattr__(self, name, value)
+        self.__post_init__()
+
+    @property
+    def went_to_bed(self: Self) -> time:
+        return minutes_to_point(self.went_to_bed_minutes)
+
+    @property
+    def fell_asleep(self: Self) -> time:
+        return minutes_to_point(self.fell_asleep_minutes)
+
+    @property
+    def woke_up(self: Self) -> time:
+        return minutes_to_point(self.woke_up_minutes)
+
+    @property
+    def got_up(self: Self) -> time:
+        return minutes_to_point(self.got_up_minutes)
+
+    @property
+    def no_sleep(self: Self) -> time:
+        return minutes_to_point(self.no_sleep_minutes)
 
     def validate(self: Self) -> None:
-        if not NoSleepHasValidTime(Durations(self)):
+        if not no_sleep_fits_sleep(
+            self.fell_asleep_minutes,
+            self.woke_up_minutes,
+            self.no_sleep_minutes,
+        ):
             raise NoSleepDurationException
 
-        if not PointsHasValidAnyAllowedSortedSequences(self):
+        if not points_in_cyclic_order(
+            self.went_to_bed_minutes,
+            self.fell_asleep_minutes,
+            self.woke_up_minutes,
+            self.got_up_minutes,
+        ):
             raise TimePointsSequenceException
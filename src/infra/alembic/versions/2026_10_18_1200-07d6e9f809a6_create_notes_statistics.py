@@ -0,0 +1,68 @@
+"""Create notes_statistics
+
+Revision ID: 07d6e9f809a6
+Revises: 004e88a730b0
+Create Date: 2026-10-18 12:00:00.000000
+
+После применения заполнить таблицу по существующим записям:
+python -m src.project.commands rebuild-statistics
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "07d6e9f809a6"
+down_revision: str | None = "004e88a730b0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notes_statistics",
+        sa.Column("owner_oid", sa.Uuid(), nullable=False),
+        sa.Column("period", sa.String(length=8), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("notes_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "sleep",
+            sa.Integer(),
+            nullable=False,
+            comment="Сумма времени сна, минуты",
+        ),
+        sa.Column(
+            "in_bed",
+            sa.Integer(),
+            nullable=False,
+            comment="Сумма времени в кровати, минуты",
+        ),
+        sa.Column(
+            "no_sleep",
+            sa.Integer(),
+            nullable=False,
+            comment="Сумма времени без сна, минуты",
+        ),
+        sa.Column(
+            "sleep_minus_no_sleep",
+            sa.Integer(),
+            nullable=False,
+            comment="Сумма времени сна без учета времени без сна, минуты",
+        ),
+        sa.ForeignKeyConstraint(["owner_oid"], ["users.oid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "owner_oid",
+            "period",
+            "period_start",
+            name="unique_period_for_user",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notes_statistics")
@@ -0,0 +1,31 @@
+"""Create notes owner_oid, bedtime_date index
+
+Revision ID: 0328710b093a
+Revises: 07d6e9f809a6
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0328710b093a"
+down_revision: str | None = "07d6e9f809a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notes_owner_oid_bedtime_date",
+        "notes",
+        ["owner_oid", "bedtime_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notes_owner_oid_bedtime_date", table_name="notes")
@@ -0,0 +1,52 @@
+"""Store notes time points as minutes
+
+Revision ID: 8d3c8a6c17ac
+Revises: 0328710b093a
+Create Date: 2026-10-18 14:00:00.000000
+
+Временные точки записей - минуты от полуночи в smallint вместо time,
+секунды отбрасываются.
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3c8a6c17ac"
+down_revision: str | None = "0328710b093a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIME_POINTS = ("went_to_bed", "fell_asleep", "woke_up", "got_up", "no_sleep")
+
+
+def upgrade() -> None:
+    for column in TIME_POINTS:
+        op.alter_column(
+            "notes",
+            column,
+            existing_type=sa.Time(),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using=(
+                f"(extract(hour from {column}) * 60 "
+                f"+ extract(minute from {column}))::smallint"
+            ),
+        )
+
+
+def downgrade() -> None:
+    for column in TIME_POINTS:
+        op.alter_column(
+            "notes",
+            column,
+            existing_type=sa.SmallInteger(),
+            type_=sa.Time(),
+            existing_nullable=False,
+            postgresql_using=f"make_time({column} / 60, mod({column}, 60), 0)",
+        )
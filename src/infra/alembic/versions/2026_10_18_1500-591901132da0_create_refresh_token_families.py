@@ -0,0 +1,73 @@
+"""Create refresh_token_families
+
+Revision ID: 591901132da0
+Revises: 8d3c8a6c17ac
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "591901132da0"
+down_revision: str | None = "8d3c8a6c17ac"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_token_families",
+        sa.Column("oid", sa.Uuid(), nullable=False),
+        sa.Column("owner_oid", sa.Uuid(), nullable=False),
+        sa.Column(
+            "jti",
+            sa.String(length=36),
+            nullable=False,
+            comment="jti действующего refresh токена",
+        ),
+        sa.Column(
+            "exp",
+            sa.Float(),
+            nullable=False,
+            comment="exp действующего refresh токена, Unix время",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Дата создания записи",
+        ),
+        sa.ForeignKeyConstraint(["owner_oid"], ["users.oid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("oid"),
+    )
+    op.create_index(
+        op.f("ix_refresh_token_families_exp"),
+        "refresh_token_families",
+        ["exp"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_refresh_token_families_owner_oid"),
+        "refresh_token_families",
+        ["owner_oid"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_refresh_token_families_owner_oid"),
+        table_name="refresh_token_families",
+    )
+    op.drop_index(
+        op.f("ix_refresh_token_families_exp"),
+        table_name="refresh_token_families",
+    )
+    op.drop_table("refresh_token_families")
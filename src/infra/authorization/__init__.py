@@ -1,16 +1,38 @@
-from src.infra.authorization.base import IUserTokenService
+from src.infra.authorization.base import IUserTokenService, Principal, TokenPair
+from src.infra.authorization.cache import VerifiedTokensCache
 from src.infra.authorization.exceptions import (
     JWTAuthorizationException,
     JWTExpireAtFieldException,
+    JWTKeyException,
+    JWTRevokedException,
     JWTTypeException,
+    RefreshTokenReuseException,
+    RefreshTokenRevokedException,
 )
 from src.infra.authorization.jwt import TokenType, UserJWTService
+from src.infra.authorization.keys import JWTKey
+from src.infra.authorization.refresh import AsyncRefreshTokenRotation
+from src.infra.authorization.revocation import (
+    IRevokedTokensStore,
+    MemoryRevokedTokensStore,
+)
 
 
 __all__ = (
     "IUserTokenService",
+    "Principal",
+    "TokenPair",
+    "AsyncRefreshTokenRotation",
+    "RefreshTokenReuseException",
+    "RefreshTokenRevokedException",
+    "VerifiedTokensCache",
     "JWTTypeException",
     "JWTExpireAtFieldException",
+    "JWTKeyException",
+    "JWTRevokedException",
+    "IRevokedTokensStore",
+    "MemoryRevokedTokensStore",
+    "JWTKey",
     "JWTAuthorizationException",
     "TokenType",
     "UserJWTService",
@@ -2,8 +2,10 @@ from abc import ABC, abstractmethod
 from dataclasses import InitVar, dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
+from functools import cached_property
+from typing import Any
 from typing_extensions import Self
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from src.domain.entities import UserEntity
 from src.infra.authorization.exceptions import JWTExpireAtFieldException
@@ -27,6 +29,14 @@ class AccessToken(BearerToken):
 @dataclass
 class RefreshToken(BearerToken):
     refresh_token: str
+    jti: str = field(repr=False)
+    exp: float = field(repr=False)
+
+
+@dataclass
+class TokenPair(BearerToken):
+    access_token: str
+    refresh_token: str
 
 
 @dataclass
@@ -53,7 +63,7 @@ class JWTPayload(IPayload):
             raise JWTExpireAtFieldException
 
         if expire_timedelta is not None:
-            self.exp = self.iat + expire_timedelta.seconds
+            self.exp = self.iat + expire_timedelta.total_seconds()
 
     def convert_to_dict(self: Self) -> dict:
         return {
@@ -68,35 +78,84 @@ class JWTPayload(IPayload):
 class UserJWTPayload(JWTPayload, IPayload):
     sub: str
     username: str
+    # Семейство ротаций refresh токена, в claims - "fam".
+    family: str | None = None
+
+    @classmethod
+    def from_dict(
+        cls: type["UserJWTPayload"],
+        claims: dict[str, Any],
+    ) -> "UserJWTPayload":
+        return cls(
+            sub=claims["sub"],
+            username=claims["username"],
+            token_type=TokenType(claims["type"]),
+            iat=claims["iat"],
+            exp=claims["exp"],
+            jti=claims["jti"],
+            family=claims.get("fam"),
+        )
 
     def convert_to_dict(self: Self) -> dict:
-        return {
+        claims = {
             "sub": self.sub,
             "username": self.username,
             **super().convert_to_dict(),
         }
+        if self.family is not None:
+            claims["fam"] = self.family
+        return claims
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Пользователь запроса по проверенному токену, создается раз на запрос."""
+
+    payload: UserJWTPayload
+
+    @cached_property
+    def user_oid(self: Self) -> UUID:
+        return UUID(self.payload.sub)
+
+    @property
+    def username(self: Self) -> str:
+        return self.payload.username
 
 
 @dataclass
 class IUserTokenService(ABC):
 
     @abstractmethod
-    def create_access(self: Self, user: UserEntity) -> AccessToken:
+    def create_access(
+        self: Self,
+        user: UserEntity | Principal,
+        family_oid: UUID | None = None,
+    ) -> AccessToken:
+        """family_oid - семейство refresh токена, выпущенного вместе с этим."""
         raise NotImplementedError
 
     @abstractmethod
-    def create_refresh(self: Self, user: UserEntity) -> RefreshToken:
-        raise NotImplementedError
-
-    @property
-    @abstractmethod
-    def payload(self: Self) -> UserJWTPayload:
+    def create_refresh(
+        self: Self,
+        user: UserEntity | Principal,
+        family_oid: UUID | None = None,
+    ) -> RefreshToken:
+        """family_oid - семейство ротаций, в которое входит токен."""
         raise NotImplementedError
 
     @abstractmethod
-    def validate_token_type(self: Self, token_type: TokenType) -> None:
+    def authenticate(
+        self: Self,
+        token: str,
+        token_type: TokenType = TokenType.ACCESS,
+    ) -> Principal:
+        """
+        Пользователь по токену ожидаемого типа. Подпись проверяется один раз
+        на токен, повторные обращения берут payload из кэша до его exp.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    def deauthorize(self: Self) -> None:
+    def deauthorize(self: Self, principal: Principal) -> None:
+        """Отзывает токен пользователя до его exp."""
         raise NotImplementedError
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from hashlib import sha256
+from heapq import heapify, heappop, heappush
+from threading import Lock
+from typing_extensions import Self
+
+from src.infra.authorization.base import UserJWTPayload
+
+
+@dataclass
+class VerifiedTokensCache:
+    """
+    LRU payload'ов токенов с уже проверенной подписью. Ключ - sha256 токена,
+    запись удаляется при наступлении exp или как самая давняя при переполнении.
+    """
+
+    max_size: int = 10_000
+    _payloads: OrderedDict[bytes, UserJWTPayload] = field(
+        default_factory=OrderedDict,
+    )
+    _expirations: list[tuple[float, bytes]] = field(default_factory=list)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return sha256(token.encode()).digest()
+
+    @staticmethod
+    def _now() -> float:
+        return datetime.now(UTC).timestamp()
+
+    def __len__(self: Self) -> int:
+        return len(self._payloads)
+
+    def get(self: Self, token: str) -> UserJWTPayload | None:
+        key = self._digest(token)
+        with self._lock:
+            self._evict_expired()
+            payload = self._payloads.get(key)
+            if payload is not None:
+                self._payloads.move_to_end(key)
+            return payload
+
+    def put(self: Self, token: str, payload: UserJWTPayload) -> None:
+        if self.max_size <= 0 or payload.exp is None:
+            return
+
+        key = self._digest(token)
+        with self._lock:
+            self._payloads[key] = payload
+            self._payloads.move_to_end(key)
+            heappush(self._expirations, (payload.exp, key))
+            self._evict_expired()
+            while len(self._payloads) > self.max_size:
+                self._payloads.popitem(last=False)
+            if len(self._expirations) > 2 * self.max_size:
+                self._rebuild_expirations()
+
+    def _evict_expired(self: Self) -> None:
+        now = self._now()
+        while self._expirations and self._expirations[0][0] <= now:
+            exp, key = heappop(self._expirations)
+            payload = self._payloads.get(key)
+            if payload is not None and payload.exp == exp:
+                del self._payloads[key]
+
+    def _rebuild_expirations(self: Self) -> None:
+        """Куча без записей, уже вытесненных из LRU или перезаписанных."""
+        self._expirations = [
+            (payload.exp, key)
+            for key, payload in self._payloads.items()
+            if payload.exp is not None
+        ]
+        heapify(self._expirations)
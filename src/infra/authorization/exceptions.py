@@ -27,6 +27,36 @@ class JWTTypeException(JWTAuthorizationException):
         )
 
 
+@dataclass(eq=False)
+class JWTRevokedException(JWTAuthorizationException):
+    @property
+    def message(self: Self) -> str:
+        return "Токен отозван."
+
+
+@dataclass(eq=False)
+class RefreshTokenRevokedException(JWTAuthorizationException):
+    @property
+    def message(self: Self) -> str:
+        return "Refresh токен отозван или истек."
+
+
+@dataclass(eq=False)
+class RefreshTokenReuseException(JWTAuthorizationException):
+    @property
+    def message(self: Self) -> str:
+        return "Refresh токен уже использован, вход по нему отозван."
+
+
+@dataclass(eq=False)
+class JWTKeyException(Exception):
+    algorithm: str
+
+    @property
+    def message(self: Self) -> str:
+        return f"Ключ JWT не подходит для алгоритма {self.algorithm!r}."
+
+
 @dataclass(eq=False)
 class JWTExpireAtFieldException(Exception):
     @property
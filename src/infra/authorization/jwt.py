@@ -1,108 +1,147 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing_extensions import Self
 from uuid import UUID
 
-from fastapi import Depends, Header
-from fastapi.security import (
-    OAuth2PasswordBearer,
-)
-from jwt import DecodeError, decode, encode
+from jwt import InvalidTokenError, decode, encode, get_unverified_header
 
 from src.domain.entities import UserEntity
 from src.infra.authorization.base import (
     AccessToken,
     IPayload,
     IUserTokenService,
+    Principal,
     RefreshToken,
     TokenType,
     UserJWTPayload,
 )
+from src.infra.authorization.cache import VerifiedTokensCache
 from src.infra.authorization.exceptions import (
     JWTAuthorizationException,
+    JWTExpireAtFieldException,
+    JWTRevokedException,
     JWTTypeException,
 )
+from src.infra.authorization.keys import JWTKey
+from src.infra.authorization.revocation import (
+    IRevokedTokensStore,
+    MemoryRevokedTokensStore,
+)
 from src.project.settings import AuthJWTSettings
 
 
-oauth2_password_flow = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
-
-
 @dataclass
 class UserJWTService(IUserTokenService):
     settings: AuthJWTSettings
+    revoked_tokens: IRevokedTokensStore = field(
+        default_factory=MemoryRevokedTokensStore,
+    )
+    signing_key: JWTKey = field(init=False)
+    verification_keys: dict[str | None, JWTKey] = field(init=False)
+    verified_tokens: VerifiedTokensCache = field(init=False)
+
+    def __post_init__(self: Self) -> None:
+        self.signing_key = JWTKey.load(
+            algorithm=self.settings.ALGORITHM,
+            private_key=self.settings.PRIVATE_KEY,
+            public_key=self.settings.PUBLIC_KEY,
+            kid=self.settings.JWT_KEY_ID or None,
+        )
+        # Токены без kid проверяются текущим ключом.
+        self.verification_keys = {None: self.signing_key}
+        for previous in self.settings.JWT_PREVIOUS_KEYS:
+            self.verification_keys[previous.kid] = JWTKey.load(
+                algorithm=previous.algorithm,
+                public_key=previous.public_key,
+                kid=previous.kid,
+                signing=False,
+            )
+        self.verification_keys[self.signing_key.kid] = self.signing_key
+        self.verified_tokens = VerifiedTokensCache(
+            self.settings.JWT_VERIFIED_CACHE_SIZE,
+        )
 
     def _encode_payload(self: Self, payload: IPayload) -> str:
+        kid = self.signing_key.kid
         return encode(
             payload=payload.convert_to_dict(),
-            key=self.settings.PRIVATE_KEY,
-            algorithm=self.settings.ALGORITHM,
+            key=self.signing_key.sign_key,
+            algorithm=self.signing_key.algorithm,
+            headers=None if kid is None else {"kid": kid},
         )
 
-    def _decode_jwt(self: Self, token: str | bytes) -> UserJWTPayload:
+    def _decode_jwt(self: Self, token: str) -> UserJWTPayload:
         try:
-            return UserJWTPayload(
-                **decode(
-                    jwt=token,
-                    key=self.settings.PUBLIC_KEY,
-                    algorithms=[self.settings.ALGORITHM],
-                ),
+            key = self.verification_keys[get_unverified_header(token).get("kid")]
+            claims = decode(
+                jwt=token,
+                key=key.verify_key,
+                algorithms=[key.algorithm],
+                options={"require": ["exp", "sub", "type"]},
             )
-        except DecodeError:
+            return UserJWTPayload.from_dict(claims)
+        except (InvalidTokenError, KeyError, ValueError):
             raise JWTAuthorizationException
 
-    def create_access(self: Self, user: UserEntity) -> AccessToken:
+    def _verified_payload(self: Self, token: str) -> UserJWTPayload:
+        if (payload := self.verified_tokens.get(token)) is None:
+            payload = self._decode_jwt(token)
+            self.verified_tokens.put(token, payload)
+        return payload
+
+    @staticmethod
+    def _subject(user: UserEntity | Principal) -> str:
+        return str(user.user_oid if isinstance(user, Principal) else user.oid)
+
+    def create_access(
+        self: Self,
+        user: UserEntity | Principal,
+        family_oid: UUID | None = None,
+    ) -> AccessToken:
         return AccessToken(
             self._encode_payload(
                 UserJWTPayload(
-                    sub=str(user.oid),
+                    sub=self._subject(user),
                     username=user.username,
                     token_type=TokenType.ACCESS,
                     expire_timedelta=timedelta(
                         minutes=self.settings.ACCESS_TOKEN_EXPIRE_MINUTES,
                     ),
+                    family=None if family_oid is None else str(family_oid),
                 ),
             ),
         )
 
-    def create_refresh(self: Self, user: UserEntity) -> RefreshToken:
-        return RefreshToken(
-            self._encode_payload(
-                UserJWTPayload(
-                    sub=str(user.oid),
-                    username=user.username,
-                    token_type=TokenType.REFRESH,
-                    expire_timedelta=timedelta(
-                        days=self.settings.REFRESH_TOKEN_EXPIRE_DAYS,
-                    ),
-                ),
-            ),
+    def create_refresh(
+        self: Self,
+        user: UserEntity | Principal,
+        family_oid: UUID | None = None,
+    ) -> RefreshToken:
+        payload = UserJWTPayload(
+            sub=self._subject(user),
+            username=user.username,
+            token_type=TokenType.REFRESH,
+            expire_timedelta=timedelta(days=self.settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            family=None if family_oid is None else str(family_oid),
         )
+        if payload.exp is None:
+            raise JWTExpireAtFieldException
+        return RefreshToken(self._encode_payload(payload), payload.jti, payload.exp)
 
-    @staticmethod
-    def get_current_jwt(jwt: str = Depends(oauth2_password_flow)) -> str:
-        return jwt
-
-    @property
-    def payload(self: Self) -> UserJWTPayload:
-        return self._decode_jwt(self.get_current_jwt())
-
-    def deauthorize(self: Self) -> None: ...
-
-    @staticmethod
-    def _received_token_type(
-        token_type: TokenType = Header("some_auth"),
-    ) -> TokenType: ...
-
-    def validate_token_type(
+    def authenticate(
         self: Self,
-        token_type: TokenType = Depends(_received_token_type),
-    ) -> None:
-        if not isinstance(self.payload.token_type, TokenType):
-            raise JWTAuthorizationException
-
-        if self.payload.token_type != token_type:
-            raise JWTTypeException(self.payload.token_type, token_type)
-
-    def get_user_oid(self: Self) -> UUID:
-        return UUID(self.payload.sub)
+        token: str,
+        token_type: TokenType = TokenType.ACCESS,
+    ) -> Principal:
+        payload = self._verified_payload(token)
+        if payload.token_type != token_type:
+            raise JWTTypeException(token_type, payload.token_type)
+        if self.revoked_tokens.is_revoked(payload.jti):
+            raise JWTRevokedException
+        return Principal(payload)
+
+    def deauthorize(self: Self, principal: Principal) -> None:
+        # exp обязателен при проверке токена, см. _decode_jwt.
+        if principal.payload.exp is None:
+            raise JWTExpireAtFieldException
+        self.revoked_tokens.revoke(principal.payload.jti, principal.payload.exp)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+from jwt.algorithms import Algorithm, HMACAlgorithm, get_default_algorithms
+from jwt.exceptions import InvalidKeyError
+
+from src.infra.authorization.exceptions import JWTKeyException
+
+
+PRIVATE_KEY_TYPES = (
+    rsa.RSAPrivateKey,
+    ec.EllipticCurvePrivateKey,
+    ed25519.Ed25519PrivateKey,
+    ed448.Ed448PrivateKey,
+)
+
+
+@dataclass(frozen=True)
+class JWTKey:
+    """
+    Ключ, разобранный один раз при запуске: объекты ключей cryptography или
+    секрет HMAC. PyJWT принимает их без повторного разбора PEM.
+    """
+
+    algorithm: str
+    sign_key: Any
+    verify_key: Any
+    kid: str | None = None
+
+    @classmethod
+    def load(
+        cls: type["JWTKey"],
+        algorithm: str,
+        private_key: str | None = None,
+        public_key: str | None = None,
+        kid: str | None = None,
+        signing: bool = True,
+    ) -> "JWTKey":
+        """
+        Для HMAC секрет - private_key (или public_key для ключа только
+        проверки), для остальных алгоритмов открытый ключ без public_key
+        берется из закрытого. Ключ подписи (signing) без закрытого ключа не
+        загружается.
+        """
+        jwt_algorithm = get_default_algorithms().get(algorithm)
+        if jwt_algorithm is None or algorithm == "none":
+            raise JWTKeyException(algorithm)
+
+        if isinstance(jwt_algorithm, HMACAlgorithm):
+            if not (secret_key := private_key or public_key):
+                raise JWTKeyException(algorithm)
+            secret = _prepare_key(jwt_algorithm, algorithm, secret_key)
+            return cls(algorithm, secret, secret, kid)
+
+        if not private_key:
+            if signing or not public_key:
+                raise JWTKeyException(algorithm)
+            verify_key = _prepare_key(jwt_algorithm, algorithm, public_key)
+            return cls(algorithm, None, verify_key, kid)
+
+        sign_key = _prepare_key(jwt_algorithm, algorithm, private_key)
+        if public_key:
+            verify_key = _prepare_key(jwt_algorithm, algorithm, public_key)
+        elif isinstance(sign_key, PRIVATE_KEY_TYPES):
+            verify_key = sign_key.public_key()
+        else:
+            # В private_key передан открытый ключ.
+            raise JWTKeyException(algorithm)
+        return cls(algorithm, sign_key, verify_key, kid)
+
+
+def _prepare_key(jwt_algorithm: Algorithm, algorithm: str, key: str) -> Any:
+    try:
+        return jwt_algorithm.prepare_key(key)
+    except (InvalidKeyError, ValueError, TypeError):
+        raise JWTKeyException(algorithm)
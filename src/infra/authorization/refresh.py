@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing_extensions import Self
+from uuid import UUID, uuid4
+
+from src.domain.entities import UserEntity
+from src.domain.services import IAsyncRefreshTokensRepository
+from src.infra.authorization.base import (
+    IUserTokenService,
+    Principal,
+    TokenPair,
+    TokenType,
+)
+from src.infra.authorization.exceptions import (
+    JWTAuthorizationException,
+    RefreshTokenReuseException,
+    RefreshTokenRevokedException,
+)
+
+
+@dataclass
+class AsyncRefreshTokenRotation:
+    """
+    Выпуск пары токенов при входе и обмен refresh токена на новую пару без
+    bcrypt и чтения пользователя. Каждый refresh токен одноразовый: повторное
+    использование уже замененного токена удаляет все семейство, и украденная
+    копия перестает работать вместе с действующей. Access токен пары несет
+    семейство ("fam"), чтобы выход завершал и его.
+    """
+
+    repository: IAsyncRefreshTokensRepository
+    token_service: IUserTokenService
+
+    async def issue(self: Self, user: UserEntity) -> TokenPair:
+        family_oid = uuid4()
+        refresh = self.token_service.create_refresh(user, family_oid)
+        await self.repository.add_family(
+            family_oid,
+            user.oid,
+            refresh.jti,
+            refresh.exp,
+        )
+        return TokenPair(
+            access_token=self.token_service.create_access(
+                user,
+                family_oid,
+            ).access_token,
+            refresh_token=refresh.refresh_token,
+        )
+
+    async def refresh(self: Self, refresh_token: str) -> TokenPair:
+        """
+        Если семейства уже нет (выход или истечение), токен просто отозван:
+        RefreshTokenRevokedException. Если есть, но jti заменен - это повторное
+        использование: RefreshTokenReuseException выбрасывается после удаления
+        семейства, вызывающий код фиксирует транзакцию до ответа с ошибкой.
+        """
+        principal = self.token_service.authenticate(refresh_token, TokenType.REFRESH)
+        if principal.payload.family is None:
+            raise JWTAuthorizationException
+
+        family_oid = UUID(principal.payload.family)
+        refresh = self.token_service.create_refresh(principal, family_oid)
+        if not await self.repository.rotate(
+            family_oid,
+            principal.payload.jti,
+            refresh.jti,
+            refresh.exp,
+        ):
+            if await self.repository.delete_family(family_oid):
+                raise RefreshTokenReuseException
+            raise RefreshTokenRevokedException
+
+        return TokenPair(
+            access_token=self.token_service.create_access(
+                principal,
+                family_oid,
+            ).access_token,
+            refresh_token=refresh.refresh_token,
+        )
+
+    async def end(self: Self, principal: Principal) -> None:
+        """Выход: семейство access токена удаляется, его refresh не обменять."""
+        if principal.payload.family is not None:
+            await self.repository.delete_family(UUID(principal.payload.family))
@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from math import ceil
+from threading import Lock
+from typing import Iterable
+from typing_extensions import Self
+
+
+@dataclass
+class IRevokedTokensStore(ABC):
+    """
+    Отозванные jti до exp их токенов. Общее хранилище процессов (например,
+    Redis: SET jti EXAT exp и EXISTS jti) реализует этот же интерфейс,
+    MemoryRevokedTokensStore - его замена в одном процессе и в тестах.
+    """
+
+    @abstractmethod
+    def revoke(self: Self, jti: str, exp: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_revoked(self: Self, jti: str) -> bool:
+        """Проверяется на каждом запросе с токеном, должна быть O(1)."""
+        raise NotImplementedError
+
+
+@dataclass
+class MemoryRevokedTokensStore(IRevokedTokensStore):
+    """
+    dict jti -> exp и колесо времени с шагом в секунду: jti лежат в корзине
+    секунды своего exp и удаляются вместе с ней при следующем revoke.
+    Проверка - одно обращение к dict без блокировки и часов: токен с
+    истекшим exp не пройдет проверку подписи раньше, чем дойдет до нее.
+    """
+
+    _revoked: dict[str, float] = field(default_factory=dict)
+    _wheel: dict[int, list[str]] = field(default_factory=dict)
+    _next_tick: int = field(default=0, init=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    @staticmethod
+    def _now() -> float:
+        return datetime.now(UTC).timestamp()
+
+    def __len__(self: Self) -> int:
+        return len(self._revoked)
+
+    def revoke(self: Self, jti: str, exp: float) -> None:
+        now = self._now()
+        with self._lock:
+            self._expire(now)
+            if exp <= now or jti in self._revoked:
+                return
+
+            self._revoked[jti] = exp
+            self._wheel.setdefault(ceil(exp), []).append(jti)
+
+    def is_revoked(self: Self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def purge_expired(self: Self) -> None:
+        with self._lock:
+            self._expire(self._now())
+
+    def _expire(self: Self, now: float) -> None:
+        """Корзины секунд до now включительно, после простоя - без перебора."""
+        tick = int(now)
+        if tick < self._next_tick:
+            return
+
+        ticks: Iterable[int]
+        if tick - self._next_tick > len(self._wheel):
+            ticks = [wheel_tick for wheel_tick in self._wheel if wheel_tick <= tick]
+        else:
+            ticks = range(self._next_tick, tick + 1)
+        for wheel_tick in ticks:
+            for jti in self._wheel.pop(wheel_tick, ()):
+                del self._revoked[jti]
+        self._next_tick = tick + 1
@@ -1,19 +1,29 @@
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import InitVar, dataclass, field
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from typing_extensions import Self
 
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 
+AUTOCOMMIT = "AUTOCOMMIT"
+
+
 @dataclass
 class Database:
     url: InitVar[str]
 
     _engine: Engine = field(init=False)
     _session: sessionmaker[Session] = field(init=False)
+    _read_only_session: sessionmaker[Session] = field(init=False)
 
     def __post_init__(self: Self, url: str) -> None:
         self._engine = create_engine(
@@ -24,6 +34,10 @@ class Database:
             bind=self._engine,
             expire_on_commit=False,
         )
+        self._read_only_session = sessionmaker(
+            bind=self._engine.execution_options(isolation_level=AUTOCOMMIT),
+            autoflush=False,
+        )
 
     @contextmanager
     def get_session(self: Self) -> Generator[Session, None, None]:
@@ -38,6 +52,97 @@ class Database:
         finally:
             session.close()
 
+    @contextmanager
+    def get_read_only_session(self: Self) -> Generator[Session, None, None]:
+        """
+        Сессия только для SELECT: соединение в режиме AUTOCOMMIT, поэтому
+        драйвер не отправляет BEGIN, а на выходе нет COMMIT.
+        """
+        with self._read_only_session() as session:
+            yield session
+
     @property
     def engine(self: Self) -> Engine:
         return self._engine
+
+
+@dataclass
+class AsyncDatabase:
+    """То же, что Database, но с асинхронным драйвером (asyncpg, aiosqlite)."""
+
+    url: InitVar[str]
+
+    _engine: AsyncEngine = field(init=False)
+    _session: async_sessionmaker[AsyncSession] = field(init=False)
+    _read_only_session: async_sessionmaker[AsyncSession] = field(init=False)
+
+    def __post_init__(self: Self, url: str) -> None:
+        self._engine = create_async_engine(
+            url=url,
+            echo=False,
+        )
+        self._session = async_sessionmaker(
+            bind=self._engine,
+            expire_on_commit=False,
+        )
+        self._read_only_session = async_sessionmaker(
+            bind=self._engine.execution_options(isolation_level=AUTOCOMMIT),
+            autoflush=False,
+        )
+
+    @asynccontextmanager
+    async def get_session(self: Self) -> AsyncGenerator[AsyncSession, None]:
+        session: AsyncSession = self._session()
+        try:
+            yield session
+        except SQLAlchemyError:
+            await session.rollback()
+            raise
+        else:
+            await session.commit()
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def get_read_only_session(
+        self: Self,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        async with self._read_only_session() as session:
+            yield session
+
+    @property
+    def engine(self: Self) -> AsyncEngine:
+        return self._engine
+
+
+@dataclass
+class SessionScope:
+    """
+    Источник сессий для репозиториев внутри единицы работы: все вызовы
+    получают одну сессию, транзакцией управляет единица работы.
+    """
+
+    session: Session
+
+    @contextmanager
+    def get_session(self: Self) -> Generator[Session, None, None]:
+        yield self.session
+
+    @contextmanager
+    def get_read_only_session(self: Self) -> Generator[Session, None, None]:
+        yield self.session
+
+
+@dataclass
+class AsyncSessionScope:
+    session: AsyncSession
+
+    @asynccontextmanager
+    async def get_session(self: Self) -> AsyncGenerator[AsyncSession, None]:
+        yield self.session
+
+    @asynccontextmanager
+    async def get_read_only_session(
+        self: Self,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        yield self.session
@@ -0,0 +1,74 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any
+from typing_extensions import Self
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infra.database import AUTOCOMMIT
+
+
+def _in_transaction_mode(connection: Connection) -> bool:
+    isolation_level = connection.get_execution_options().get("isolation_level")
+    return isolation_level != AUTOCOMMIT
+
+
+@dataclass
+class StatementCounter:
+    """
+    Считает обращения к БД на время блока with: SQL запросы ("statement") и
+    управление транзакцией ("begin", "commit", "rollback"). В режиме AUTOCOMMIT
+    драйвер не отправляет BEGIN/COMMIT/ROLLBACK, поэтому они не считаются.
+    """
+
+    engine: Engine | AsyncEngine
+    counts: Counter[str] = field(default_factory=Counter, init=False)
+
+    @property
+    def total(self: Self) -> int:
+        return sum(self.counts.values())
+
+    def __enter__(self: Self) -> Self:
+        for name, listener in self._listeners().items():
+            event.listen(self._sync_engine, name, listener)
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for name, listener in self._listeners().items():
+            event.remove(self._sync_engine, name, listener)
+
+    @property
+    def _sync_engine(self: Self) -> Engine:
+        if isinstance(self.engine, AsyncEngine):
+            return self.engine.sync_engine
+        return self.engine
+
+    def _listeners(self: Self) -> dict[str, Any]:
+        return {
+            "begin": self._on_begin,
+            "commit": self._on_commit,
+            "rollback": self._on_rollback,
+            "before_cursor_execute": self._on_statement,
+        }
+
+    def _on_begin(self: Self, connection: Connection) -> None:
+        if _in_transaction_mode(connection):
+            self.counts["begin"] += 1
+
+    def _on_commit(self: Self, connection: Connection) -> None:
+        if _in_transaction_mode(connection):
+            self.counts["commit"] += 1
+
+    def _on_rollback(self: Self, connection: Connection) -> None:
+        if _in_transaction_mode(connection):
+            self.counts["rollback"] += 1
+
+    def _on_statement(self: Self, connection: Connection, *args: Any) -> None:
+        self.counts["statement"] += 1
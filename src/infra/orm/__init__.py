@@ -1,11 +1,17 @@
 from src.infra.orm.base import ORMBase, metadata
+from src.infra.orm.mixins import truncate_timestamp
 from src.infra.orm.note import ORMNote
+from src.infra.orm.note_statistics import ORMNoteStatistics
+from src.infra.orm.refresh_token import ORMRefreshTokenFamily
 from src.infra.orm.user import ORMUser
 
 
 __all__ = [
     "ORMNote",
+    "ORMNoteStatistics",
+    "ORMRefreshTokenFamily",
     "ORMUser",
     "ORMBase",
     "metadata",
+    "truncate_timestamp",
 ]
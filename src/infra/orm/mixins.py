@@ -7,6 +7,11 @@ from sqlalchemy import func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
+def truncate_timestamp(value: datetime) -> datetime:
+    """Время записи в сущности: без микросекунд и часового пояса."""
+    return value.replace(microsecond=0, tzinfo=None)
+
+
 @dataclass
 class MixinUUIDOid:
     oid: Mapped[UUID] = mapped_column(default=uuid4, unique=True)
@@ -33,8 +38,8 @@ class MixinUpdatedAt(MixinCreatedAtOnly):
 
     @property
     def created_date(self: Self) -> datetime:
-        return self.created_at.replace(microsecond=0, tzinfo=None)
+        return truncate_timestamp(self.created_at)
 
     @property
     def updated_date(self: Self) -> datetime:
-        return self.updated_at.replace(microsecond=0, tzinfo=None)
+        return truncate_timestamp(self.updated_at)
@@ -1,8 +1,9 @@
-from datetime import date, time
+from datetime import date
+from typing import Any
 from typing_extensions import Self
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, PrimaryKeyConstraint
+from sqlalchemy import ForeignKey, Index, PrimaryKeyConstraint, SmallInteger
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.entities import NoteEntity
@@ -19,6 +20,9 @@ class ORMNote(ORMBase, MixinUUIDOid, MixinUpdatedAt):
             "owner_oid",
             name="unique_bedtime_date_for_user",
         ),
+        # Первичный ключ начинается с bedtime_date и не подходит для выборок
+        # дневника одного владельца по диапазону дат и страницами.
+        Index("ix_notes_owner_oid_bedtime_date", "owner_oid", "bedtime_date"),
     )
 
     bedtime_date: Mapped[date]
@@ -28,26 +32,32 @@ class ORMNote(ORMBase, MixinUUIDOid, MixinUpdatedAt):
             ondelete="CASCADE",
         ),
     )
-    went_to_bed: Mapped[time]
-    fell_asleep: Mapped[time]
-    woke_up: Mapped[time]
-    got_up: Mapped[time]
-    no_sleep: Mapped[time]
+    # Временные точки - минуты от полуночи, как в Points.
+    went_to_bed: Mapped[int] = mapped_column(SmallInteger)
+    fell_asleep: Mapped[int] = mapped_column(SmallInteger)
+    woke_up: Mapped[int] = mapped_column(SmallInteger)
+    got_up: Mapped[int] = mapped_column(SmallInteger)
+    no_sleep: Mapped[int] = mapped_column(SmallInteger)
 
     @classmethod
     def from_entity(cls: type["ORMNote"], obj: NoteEntity) -> "ORMNote":
-        return cls(
-            oid=obj.oid,
-            owner_oid=obj.owner_oid,
-            created_at=obj.created_at,
-            updated_at=obj.updated_at,
-            bedtime_date=obj.points.bedtime_date,
-            went_to_bed=obj.points.went_to_bed,
-            fell_asleep=obj.points.fell_asleep,
-            woke_up=obj.points.woke_up,
-            got_up=obj.points.got_up,
-            no_sleep=obj.points.no_sleep,
-        )
+        return cls(**cls.values_from_entity(obj))
+
+    @staticmethod
+    def values_from_entity(obj: NoteEntity) -> dict[str, Any]:
+        values = {
+            "oid": obj.oid,
+            "owner_oid": obj.owner_oid,
+            "created_at": obj.created_at,
+            "updated_at": obj.updated_at,
+            "bedtime_date": obj.points.bedtime_date,
+            "went_to_bed": obj.points.went_to_bed_minutes,
+            "fell_asleep": obj.points.fell_asleep_minutes,
+            "woke_up": obj.points.woke_up_minutes,
+            "got_up": obj.points.got_up_minutes,
+            "no_sleep": obj.points.no_sleep_minutes,
+        }
+        return {key: value for key, value in values.items() if value is not None}
 
     def to_entity(self: Self) -> NoteEntity:
         return NoteEntity(
@@ -55,13 +65,14 @@ class ORMNote(ORMBase, MixinUUIDOid, MixinUpdatedAt):
             owner_oid=self.owner_oid,
             created_at=self.created_date,
             updated_at=self.updated_date,
-            points=Points(
+            # Строки БД прошли проверку Points при записи.
+            points=Points.trusted(
                 self.bedtime_date,
-                self.went_to_bed.replace(tzinfo=None),
-                self.fell_asleep.replace(tzinfo=None),
-                self.woke_up.replace(tzinfo=None),
-                self.got_up.replace(tzinfo=None),
-                self.no_sleep.replace(tzinfo=None),
+                self.went_to_bed,
+                self.fell_asleep,
+                self.woke_up,
+                self.got_up,
+                self.no_sleep,
             ),
         )
 
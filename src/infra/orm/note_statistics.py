@@ -0,0 +1,55 @@
+from datetime import date
+from typing_extensions import Self
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, PrimaryKeyConstraint, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.domain.services import PeriodStatistics
+from src.infra.orm.base import ORMBase
+
+
+class ORMNoteStatistics(ORMBase):
+    __tablename__ = "notes_statistics"
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "owner_oid",
+            "period",
+            "period_start",
+            name="unique_period_for_user",
+        ),
+    )
+
+    owner_oid: Mapped[UUID] = mapped_column(
+        ForeignKey(
+            column="users.oid",
+            ondelete="CASCADE",
+        ),
+    )
+    period: Mapped[str] = mapped_column(String(8))
+    period_start: Mapped[date]
+    notes_count: Mapped[int]
+    sleep: Mapped[int] = mapped_column(comment="Сумма времени сна, минуты")
+    in_bed: Mapped[int] = mapped_column(comment="Сумма времени в кровати, минуты")
+    no_sleep: Mapped[int] = mapped_column(comment="Сумма времени без сна, минуты")
+    sleep_minus_no_sleep: Mapped[int] = mapped_column(
+        comment="Сумма времени сна без учета времени без сна, минуты",
+    )
+
+    def to_entity(self: Self) -> PeriodStatistics:
+        return PeriodStatistics(
+            period_start=self.period_start,
+            notes_count=self.notes_count,
+            sleep=self.sleep,
+            in_bed=self.in_bed,
+            no_sleep=self.no_sleep,
+            sleep_minus_no_sleep=self.sleep_minus_no_sleep,
+        )
+
+    def __repr__(self: Self) -> str:
+        return (
+            f"<NoteStatisticsORM "
+            f"owner_oid='{str(self.owner_oid)[:4]}...' "
+            f"period='{self.period}' "
+            f"period_start='{self.period_start}' "
+        )
@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infra.orm.base import ORMBase
+from src.infra.orm.mixins import MixinCreatedAtOnly
+
+
+class ORMRefreshTokenFamily(ORMBase, MixinCreatedAtOnly):
+    __tablename__ = "refresh_token_families"
+
+    oid: Mapped[UUID] = mapped_column(primary_key=True)
+    owner_oid: Mapped[UUID] = mapped_column(
+        ForeignKey(
+            column="users.oid",
+            ondelete="CASCADE",
+        ),
+        index=True,
+    )
+    jti: Mapped[str] = mapped_column(
+        String(36),
+        comment="jti действующего refresh токена",
+    )
+    exp: Mapped[float] = mapped_column(
+        index=True,
+        comment="exp действующего refresh токена, Unix время",
+    )
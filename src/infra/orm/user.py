@@ -1,3 +1,4 @@
+from typing import Any
 from typing_extensions import Self
 
 from sqlalchemy import String
@@ -14,6 +15,17 @@ class ORMUser(ORMBase, MixinUUIDOid, MixinUpdatedAt):
     username: Mapped[str] = mapped_column(String(128), primary_key=True, unique=True)
     password: Mapped[str]
 
+    @staticmethod
+    def values_from_entity(obj: UserEntity) -> dict[str, Any]:
+        values = {
+            "oid": obj.oid,
+            "created_at": obj.created_at,
+            "updated_at": obj.updated_at,
+            "username": obj.username,
+            "password": obj.password,
+        }
+        return {key: value for key, value in values.items() if value is not None}
+
     def to_entity(self: Self) -> UserEntity:
         return UserEntity(
             oid=self.oid,
@@ -1,12 +1,51 @@
+from src.infra.repository.cached_users import (
+    AsyncCachedUsersRepository,
+    UsersCache,
+    UsersCacheMetrics,
+)
 from src.infra.repository.memory_notes import MemoryNotesRepository
+from src.infra.repository.memory_refresh_tokens import MemoryRefreshTokensRepository
+from src.infra.repository.memory_statistics import MemoryStatisticsRepository
 from src.infra.repository.memory_users import MemoryUsersRepository
-from src.infra.repository.orm_notes import ORMNotesRepository
-from src.infra.repository.orm_user import ORMUsersRepository
+from src.infra.repository.orm_notes import (
+    AsyncORMNotesRepository,
+    ORMNotesRepository,
+)
+from src.infra.repository.orm_refresh_tokens import (
+    AsyncORMRefreshTokensRepository,
+    ORMRefreshTokensRepository,
+)
+from src.infra.repository.orm_statistics import (
+    AsyncORMStatisticsRepository,
+    ORMStatisticsRepository,
+)
+from src.infra.repository.orm_user import AsyncORMUsersRepository, ORMUsersRepository
+from src.infra.repository.threadpool import (
+    ThreadPoolNotesRepository,
+    ThreadPoolRefreshTokensRepository,
+    ThreadPoolStatisticsRepository,
+    ThreadPoolUsersRepository,
+)
 
 
 __all__ = (
     "ORMNotesRepository",
     "ORMUsersRepository",
+    "ORMStatisticsRepository",
     "MemoryNotesRepository",
     "MemoryUsersRepository",
+    "MemoryStatisticsRepository",
+    "AsyncORMNotesRepository",
+    "AsyncORMUsersRepository",
+    "AsyncORMStatisticsRepository",
+    "ThreadPoolNotesRepository",
+    "ThreadPoolUsersRepository",
+    "ThreadPoolStatisticsRepository",
+    "MemoryRefreshTokensRepository",
+    "ORMRefreshTokensRepository",
+    "AsyncORMRefreshTokensRepository",
+    "ThreadPoolRefreshTokensRepository",
+    "UsersCache",
+    "UsersCacheMetrics",
+    "AsyncCachedUsersRepository",
 )
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Callable
+from typing_extensions import Self
+
+from src.domain.entities import UserEntity
+from src.domain.services import IAsyncUsersRepository
+
+
+@dataclass(frozen=True)
+class UsersCacheMetrics:
+    hits: int
+    negative_hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+
+@dataclass
+class UsersCache:
+    """
+    LRU пользователей по имени с коротким TTL, общий для запросов процесса.
+    Отсутствующие имена тоже кэшируются (None), чтобы перебор несуществующих
+    пользователей не читал БД. Изменения через кэширующие репозитории
+    удаляют запись, изменения в БД мимо них видны не позже чем через ttl.
+
+    Каждое удаление увеличивает поколение кэша. put сохраняет прочитанное
+    из БД, только если поколение не изменилось с промаха в get: чтение,
+    начатое до фиксации чужого изменения, не вернет в кэш старую запись.
+    """
+
+    max_size: int = 10_000
+    ttl: float = 5.0
+    _users: OrderedDict[str, tuple[float, UserEntity | None]] = field(
+        default_factory=OrderedDict,
+    )
+    clock: Callable[[], float] = field(default=monotonic, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+    _hits: int = field(default=0, init=False)
+    _negative_hits: int = field(default=0, init=False)
+    _misses: int = field(default=0, init=False)
+    _invalidations: int = field(default=0, init=False)
+    _generation: int = field(default=0, init=False)
+
+    def __len__(self: Self) -> int:
+        return len(self._users)
+
+    def get(self: Self, username: str) -> tuple[bool, UserEntity | None, int]:
+        """
+        (найдено ли в кэше, пользователь или None для отсутствующего,
+        поколение кэша для put после промаха).
+        """
+        now = self.clock()
+        with self._lock:
+            cached = self._users.get(username)
+            if cached is None or cached[0] <= now:
+                self._misses += 1
+                return False, None, self._generation
+
+            self._users.move_to_end(username)
+            if cached[1] is None:
+                self._negative_hits += 1
+            else:
+                self._hits += 1
+            return True, cached[1], self._generation
+
+    def put(
+        self: Self,
+        username: str,
+        user: UserEntity | None,
+        generation: int,
+    ) -> None:
+        if self.max_size <= 0:
+            return
+
+        expires_at = self.clock() + self.ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._users[username] = (expires_at, user)
+            self._users.move_to_end(username)
+            while len(self._users) > self.max_size:
+                self._users.popitem(last=False)
+
+    def peek(self: Self, username: str) -> UserEntity | None:
+        """Пользователь из кэша без учета в метриках, None - нет или истек."""
+        now = self.clock()
+        with self._lock:
+            cached = self._users.get(username)
+        if cached is None or cached[0] <= now:
+            return None
+        return cached[1]
+
+    def invalidate(self: Self, username: str) -> None:
+        with self._lock:
+            self._users.pop(username, None)
+            self._invalidations += 1
+            self._generation += 1
+
+    def clear(self: Self) -> None:
+        with self._lock:
+            self._users.clear()
+            self._generation += 1
+
+    @property
+    def metrics(self: Self) -> UsersCacheMetrics:
+        with self._lock:
+            return UsersCacheMetrics(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=len(self._users),
+            )
+
+
+@dataclass
+class AsyncCachedUsersRepository(IAsyncUsersRepository):
+    """
+    UsersCache поверх репозитория единицы работы запроса. Изменения видны
+    в кэше только после фиксации транзакции: имена измененных пользователей
+    удаляются из него в invalidate_written, до этого их чтения идут мимо кэша.
+    """
+
+    repository: IAsyncUsersRepository
+    cache: UsersCache
+    _written: set[str] = field(default_factory=set, init=False, repr=False)
+
+    async def get_by_username(self: Self, username: str) -> UserEntity | None:
+        if username in self._written:
+            return await self.repository.get_by_username(username)
+
+        found, user, generation = self.cache.get(username)
+        if not found:
+            user = await self.repository.get_by_username(username)
+            self.cache.put(username, user, generation)
+        return user
+
+    def is_known_username(self: Self, username: str) -> bool:
+        if username in self._written:
+            return False
+        return self.cache.peek(username) is not None
+
+    async def add_user(self: Self, user: UserEntity) -> None:
+        self._written.add(user.username)
+        await self.repository.add_user(user)
+
+    async def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        self._written.add(user.username)
+        return await self.repository.add_user_if_absent(user)
+
+    async def update_password(self: Self, username: str, password: str) -> None:
+        self._written.add(username)
+        await self.repository.update_password(username, password)
+
+    async def delete_user(self: Self, username: str) -> None:
+        self._written.add(username)
+        await self.repository.delete_user(username)
+
+    def invalidate_written(self: Self) -> None:
+        """Вызывается после завершения транзакции, в том числе откаченной."""
+        for username in self._written:
+            self.cache.invalidate(username)
+        self._written.clear()
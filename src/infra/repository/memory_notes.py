@@ -1,39 +1,157 @@
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
 from datetime import date
+from threading import RLock
+from typing import Generator, Iterable, Iterator
 from typing_extensions import Self
 from uuid import UUID
 
 from src.domain.entities import NoteEntity
+from src.domain.exceptions import NonUniqueNoteBedtimeDateException
 from src.domain.services import INotesRepository
+from src.infra.repository.memory_statistics import MemoryStatisticsRepository
 
 
 @dataclass
 class MemoryNotesRepository(INotesRepository):
-    _saved_notes: set[NoteEntity] = field(default_factory=set)
+    """
+    Записи в памяти с индексами по oid, (owner_oid, bedtime_date) и
+    отсортированными датами владельца. Изменения записей, индексов и
+    статистики выполняются под одной блокировкой.
+    """
+
+    statistics_repository: MemoryStatisticsRepository = field(
+        default_factory=MemoryStatisticsRepository,
+    )
+    _by_oid: dict[UUID, NoteEntity] = field(default_factory=dict)
+    _by_owner: dict[UUID, dict[date, NoteEntity]] = field(default_factory=dict)
+    _owner_dates: dict[UUID, list[date]] = field(default_factory=dict)
+    _lock: RLock = field(default_factory=RLock, repr=False)
+
+    def __post_init__(self: Self) -> None:
+        self.statistics_repository.notes_repository = self
+
+    def __iter__(self: Self) -> Iterator[NoteEntity]:
+        """Записи всех владельцев, у каждого - по возрастанию bedtime_date."""
+        with self._lock:
+            notes = [
+                self._by_owner[owner_oid][bedtime_date]
+                for owner_oid, dates in self._owner_dates.items()
+                for bedtime_date in dates
+            ]
+        return iter(notes)
 
     def add(self: Self, note: NoteEntity) -> None:
-        self._saved_notes.add(note)
+        with self._lock:
+            self._insert(note)
+            self.statistics_repository.apply([note])
+
+    def add_many(self: Self, notes: Iterable[NoteEntity]) -> set[NoteEntity]:
+        added, not_added = [], set()
+        with self._lock:
+            for note in notes:
+                try:
+                    self._insert(note)
+                except NonUniqueNoteBedtimeDateException:
+                    not_added.add(note)
+                else:
+                    added.append(note)
+            self.statistics_repository.apply(added)
+        return not_added
+
+    def update(self: Self, note: NoteEntity) -> NoteEntity | None:
+        with self._lock:
+            previous = self.delete(note.owner_oid, note.points.bedtime_date)
+            if previous is None:
+                return None
+
+            self.add(
+                NoteEntity(
+                    oid=previous.oid,
+                    owner_oid=previous.owner_oid,
+                    created_at=previous.created_at,
+                    updated_at=note.updated_at,
+                    points=note.points,
+                ),
+            )
+        return previous
+
+    def delete(self: Self, owner_oid: UUID, bedtime_date: date) -> NoteEntity | None:
+        with self._lock:
+            owner_notes = self._by_owner.get(owner_oid, {})
+            if (note := owner_notes.pop(bedtime_date, None)) is None:
+                return None
+
+            del self._by_oid[note.oid]
+            dates = self._owner_dates[owner_oid]
+            del dates[bisect_left(dates, bedtime_date)]
+            self.statistics_repository.apply([note], sign=-1)
+        return note
 
     def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
-        try:
-            return next(note for note in self._saved_notes if note.oid == oid)
-        except StopIteration:
-            return None
+        return self._by_oid.get(oid)
 
     def get_by_bedtime_date(
         self: Self,
         bedtime_date: date,
         owner_oid: UUID,
     ) -> NoteEntity | None:
-        try:
-            return next(
-                note
-                for note in self._saved_notes
-                if note.points.bedtime_date == bedtime_date
-                and note.owner_oid == owner_oid
-            )
-        except StopIteration:
-            return None
+        return self._by_owner.get(owner_oid, {}).get(bedtime_date)
 
     def get_all_notes(self: Self, owner_oid: UUID) -> set[NoteEntity]:
-        return {note for note in self._saved_notes if note.owner_oid == owner_oid}
+        with self._lock:
+            return set(self._by_owner.get(owner_oid, {}).values())
+
+    def iter_notes(
+        self: Self,
+        owner_oid: UUID,
+    ) -> Generator[NoteEntity, None, None]:
+        with self._lock:
+            dates = list(self._owner_dates.get(owner_oid, []))
+        owner_notes = self._by_owner.get(owner_oid, {})
+        for bedtime_date in dates:
+            if (note := owner_notes.get(bedtime_date)) is not None:
+                yield note
+
+    def get_by_date_range(
+        self: Self,
+        owner_oid: UUID,
+        first_date: date,
+        last_date: date,
+    ) -> list[NoteEntity]:
+        with self._lock:
+            dates = self._owner_dates.get(owner_oid, [])
+            owner_notes = self._by_owner.get(owner_oid, {})
+            start = bisect_left(dates, first_date)
+            end = bisect_right(dates, last_date)
+            return [owner_notes[bedtime_date] for bedtime_date in dates[start:end]]
+
+    def get_latest(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        before: date | None = None,
+    ) -> list[NoteEntity]:
+        with self._lock:
+            dates = self._owner_dates.get(owner_oid, [])
+            owner_notes = self._by_owner.get(owner_oid, {})
+            end = len(dates) if before is None else bisect_left(dates, before)
+            start = max(end - limit, 0)
+            return [
+                owner_notes[bedtime_date]
+                for bedtime_date in reversed(dates[start:end])
+            ]
+
+    def _insert(self: Self, note: NoteEntity) -> None:
+        bedtime_date = note.points.bedtime_date
+        owner_notes = self._by_owner.setdefault(note.owner_oid, {})
+        if bedtime_date in owner_notes:
+            raise NonUniqueNoteBedtimeDateException(bedtime_date)
+
+        owner_notes[bedtime_date] = note
+        self._by_oid[note.oid] = note
+        dates = self._owner_dates.setdefault(note.owner_oid, [])
+        if not dates or dates[-1] < bedtime_date:
+            dates.append(bedtime_date)
+        else:
+            insort(dates, bedtime_date)
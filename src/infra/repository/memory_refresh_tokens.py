@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import NamedTuple
+from typing_extensions import Self
+from uuid import UUID
+
+from src.domain.services import IRefreshTokensRepository
+
+
+class _Family(NamedTuple):
+    owner_oid: UUID
+    jti: str
+    exp: float
+
+
+@dataclass
+class MemoryRefreshTokensRepository(IRefreshTokensRepository):
+    """
+    Не больше max_families семейств. Ротация переносит семейство в конец dict,
+    поэтому в начале - давно не обновлявшиеся (при одном сроке жизни refresh
+    токенов - самые ранние exp), они и удаляются при переполнении.
+    """
+
+    max_families: int = 100_000
+    _families: dict[UUID, _Family] = field(default_factory=dict)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def add_family(
+        self: Self,
+        family_oid: UUID,
+        owner_oid: UUID,
+        jti: str,
+        exp: float,
+    ) -> None:
+        with self._lock:
+            self._families[family_oid] = _Family(owner_oid, jti, exp)
+            while len(self._families) > self.max_families:
+                del self._families[next(iter(self._families))]
+
+    def rotate(
+        self: Self,
+        family_oid: UUID,
+        jti: str,
+        new_jti: str,
+        exp: float,
+    ) -> bool:
+        with self._lock:
+            family = self._families.get(family_oid)
+            if family is None or family.jti != jti:
+                return False
+
+            del self._families[family_oid]
+            self._families[family_oid] = family._replace(jti=new_jti, exp=exp)
+            return True
+
+    def delete_family(self: Self, family_oid: UUID) -> bool:
+        with self._lock:
+            return self._families.pop(family_oid, None) is not None
+
+    def delete_expired(self: Self, now: float) -> int:
+        with self._lock:
+            expired = [
+                family_oid
+                for family_oid, family in self._families.items()
+                if family.exp <= now
+            ]
+            for family_oid in expired:
+                del self._families[family_oid]
+        return len(expired)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable
+from typing_extensions import Self
+from uuid import UUID
+
+from src.domain.entities import NoteEntity
+from src.domain.services import IStatisticsRepository, Period, PeriodStatistics
+
+
+if TYPE_CHECKING:
+    from src.infra.repository.memory_notes import MemoryNotesRepository
+
+
+@dataclass
+class MemoryStatisticsRepository(IStatisticsRepository):
+    """Статистика записей MemoryNotesRepository, обновляемая им через apply."""
+
+    notes_repository: "MemoryNotesRepository | None" = field(
+        default=None,
+        repr=False,
+    )
+    _rollups: dict[tuple[UUID, Period], dict[date, PeriodStatistics]] = field(
+        default_factory=dict,
+    )
+
+    def apply(self: Self, notes: Iterable[NoteEntity], sign: int = 1) -> None:
+        for owner_oid, grouped_notes in groupby(
+            sorted(notes, key=lambda note: str(note.owner_oid)),
+            key=attrgetter("owner_oid"),
+        ):
+            owner_notes = list(grouped_notes)
+            for period in Period:
+                rollups = self._rollups.setdefault((owner_oid, period), {})
+                for statistics in PeriodStatistics.from_notes(owner_notes, period):
+                    if sign < 0:
+                        statistics = -statistics
+                    if (saved := rollups.get(statistics.period_start)) is not None:
+                        statistics = saved + statistics
+                    if statistics.notes_count > 0:
+                        rollups[statistics.period_start] = statistics
+                    else:
+                        rollups.pop(statistics.period_start, None)
+
+    def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        first_period_start = period.start_of(first_date)
+        rollups = self._rollups.get((owner_oid, period), {})
+        return [
+            rollups[period_start]
+            for period_start in sorted(rollups)
+            if first_period_start <= period_start <= last_date
+        ]
+
+    def rebuild(self: Self, owner_oid: UUID | None = None) -> int:
+        if self.notes_repository is None:
+            return 0
+
+        if owner_oid is None:
+            self._rollups.clear()
+            self.apply(self.notes_repository)
+        else:
+            for period in Period:
+                self._rollups.pop((owner_oid, period), None)
+            self.apply(self.notes_repository.get_all_notes(owner_oid))
+        return sum(
+            len(rollups)
+            for (rollups_owner_oid, _), rollups in self._rollups.items()
+            if owner_oid in (None, rollups_owner_oid)
+        )
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing_extensions import Self
 
 from src.domain.entities import UserEntity
@@ -20,6 +20,18 @@ class MemoryUsersRepository(IUsersRepository):
     def add_user(self: Self, user: UserEntity) -> None:
         self._saved_users.add(user)
 
+    def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        if user in self._saved_users:
+            return False
+
+        self._saved_users.add(user)
+        return True
+
+    def update_password(self: Self, username: str, password: str) -> None:
+        if (user := self.get_by_username(username)) is not None:
+            self._saved_users.remove(user)
+            self._saved_users.add(replace(user, password=password))
+
     def delete_user(self: Self, username: str) -> None:
         if (user := self.get_by_username(username)) is not None:
             self._saved_users.remove(user)
@@ -1,56 +1,359 @@
 from dataclasses import dataclass
 from datetime import date
+from typing import AsyncIterator, ClassVar, Generator, Iterable
 from typing_extensions import Self
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, delete, select
+from sqlalchemy.orm import Session
 
 from src.domain.entities import NoteEntity
-from src.domain.services import INotesRepository
-from src.infra.database import Database
-from src.infra.orm import ORMNote
+from src.domain.exceptions import NonUniqueNoteBedtimeDateException
+from src.domain.services import IAsyncNotesRepository, INotesRepository
+from src.domain.values.points import Points
+from src.infra.database import (
+    AsyncDatabase,
+    AsyncSessionScope,
+    Database,
+    SessionScope,
+)
+from src.infra.orm import ORMNote, truncate_timestamp
+from src.infra.repository.orm_statistics import update_statistics
+from src.infra.statements import insert_on_conflict_do_nothing
+
+
+# Операции над сессией общие для синхронного и асинхронного репозиториев:
+# второй выполняет их через AsyncSession.run_sync.
+
+
+def _add(session: Session, note: NoteEntity) -> None:
+    stmt = (
+        insert_on_conflict_do_nothing(
+            session,
+            ORMNote,
+            *ORMNotesRepository.UNIQUE_KEY,
+        )
+        .values(ORMNote.values_from_entity(note))
+        .returning(ORMNote.oid)
+    )
+    inserted_oid = session.scalar(stmt)
+    if inserted_oid is None:
+        raise NonUniqueNoteBedtimeDateException(note.points.bedtime_date)
+    update_statistics(session, [note])
+
+
+def _add_many(session: Session, notes: list[NoteEntity]) -> set[NoteEntity]:
+    stmt = insert_on_conflict_do_nothing(
+        session,
+        ORMNote.__table__,
+        *ORMNotesRepository.UNIQUE_KEY,
+    ).returning(ORMNote.bedtime_date, ORMNote.owner_oid)
+    inserted = set(
+        session.execute(
+            stmt,
+            [ORMNote.values_from_entity(note) for note in notes],
+        ).tuples(),
+    )
+    not_added = {
+        note
+        for note in notes
+        if (note.points.bedtime_date, note.owner_oid) not in inserted
+    }
+    update_statistics(session, (note for note in notes if note not in not_added))
+    return not_added
+
+
+def _update(session: Session, note: NoteEntity) -> NoteEntity | None:
+    stmt = (
+        select(ORMNote)
+        .where(ORMNote.owner_oid == note.owner_oid)
+        .where(ORMNote.bedtime_date == note.points.bedtime_date)
+        .with_for_update()
+    )
+    updated = session.scalar(stmt)
+    if updated is None:
+        return None
+
+    previous = updated.to_entity()
+    updated.went_to_bed = note.points.went_to_bed_minutes
+    updated.fell_asleep = note.points.fell_asleep_minutes
+    updated.woke_up = note.points.woke_up_minutes
+    updated.got_up = note.points.got_up_minutes
+    updated.no_sleep = note.points.no_sleep_minutes
+    update_statistics(session, [previous], sign=-1)
+    update_statistics(session, [note])
+    return previous
+
+
+def _delete(
+    session: Session,
+    owner_oid: UUID,
+    bedtime_date: date,
+) -> NoteEntity | None:
+    stmt = (
+        delete(ORMNote)
+        .where(ORMNote.owner_oid == owner_oid)
+        .where(ORMNote.bedtime_date == bedtime_date)
+        .returning(ORMNote)
+    )
+    deleted = session.scalar(stmt)
+    if deleted is None:
+        return None
+
+    note = deleted.to_entity()
+    update_statistics(session, [note], sign=-1)
+    return note
+
+
+# Чтения выбирают колонки notes через Core и создают NoteEntity прямо из
+# строк: без экземпляров ORMNote, identity map и отслеживания изменений.
+_NOTES = ORMNote.__table__
+_NOTE_COLUMNS = (
+    _NOTES.c.oid,
+    _NOTES.c.owner_oid,
+    _NOTES.c.created_at,
+    _NOTES.c.updated_at,
+    _NOTES.c.bedtime_date,
+    _NOTES.c.went_to_bed,
+    _NOTES.c.fell_asleep,
+    _NOTES.c.woke_up,
+    _NOTES.c.got_up,
+    _NOTES.c.no_sleep,
+)
+
+
+def _select_notes() -> Select:
+    return select(*_NOTE_COLUMNS)
+
+
+def _note_from_row(row: Row) -> NoteEntity:
+    oid, owner_oid, created_at, updated_at, *points = row
+    return NoteEntity(
+        oid=oid,
+        owner_oid=owner_oid,
+        created_at=truncate_timestamp(created_at),
+        updated_at=truncate_timestamp(updated_at),
+        # Строки БД прошли проверку Points при записи.
+        points=Points.trusted(*points),
+    )
+
+
+def _get_by_oid(session: Session, oid: UUID) -> NoteEntity | None:
+    stmt = _select_notes().where(_NOTES.c.oid == oid).limit(1)
+    row = session.execute(stmt).first()
+
+    return None if row is None else _note_from_row(row)
+
+
+def _get_by_bedtime_date(
+    session: Session,
+    bedtime_date: date,
+    owner_oid: UUID,
+) -> NoteEntity | None:
+    stmt = (
+        _select_notes()
+        .where(_NOTES.c.owner_oid == owner_oid)
+        .where(_NOTES.c.bedtime_date == bedtime_date)
+        .limit(1)
+    )
+    row = session.execute(stmt).first()
+
+    return None if row is None else _note_from_row(row)
+
+
+def _get_all_notes(session: Session, owner_oid: UUID) -> set[NoteEntity]:
+    stmt = _select_notes().where(_NOTES.c.owner_oid == owner_oid)
+
+    return set(map(_note_from_row, session.execute(stmt)))
+
+
+def _select_owner_notes(owner_oid: UUID, batch_size: int) -> Select:
+    # yield_per включает stream_results: серверный курсор psycopg2/asyncpg
+    # работает только в транзакции, поэтому сессия не read-only.
+    return (
+        _select_notes()
+        .where(_NOTES.c.owner_oid == owner_oid)
+        .order_by(_NOTES.c.bedtime_date)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def _get_by_date_range(
+    session: Session,
+    owner_oid: UUID,
+    first_date: date,
+    last_date: date,
+) -> list[NoteEntity]:
+    stmt = (
+        _select_notes()
+        .where(_NOTES.c.owner_oid == owner_oid)
+        .where(_NOTES.c.bedtime_date.between(first_date, last_date))
+        .order_by(_NOTES.c.bedtime_date)
+    )
+    return list(map(_note_from_row, session.execute(stmt)))
+
+
+def _get_latest(
+    session: Session,
+    owner_oid: UUID,
+    limit: int,
+    before: date | None = None,
+) -> list[NoteEntity]:
+    stmt = (
+        _select_notes()
+        .where(_NOTES.c.owner_oid == owner_oid)
+        .order_by(_NOTES.c.bedtime_date.desc())
+        .limit(limit)
+    )
+    if before is not None:
+        stmt = stmt.where(_NOTES.c.bedtime_date < before)
+    return list(map(_note_from_row, session.execute(stmt)))
 
 
 @dataclass
 class ORMNotesRepository(INotesRepository):
-    database: Database
+    UNIQUE_KEY: ClassVar[tuple[str, str]] = ("bedtime_date", "owner_oid")
+    STREAM_BATCH_SIZE: ClassVar[int] = 1000
+
+    database: Database | SessionScope
 
     def add(self: Self, note: NoteEntity) -> None:
         with self.database.get_session() as session:
-            session.add(ORMNote.from_entity(note))
+            _add(session, note)
 
-    def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
-        stmt = select(ORMNote).where(ORMNote.oid == oid).limit(1)
+    def add_many(self: Self, notes: Iterable[NoteEntity]) -> set[NoteEntity]:
+        notes = list(notes)
+        if not notes:
+            return set()
 
         with self.database.get_session() as session:
-            result = session.scalar(stmt)
+            return _add_many(session, notes)
 
-        if isinstance(result, ORMNote):
-            return result.to_entity()
-        return None
+    def update(self: Self, note: NoteEntity) -> NoteEntity | None:
+        with self.database.get_session() as session:
+            return _update(session, note)
+
+    def delete(self: Self, owner_oid: UUID, bedtime_date: date) -> NoteEntity | None:
+        with self.database.get_session() as session:
+            return _delete(session, owner_oid, bedtime_date)
+
+    def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
+        with self.database.get_read_only_session() as session:
+            return _get_by_oid(session, oid)
 
     def get_by_bedtime_date(
         self: Self,
         bedtime_date: date,
         owner_oid: UUID,
     ) -> NoteEntity | None:
-        stmt = (
-            select(ORMNote)
-            .where(ORMNote.owner_oid == owner_oid)
-            .where(ORMNote.bedtime_date == bedtime_date)
-            .limit(1)
-        )
-        with self.database.get_session() as session:
-            result = session.scalar(stmt)
-
-        if isinstance(result, ORMNote):
-            return result.to_entity()
-        return None
+        with self.database.get_read_only_session() as session:
+            return _get_by_bedtime_date(session, bedtime_date, owner_oid)
 
     def get_all_notes(self: Self, owner_oid: UUID) -> set[NoteEntity]:
-        stmt = select(ORMNote).where(ORMNote.owner_oid == owner_oid)
+        with self.database.get_read_only_session() as session:
+            return _get_all_notes(session, owner_oid)
 
+    def iter_notes(
+        self: Self,
+        owner_oid: UUID,
+    ) -> Generator[NoteEntity, None, None]:
+        stmt = _select_owner_notes(owner_oid, self.STREAM_BATCH_SIZE)
         with self.database.get_session() as session:
-            result = session.scalars(stmt).all()
+            for row in session.execute(stmt):
+                yield _note_from_row(row)
+
+    def get_by_date_range(
+        self: Self,
+        owner_oid: UUID,
+        first_date: date,
+        last_date: date,
+    ) -> list[NoteEntity]:
+        with self.database.get_read_only_session() as session:
+            return _get_by_date_range(session, owner_oid, first_date, last_date)
+
+    def get_latest(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        before: date | None = None,
+    ) -> list[NoteEntity]:
+        with self.database.get_read_only_session() as session:
+            return _get_latest(session, owner_oid, limit, before)
+
+
+@dataclass
+class AsyncORMNotesRepository(IAsyncNotesRepository):
+    database: AsyncDatabase | AsyncSessionScope
+
+    async def add(self: Self, note: NoteEntity) -> None:
+        async with self.database.get_session() as session:
+            await session.run_sync(_add, note)
+
+    async def add_many(self: Self, notes: Iterable[NoteEntity]) -> set[NoteEntity]:
+        notes = list(notes)
+        if not notes:
+            return set()
 
-        return {note.to_entity() for note in result if isinstance(note, ORMNote)}
+        async with self.database.get_session() as session:
+            return await session.run_sync(_add_many, notes)
+
+    async def update(self: Self, note: NoteEntity) -> NoteEntity | None:
+        async with self.database.get_session() as session:
+            return await session.run_sync(_update, note)
+
+    async def delete(
+        self: Self,
+        owner_oid: UUID,
+        bedtime_date: date,
+    ) -> NoteEntity | None:
+        async with self.database.get_session() as session:
+            return await session.run_sync(_delete, owner_oid, bedtime_date)
+
+    async def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
+        async with self.database.get_read_only_session() as session:
+            return await session.run_sync(_get_by_oid, oid)
+
+    async def get_by_bedtime_date(
+        self: Self,
+        bedtime_date: date,
+        owner_oid: UUID,
+    ) -> NoteEntity | None:
+        async with self.database.get_read_only_session() as session:
+            return await session.run_sync(
+                _get_by_bedtime_date,
+                bedtime_date,
+                owner_oid,
+            )
+
+    async def get_all_notes(self: Self, owner_oid: UUID) -> set[NoteEntity]:
+        async with self.database.get_read_only_session() as session:
+            return await session.run_sync(_get_all_notes, owner_oid)
+
+    async def iter_notes(self: Self, owner_oid: UUID) -> AsyncIterator[NoteEntity]:
+        stmt = _select_owner_notes(owner_oid, ORMNotesRepository.STREAM_BATCH_SIZE)
+        async with self.database.get_session() as session:
+            async for row in await session.stream(stmt):
+                yield _note_from_row(row)
+
+    async def get_by_date_range(
+        self: Self,
+        owner_oid: UUID,
+        first_date: date,
+        last_date: date,
+    ) -> list[NoteEntity]:
+        async with self.database.get_read_only_session() as session:
+            return await session.run_sync(
+                _get_by_date_range,
+                owner_oid,
+                first_date,
+                last_date,
+            )
+
+    async def get_latest(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        before: date | None = None,
+    ) -> list[NoteEntity]:
+        async with self.database.get_read_only_session() as session:
+            return await session.run_sync(_get_latest, owner_oid, limit, before)
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from typing import Any, cast
+from typing_extensions import Self
+from uuid import UUID
+
+from sqlalchemy import CursorResult, delete, update
+from sqlalchemy.orm import Session
+
+from src.domain.services import (
+    IAsyncRefreshTokensRepository,
+    IRefreshTokensRepository,
+)
+from src.infra.database import (
+    AsyncDatabase,
+    AsyncSessionScope,
+    Database,
+    SessionScope,
+)
+from src.infra.orm import ORMRefreshTokenFamily
+
+
+def _add_family(
+    session: Session,
+    family_oid: UUID,
+    owner_oid: UUID,
+    jti: str,
+    exp: float,
+) -> None:
+    session.add(
+        ORMRefreshTokenFamily(oid=family_oid, owner_oid=owner_oid, jti=jti, exp=exp),
+    )
+
+
+def _rotate(
+    session: Session,
+    family_oid: UUID,
+    jti: str,
+    new_jti: str,
+    exp: float,
+) -> bool:
+    # Сравнение и замена jti одним UPDATE: из двух одновременных ротаций
+    # одного токена строку изменит только одна.
+    stmt = (
+        update(ORMRefreshTokenFamily)
+        .where(ORMRefreshTokenFamily.oid == family_oid)
+        .where(ORMRefreshTokenFamily.jti == jti)
+        .values(jti=new_jti, exp=exp)
+    )
+    return cast(CursorResult[Any], session.execute(stmt)).rowcount == 1
+
+
+def _delete_family(session: Session, family_oid: UUID) -> bool:
+    family = ORMRefreshTokenFamily.oid == family_oid
+    stmt = delete(ORMRefreshTokenFamily).where(family)
+    return cast(CursorResult[Any], session.execute(stmt)).rowcount == 1
+
+
+def _delete_expired(session: Session, now: float) -> int:
+    stmt = delete(ORMRefreshTokenFamily).where(ORMRefreshTokenFamily.exp <= now)
+    return cast(CursorResult[Any], session.execute(stmt)).rowcount
+
+
+@dataclass
+class ORMRefreshTokensRepository(IRefreshTokensRepository):
+    database: Database | SessionScope
+
+    def add_family(
+        self: Self,
+        family_oid: UUID,
+        owner_oid: UUID,
+        jti: str,
+        exp: float,
+    ) -> None:
+        with self.database.get_session() as session:
+            _add_family(session, family_oid, owner_oid, jti, exp)
+
+    def rotate(
+        self: Self,
+        family_oid: UUID,
+        jti: str,
+        new_jti: str,
+        exp: float,
+    ) -> bool:
+        with self.database.get_session() as session:
+            return _rotate(session, family_oid, jti, new_jti, exp)
+
+    def delete_family(self: Self, family_oid: UUID) -> bool:
+        with self.database.get_session() as session:
+            return _delete_family(session, family_oid)
+
+    def delete_expired(self: Self, now: float) -> int:
+        with self.database.get_session() as session:
+            return _delete_expired(session, now)
+
+
+@dataclass
+class AsyncORMRefreshTokensRepository(IAsyncRefreshTokensRepository):
+    database: AsyncDatabase | AsyncSessionScope
+
+    async def add_family(
+        self: Self,
+        family_oid: UUID,
+        owner_oid: UUID,
+        jti: str,
+        exp: float,
+    ) -> None:
+        async with self.database.get_session() as session:
+            await session.run_sync(_add_family, family_oid, owner_oid, jti, exp)
+
+    async def rotate(
+        self: Self,
+        family_oid: UUID,
+        jti: str,
+        new_jti: str,
+        exp: float,
+    ) -> bool:
+        async with self.database.get_session() as session:
+            return await session.run_sync(_rotate, family_oid, jti, new_jti, exp)
+
+    async def delete_family(self: Self, family_oid: UUID) -> bool:
+        async with self.database.get_session() as session:
+            return await session.run_sync(_delete_family, family_oid)
+
+    async def delete_expired(self: Self, now: float) -> int:
+        async with self.database.get_session() as session:
+            return await session.run_sync(_delete_expired, now)
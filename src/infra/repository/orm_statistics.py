@@ -0,0 +1,209 @@
+from dataclasses import asdict, dataclass
+from datetime import date
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, ClassVar, Iterable, cast
+from typing_extensions import Self
+from uuid import UUID
+
+from sqlalchemy import (
+    CursorResult,
+    Select,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from src.domain.entities import NoteEntity
+from src.domain.services import (
+    IAsyncStatisticsRepository,
+    IStatisticsRepository,
+    Period,
+    PeriodStatistics,
+)
+from src.infra.database import (
+    AsyncDatabase,
+    AsyncSessionScope,
+    Database,
+    SessionScope,
+)
+from src.infra.orm import ORMNote, ORMNoteStatistics
+from src.infra.statements import insert_on_conflict_add, month_start, week_start
+
+
+_PERIOD_STARTS = {Period.WEEK: week_start, Period.MONTH: month_start}
+
+
+def _select_period_statistics(
+    period: Period,
+    owner_oid: UUID | None = None,
+) -> Select:
+    """
+    Агрегация записей по периодам на стороне БД, колонки как в ORMNoteStatistics.
+    """
+    minutes_in_day = literal(24 * 60)
+    sleep = (ORMNote.woke_up - ORMNote.fell_asleep + minutes_in_day) % minutes_in_day
+    in_bed = (ORMNote.got_up - ORMNote.went_to_bed + minutes_in_day) % minutes_in_day
+    no_sleep = ORMNote.no_sleep
+    sleep_minus_no_sleep = case((no_sleep >= sleep, 0), else_=sleep - no_sleep)
+
+    period_start = _PERIOD_STARTS[period](ORMNote.bedtime_date)
+    stmt = select(
+        ORMNote.owner_oid,
+        literal(period.value),
+        period_start,
+        func.count(),
+        func.sum(sleep),
+        func.sum(in_bed),
+        func.sum(no_sleep),
+        func.sum(sleep_minus_no_sleep),
+    ).group_by(ORMNote.owner_oid, period_start)
+    if owner_oid is None:
+        return stmt
+    return stmt.where(ORMNote.owner_oid == owner_oid)
+
+
+def update_statistics(
+    session: Session,
+    notes: Iterable[NoteEntity],
+    sign: int = 1,
+) -> None:
+    """
+    Добавляет (sign=1) или вычитает (sign=-1) записи из статистики периодов
+    в транзакции сессии, в которой изменяются сами записи.
+    """
+    rows: list[dict[str, Any]] = []
+    owners = set()
+    for owner_oid, grouped_notes in groupby(
+        sorted(notes, key=lambda note: str(note.owner_oid)),
+        key=attrgetter("owner_oid"),
+    ):
+        owners.add(owner_oid)
+        owner_notes = list(grouped_notes)
+        for period in Period:
+            for statistics in PeriodStatistics.from_notes(owner_notes, period):
+                if sign < 0:
+                    statistics = -statistics
+                rows.append(
+                    {"owner_oid": owner_oid, "period": period, **asdict(statistics)},
+                )
+    if not rows:
+        return
+
+    session.execute(
+        insert_on_conflict_add(
+            session,
+            ORMNoteStatistics.__table__,
+            ORMStatisticsRepository.UNIQUE_KEY,
+            ORMStatisticsRepository.SUMMED_COLUMNS,
+        ),
+        rows,
+    )
+    if sign < 0:
+        session.execute(
+            delete(ORMNoteStatistics)
+            .where(ORMNoteStatistics.owner_oid.in_(owners))
+            .where(ORMNoteStatistics.notes_count <= 0),
+        )
+
+
+def _get_statistics(
+    session: Session,
+    owner_oid: UUID,
+    period: Period,
+    first_date: date,
+    last_date: date,
+) -> list[PeriodStatistics]:
+    stmt = (
+        select(ORMNoteStatistics)
+        .where(ORMNoteStatistics.owner_oid == owner_oid)
+        .where(ORMNoteStatistics.period == period)
+        .where(
+            ORMNoteStatistics.period_start.between(
+                period.start_of(first_date),
+                last_date,
+            ),
+        )
+        .order_by(ORMNoteStatistics.period_start)
+    )
+    result = session.scalars(stmt).all()
+
+    return [statistics.to_entity() for statistics in result]
+
+
+def _rebuild(session: Session, owner_oid: UUID | None = None) -> int:
+    stmt = delete(ORMNoteStatistics)
+    if owner_oid is not None:
+        stmt = stmt.where(ORMNoteStatistics.owner_oid == owner_oid)
+
+    rebuilt = 0
+    session.execute(stmt)
+    for period in Period:
+        result = session.execute(
+            insert(ORMNoteStatistics).from_select(
+                (
+                    *ORMStatisticsRepository.UNIQUE_KEY,
+                    *ORMStatisticsRepository.SUMMED_COLUMNS,
+                ),
+                _select_period_statistics(period, owner_oid),
+            ),
+        )
+        rebuilt += cast(CursorResult[Any], result).rowcount
+    return rebuilt
+
+
+@dataclass
+class ORMStatisticsRepository(IStatisticsRepository):
+    UNIQUE_KEY: ClassVar[tuple[str, ...]] = ("owner_oid", "period", "period_start")
+    SUMMED_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "notes_count",
+        "sleep",
+        "in_bed",
+        "no_sleep",
+        "sleep_minus_no_sleep",
+    )
+
+    database: Database | SessionScope
+
+    def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        with self.database.get_read_only_session() as session:
+            return _get_statistics(session, owner_oid, period, first_date, last_date)
+
+    def rebuild(self: Self, owner_oid: UUID | None = None) -> int:
+        with self.database.get_session() as session:
+            return _rebuild(session, owner_oid)
+
+
+@dataclass
+class AsyncORMStatisticsRepository(IAsyncStatisticsRepository):
+    database: AsyncDatabase | AsyncSessionScope
+
+    async def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        async with self.database.get_read_only_session() as session:
+            return await session.run_sync(
+                _get_statistics,
+                owner_oid,
+                period,
+                first_date,
+                last_date,
+            )
+
+    async def rebuild(self: Self, owner_oid: UUID | None = None) -> int:
+        async with self.database.get_session() as session:
+            return await session.run_sync(_rebuild, owner_oid)
@@ -1,30 +1,89 @@
 from dataclasses import dataclass
 from typing_extensions import Self
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
 
 from src.domain.entities import UserEntity
-from src.domain.services import IUsersRepository
-from src.infra.database import Database
+from src.domain.services import IAsyncUsersRepository, IUsersRepository
+from src.infra.database import (
+    AsyncDatabase,
+    AsyncSessionScope,
+    Database,
+    SessionScope,
+)
 from src.infra.orm import ORMUser
+from src.infra.statements import insert_on_conflict_do_nothing
+
+
+def _get_by_username(session: Session, username: str) -> UserEntity | None:
+    stmt = select(ORMUser).where(ORMUser.username == username).limit(1)
+    result = session.scalar(stmt)
+
+    if isinstance(result, ORMUser):
+        return result.to_entity()
+    return None
+
+
+def _add_user(session: Session, user: UserEntity) -> None:
+    session.add(ORMUser.from_entity(user))
+
+
+def _add_user_if_absent(session: Session, user: UserEntity) -> bool:
+    stmt = (
+        insert_on_conflict_do_nothing(session, ORMUser, "username")
+        .values(ORMUser.values_from_entity(user))
+        .returning(ORMUser.username)
+    )
+    return session.scalar(stmt) is not None
+
+
+def _update_password(session: Session, username: str, password: str) -> None:
+    stmt = update(ORMUser).where(ORMUser.username == username)
+    session.execute(stmt.values(password=password))
 
 
 @dataclass
 class ORMUsersRepository(IUsersRepository):
-    database: Database
+    database: Database | SessionScope
 
     def get_by_username(self: Self, username: str) -> UserEntity | None:
-        stmt = select(ORMUser).where(ORMUser.username == username).limit(1)
+        with self.database.get_read_only_session() as session:
+            return _get_by_username(session, username)
 
+    def add_user(self: Self, user: UserEntity) -> None:
         with self.database.get_session() as session:
-            result = session.scalar(stmt)
+            _add_user(session, user)
 
-        if isinstance(result, ORMUser):
-            return result.to_entity()
-        return None
+    def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        with self.database.get_session() as session:
+            return _add_user_if_absent(session, user)
 
-    def add_user(self: Self, user: UserEntity) -> None:
+    def update_password(self: Self, username: str, password: str) -> None:
         with self.database.get_session() as session:
-            session.add(ORMUser.from_entity(user))
+            _update_password(session, username, password)
 
     def delete_user(self: Self, username: str) -> None: ...
+
+
+@dataclass
+class AsyncORMUsersRepository(IAsyncUsersRepository):
+    database: AsyncDatabase | AsyncSessionScope
+
+    async def get_by_username(self: Self, username: str) -> UserEntity | None:
+        async with self.database.get_read_only_session() as session:
+            return await session.run_sync(_get_by_username, username)
+
+    async def add_user(self: Self, user: UserEntity) -> None:
+        async with self.database.get_session() as session:
+            await session.run_sync(_add_user, user)
+
+    async def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        async with self.database.get_session() as session:
+            return await session.run_sync(_add_user_if_absent, user)
+
+    async def update_password(self: Self, username: str, password: str) -> None:
+        async with self.database.get_session() as session:
+            await session.run_sync(_update_password, username, password)
+
+    async def delete_user(self: Self, username: str) -> None: ...
@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from itertools import islice
+from typing import AsyncIterator, ClassVar, Iterable
+from typing_extensions import Self
+from uuid import UUID
+
+from anyio.to_thread import run_sync
+
+from src.domain.entities import NoteEntity, UserEntity
+from src.domain.services import (
+    IAsyncNotesRepository,
+    IAsyncRefreshTokensRepository,
+    IAsyncStatisticsRepository,
+    IAsyncUsersRepository,
+    INotesRepository,
+    IRefreshTokensRepository,
+    IStatisticsRepository,
+    IUsersRepository,
+    Period,
+    PeriodStatistics,
+)
+
+
+# Асинхронный интерфейс поверх синхронных репозиториев: каждый вызов занимает
+# поток из пула anyio. Используются, когда ASYNC_DATABASE выключен, и в тестах
+# с репозиториями в памяти.
+
+
+@dataclass
+class ThreadPoolNotesRepository(IAsyncNotesRepository):
+    BATCH_SIZE: ClassVar[int] = 1000
+
+    repository: INotesRepository
+
+    async def add(self: Self, note: NoteEntity) -> None:
+        await run_sync(self.repository.add, note)
+
+    async def add_many(self: Self, notes: Iterable[NoteEntity]) -> set[NoteEntity]:
+        return await run_sync(self.repository.add_many, list(notes))
+
+    async def update(self: Self, note: NoteEntity) -> NoteEntity | None:
+        return await run_sync(self.repository.update, note)
+
+    async def delete(
+        self: Self,
+        owner_oid: UUID,
+        bedtime_date: date,
+    ) -> NoteEntity | None:
+        return await run_sync(self.repository.delete, owner_oid, bedtime_date)
+
+    async def get_by_oid(self: Self, oid: UUID) -> NoteEntity | None:
+        return await run_sync(self.repository.get_by_oid, oid)
+
+    async def get_by_bedtime_date(
+        self: Self,
+        bedtime_date: date,
+        owner_oid: UUID,
+    ) -> NoteEntity | None:
+        return await run_sync(
+            self.repository.get_by_bedtime_date,
+            bedtime_date,
+            owner_oid,
+        )
+
+    async def get_all_notes(self: Self, owner_oid: UUID) -> set[NoteEntity]:
+        return await run_sync(self.repository.get_all_notes, owner_oid)
+
+    async def iter_notes(self: Self, owner_oid: UUID) -> AsyncIterator[NoteEntity]:
+        """Перебор в пуле потоков пачками по BATCH_SIZE записей."""
+        notes = self.repository.iter_notes(owner_oid)
+        try:
+            while batch := await run_sync(list, islice(notes, self.BATCH_SIZE)):
+                for note in batch:
+                    yield note
+        finally:
+            await run_sync(notes.close)
+
+    async def get_by_date_range(
+        self: Self,
+        owner_oid: UUID,
+        first_date: date,
+        last_date: date,
+    ) -> list[NoteEntity]:
+        return await run_sync(
+            self.repository.get_by_date_range,
+            owner_oid,
+            first_date,
+            last_date,
+        )
+
+    async def get_latest(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        before: date | None = None,
+    ) -> list[NoteEntity]:
+        return await run_sync(self.repository.get_latest, owner_oid, limit, before)
+
+
+@dataclass
+class ThreadPoolStatisticsRepository(IAsyncStatisticsRepository):
+    repository: IStatisticsRepository
+
+    async def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        return await run_sync(
+            self.repository.get_statistics,
+            owner_oid,
+            period,
+            first_date,
+            last_date,
+        )
+
+    async def rebuild(self: Self, owner_oid: UUID | None = None) -> int:
+        return await run_sync(partial(self.repository.rebuild, owner_oid))
+
+
+@dataclass
+class ThreadPoolUsersRepository(IAsyncUsersRepository):
+    repository: IUsersRepository
+
+    async def get_by_username(self: Self, username: str) -> UserEntity | None:
+        return await run_sync(self.repository.get_by_username, username)
+
+    def is_known_username(self: Self, username: str) -> bool:
+        return self.repository.is_known_username(username)
+
+    async def add_user(self: Self, user: UserEntity) -> None:
+        await run_sync(self.repository.add_user, user)
+
+    async def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        return await run_sync(self.repository.add_user_if_absent, user)
+
+    async def update_password(self: Self, username: str, password: str) -> None:
+        await run_sync(self.repository.update_password, username, password)
+
+    async def delete_user(self: Self, username: str) -> None:
+        await run_sync(self.repository.delete_user, username)
+
+
+@dataclass
+class ThreadPoolRefreshTokensRepository(IAsyncRefreshTokensRepository):
+    repository: IRefreshTokensRepository
+
+    async def add_family(
+        self: Self,
+        family_oid: UUID,
+        owner_oid: UUID,
+        jti: str,
+        exp: float,
+    ) -> None:
+        await run_sync(self.repository.add_family, family_oid, owner_oid, jti, exp)
+
+    async def rotate(
+        self: Self,
+        family_oid: UUID,
+        jti: str,
+        new_jti: str,
+        exp: float,
+    ) -> bool:
+        return await run_sync(self.repository.rotate, family_oid, jti, new_jti, exp)
+
+    async def delete_family(self: Self, family_oid: UUID) -> bool:
+        return await run_sync(self.repository.delete_family, family_oid)
+
+    async def delete_expired(self: Self, now: float) -> int:
+        return await run_sync(self.repository.delete_expired, now)
@@ -0,0 +1,102 @@
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import Date, FromClause
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+
+_DIALECT_INSERTS: dict[str, Callable[[Any], Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_on_conflict_do_nothing(
+    session: Session,
+    entity: Any,
+    *index_elements: str,
+) -> postgresql.Insert | sqlite.Insert:
+    """
+    INSERT ... ON CONFLICT (index_elements) DO NOTHING для диалекта сессии.
+    """
+    dialect_insert = _DIALECT_INSERTS[session.get_bind().dialect.name]
+    return dialect_insert(entity).on_conflict_do_nothing(
+        index_elements=index_elements or None,
+    )
+
+
+def insert_on_conflict_add(
+    session: Session,
+    table: FromClause,
+    index_elements: Iterable[str],
+    summed_columns: Iterable[str],
+) -> postgresql.Insert | sqlite.Insert:
+    """
+    INSERT ... ON CONFLICT (index_elements) DO UPDATE, прибавляющий значения
+    summed_columns к уже сохраненным.
+    """
+    stmt = _DIALECT_INSERTS[session.get_bind().dialect.name](table)
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={
+            column: table.c[column] + stmt.excluded[column]
+            for column in summed_columns
+        },
+    )
+
+
+class week_start(FunctionElement):  # noqa: N801
+    """Понедельник ISO недели для даты."""
+
+    type = Date()  # noqa: A003
+    inherit_cache = True
+
+
+class month_start(FunctionElement):  # noqa: N801
+    """Первое число месяца для даты."""
+
+    type = Date()  # noqa: A003
+    inherit_cache = True
+
+
+@compiles(week_start, "postgresql")
+def _week_start_postgresql(
+    element: week_start,
+    compiler: SQLCompiler,
+    **kw: Any,
+) -> str:
+    value = compiler.process(element.clauses, **kw)
+    return f"CAST(date_trunc('week', {value}) AS DATE)"
+
+
+@compiles(week_start, "sqlite")
+def _week_start_sqlite(
+    element: week_start,
+    compiler: SQLCompiler,
+    **kw: Any,
+) -> str:
+    value = compiler.process(element.clauses, **kw)
+    return f"date({value}, '-' || ((strftime('%w', {value}) + 6) % 7) || ' days')"
+
+
+@compiles(month_start, "postgresql")
+def _month_start_postgresql(
+    element: month_start,
+    compiler: SQLCompiler,
+    **kw: Any,
+) -> str:
+    value = compiler.process(element.clauses, **kw)
+    return f"CAST(date_trunc('month', {value}) AS DATE)"
+
+
+@compiles(month_start, "sqlite")
+def _month_start_sqlite(
+    element: month_start,
+    compiler: SQLCompiler,
+    **kw: Any,
+) -> str:
+    value = compiler.process(element.clauses, **kw)
+    return f"date({value}, 'start of month')"
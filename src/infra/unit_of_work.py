@@ -0,0 +1,189 @@
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing_extensions import Self
+
+from anyio.to_thread import run_sync
+
+from src.domain.services import IAsyncUnitOfWork, IUnitOfWork
+from src.infra.database import (
+    AsyncDatabase,
+    AsyncSessionScope,
+    Database,
+    SessionScope,
+)
+from src.infra.repository import (
+    AsyncCachedUsersRepository,
+    AsyncORMNotesRepository,
+    AsyncORMRefreshTokensRepository,
+    AsyncORMStatisticsRepository,
+    AsyncORMUsersRepository,
+    ORMNotesRepository,
+    ORMRefreshTokensRepository,
+    ORMStatisticsRepository,
+    ORMUsersRepository,
+    ThreadPoolNotesRepository,
+    ThreadPoolRefreshTokensRepository,
+    ThreadPoolStatisticsRepository,
+    ThreadPoolUsersRepository,
+    UsersCache,
+)
+
+
+@dataclass
+class ORMUnitOfWork(IUnitOfWork):
+    """Одна сессия Database.get_session на все репозитории блока with."""
+
+    database: Database
+
+    _exit_stack: ExitStack = field(default_factory=ExitStack, init=False, repr=False)
+
+    def __enter__(self: Self) -> Self:
+        session = self._exit_stack.enter_context(self.database.get_session())
+        scope = SessionScope(session)
+        self.notes = ORMNotesRepository(scope)
+        self.statistics = ORMStatisticsRepository(scope)
+        self.users = ORMUsersRepository(scope)
+        self.refresh_tokens = ORMRefreshTokensRepository(scope)
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._exit_stack.__exit__(exc_type, exc_val, exc_tb)
+
+
+@dataclass
+class ORMReadOnlyUnitOfWork(IUnitOfWork):
+    """
+    Единица работы для чтения: репозитории на Database.get_read_only_session,
+    каждый запрос выполняется без BEGIN/COMMIT.
+    """
+
+    database: Database
+
+    def __enter__(self: Self) -> Self:
+        self.notes = ORMNotesRepository(self.database)
+        self.statistics = ORMStatisticsRepository(self.database)
+        self.users = ORMUsersRepository(self.database)
+        self.refresh_tokens = ORMRefreshTokensRepository(self.database)
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        pass
+
+
+@dataclass
+class AsyncORMUnitOfWork(IAsyncUnitOfWork):
+    database: AsyncDatabase
+
+    _exit_stack: AsyncExitStack = field(
+        default_factory=AsyncExitStack,
+        init=False,
+        repr=False,
+    )
+
+    async def __aenter__(self: Self) -> Self:
+        scope = AsyncSessionScope(
+            await self._exit_stack.enter_async_context(self.database.get_session()),
+        )
+        self.notes = AsyncORMNotesRepository(scope)
+        self.statistics = AsyncORMStatisticsRepository(scope)
+        self.users = AsyncORMUsersRepository(scope)
+        self.refresh_tokens = AsyncORMRefreshTokensRepository(scope)
+        return self
+
+    async def __aexit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+
+
+@dataclass
+class AsyncORMReadOnlyUnitOfWork(IAsyncUnitOfWork):
+    database: AsyncDatabase
+
+    async def __aenter__(self: Self) -> Self:
+        self.notes = AsyncORMNotesRepository(self.database)
+        self.statistics = AsyncORMStatisticsRepository(self.database)
+        self.users = AsyncORMUsersRepository(self.database)
+        self.refresh_tokens = AsyncORMRefreshTokensRepository(self.database)
+        return self
+
+    async def __aexit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        pass
+
+
+@dataclass
+class ThreadPoolUnitOfWork(IAsyncUnitOfWork):
+    """Синхронная единица работы, вызовы которой выполняются в пуле потоков."""
+
+    unit_of_work: IUnitOfWork
+
+    async def __aenter__(self: Self) -> Self:
+        await run_sync(self.unit_of_work.__enter__)
+        self.notes = ThreadPoolNotesRepository(self.unit_of_work.notes)
+        self.statistics = ThreadPoolStatisticsRepository(
+            self.unit_of_work.statistics,
+        )
+        self.users = ThreadPoolUsersRepository(self.unit_of_work.users)
+        self.refresh_tokens = ThreadPoolRefreshTokensRepository(
+            self.unit_of_work.refresh_tokens,
+        )
+        return self
+
+    async def __aexit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await run_sync(self.unit_of_work.__exit__, exc_type, exc_val, exc_tb)
+
+
+@dataclass
+class AsyncCachedUsersUnitOfWork(IAsyncUnitOfWork):
+    """
+    Единица работы с пользователями через UsersCache. Измененные имена
+    удаляются из кэша после выхода из unit_of_work: иначе параллельный
+    запрос мог бы до фиксации прочитать и закэшировать прежнюю строку.
+    """
+
+    unit_of_work: IAsyncUnitOfWork
+    cache: UsersCache
+
+    async def __aenter__(self: Self) -> Self:
+        await self.unit_of_work.__aenter__()
+        self.notes = self.unit_of_work.notes
+        self.statistics = self.unit_of_work.statistics
+        self.refresh_tokens = self.unit_of_work.refresh_tokens
+        self._users = AsyncCachedUsersRepository(self.unit_of_work.users, self.cache)
+        self.users = self._users
+        return self
+
+    async def __aexit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        try:
+            await self.unit_of_work.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._users.invalidate_written()
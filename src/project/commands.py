@@ -0,0 +1,110 @@
+"""
+Служебные команды приложения.
+
+Запуск: python -m src.project.commands <команда> [аргументы]
+"""
+
+from argparse import ArgumentParser, Namespace
+from statistics import median
+from sys import stdout
+from time import perf_counter, time
+from uuid import UUID
+
+from src.domain.services import IStatisticsRepository, IUnitOfWork
+from src.project.containers import get_container
+from src.service_layer.services import UserAuthenticationService
+
+
+def rebuild_statistics(arguments: Namespace) -> None:
+    container = get_container()
+    repository: IStatisticsRepository = container.resolve(IStatisticsRepository)
+    rebuilt = repository.rebuild(arguments.owner_oid)
+    stdout.write(f"Пересчитано периодов статистики: {rebuilt}\n")
+
+
+def delete_expired_refresh_tokens(arguments: Namespace) -> None:
+    container = get_container()
+    with container.resolve(IUnitOfWork) as unit_of_work:
+        deleted = unit_of_work.refresh_tokens.delete_expired(time())
+    stdout.write(f"Удалено истекших семейств refresh токенов: {deleted}\n")
+
+
+def measure_password_hashing(rounds: int, samples: int) -> float:
+    """Медиана времени одного хэша bcrypt с данной стоимостью, секунды."""
+    durations = []
+    for _ in range(samples):
+        started_at = perf_counter()
+        UserAuthenticationService.hash_password("calibration-password", rounds)
+        durations.append(perf_counter() - started_at)
+    return median(durations)
+
+
+def calibrate_password_hashing(arguments: Namespace) -> None:
+    """
+    Наибольшая стоимость bcrypt, при которой хэш на этой машине укладывается
+    в target-ms. Каждый шаг стоимости удваивает время, перебор идет до первого
+    превышения.
+    """
+    target = arguments.target_ms / 1000
+    chosen = None
+    for rounds in range(4, 32):
+        duration = measure_password_hashing(rounds, arguments.samples)
+        stdout.write(f"rounds={rounds:>2}: {duration * 1000:9.1f} мс\n")
+        if duration > target:
+            break
+        chosen = rounds
+
+    if chosen is None:
+        stdout.write(
+            f"Даже минимальная стоимость дольше {arguments.target_ms} мс.\n",
+        )
+        return
+    stdout.write(f"PASSWORD_HASHING_ROUNDS={chosen}\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(prog="python -m src.project.commands")
+    commands = parser.add_subparsers(required=True)
+
+    rebuild_parser = commands.add_parser(
+        "rebuild-statistics",
+        help="Пересчитать статистику периодов по сохраненным записям.",
+    )
+    rebuild_parser.add_argument(
+        "--owner-oid",
+        type=UUID,
+        default=None,
+        help="Только для одного пользователя.",
+    )
+    rebuild_parser.set_defaults(handler=rebuild_statistics)
+
+    refresh_tokens_parser = commands.add_parser(
+        "delete-expired-refresh-tokens",
+        help="Удалить семейства refresh токенов с истекшим exp.",
+    )
+    refresh_tokens_parser.set_defaults(handler=delete_expired_refresh_tokens)
+
+    calibrate_parser = commands.add_parser(
+        "calibrate-password-hashing",
+        help="Подобрать PASSWORD_HASHING_ROUNDS под время хэша на этой машине.",
+    )
+    calibrate_parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250,
+        help="Допустимое время одного хэша, мс.",
+    )
+    calibrate_parser.add_argument(
+        "--samples",
+        type=int,
+        default=3,
+        help="Замеров на каждую стоимость.",
+    )
+    calibrate_parser.set_defaults(handler=calibrate_password_hashing)
+
+    arguments = parser.parse_args(argv)
+    arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    main()
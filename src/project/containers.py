@@ -2,18 +2,42 @@ from functools import lru_cache
 
 from punq import Container, Scope
 
-from src.domain.services import INotesRepository, IUsersRepository
-from src.infra.authorization import IUserTokenService, UserJWTService
-from src.infra.database import Database
+from src.domain.services import (
+    IAsyncUnitOfWork,
+    INotesRepository,
+    IStatisticsRepository,
+    IUnitOfWork,
+)
+from src.infra.authorization import (
+    AsyncRefreshTokenRotation,
+    IRevokedTokensStore,
+    IUserTokenService,
+    MemoryRevokedTokensStore,
+    UserJWTService,
+)
+from src.infra.database import AsyncDatabase, Database
 from src.infra.repository import (
     ORMNotesRepository,
-    ORMUsersRepository,
+    ORMStatisticsRepository,
+    UsersCache,
+)
+from src.infra.unit_of_work import (
+    AsyncCachedUsersUnitOfWork,
+    AsyncORMReadOnlyUnitOfWork,
+    AsyncORMUnitOfWork,
+    ORMReadOnlyUnitOfWork,
+    ORMUnitOfWork,
+    ThreadPoolUnitOfWork,
 )
 from src.project.settings import Settings
-from src.service_layer import Diary
-from src.service_layer.services.authentication import (
-    IUserAuthenticationService,
-    UserAuthenticationService,
+from src.service_layer import AsyncDiary
+from src.service_layer.services import (
+    AsyncUserAuthenticationService,
+    IAsyncUserAuthenticationService,
+    ILoginAttemptsStore,
+    LoginThrottle,
+    MemoryLoginAttemptsStore,
+    PasswordHashingPool,
 )
 
 
@@ -26,34 +50,130 @@ def _init_container() -> Container:
     container = Container()
 
     container.register(Settings, instance=Settings(), scope=Scope.singleton)
+    _register_databases(container)
+    _register_repositories(container)
+    _register_units_of_work(container)
+    _register_authorization(container)
+    _register_authentication(container)
+    _register_diary(container)
+
+    return container
 
-    def init_token_service() -> IUserTokenService:
-        settings = container.resolve(Settings)
-        return UserJWTService(settings)
 
+def _register_databases(container: Container) -> None:
     def init_database() -> Database:
         settings = container.resolve(Settings)
         return Database(url=settings.POSTGRES_DB_URL)
 
+    def init_async_database() -> AsyncDatabase:
+        settings = container.resolve(Settings)
+        return AsyncDatabase(url=settings.POSTGRES_ASYNC_DB_URL)
+
+    container.register(
+        Database,
+        factory=init_database,
+        scope=Scope.singleton,
+    )
+    container.register(
+        AsyncDatabase,
+        factory=init_async_database,
+        scope=Scope.singleton,
+    )
+
+
+def _register_repositories(container: Container) -> None:
     def init_notes_repository() -> INotesRepository:
         database = container.resolve(Database)
         return ORMNotesRepository(database)
 
-    def init_users_repository() -> IUsersRepository:
+    def init_statistics_repository() -> IStatisticsRepository:
         database = container.resolve(Database)
-        return ORMUsersRepository(database)
+        return ORMStatisticsRepository(database)
+
+    def init_users_cache() -> UsersCache:
+        settings = container.resolve(Settings)
+        return UsersCache(
+            max_size=settings.USERS_CACHE_SIZE,
+            ttl=settings.USERS_CACHE_TTL_SECONDS,
+        )
+
+    container.register(
+        INotesRepository,
+        factory=init_notes_repository,
+        scope=Scope.singleton,
+    )
+    container.register(
+        IStatisticsRepository,
+        factory=init_statistics_repository,
+        scope=Scope.singleton,
+    )
+    container.register(
+        UsersCache,
+        factory=init_users_cache,
+        scope=Scope.singleton,
+    )
+
 
-    def init_authentication_service() -> IUserAuthenticationService:
-        repository = container.resolve(IUsersRepository)
-        return UserAuthenticationService(repository)
+def _register_units_of_work(container: Container) -> None:
+    # Эндпоинты работают с асинхронными интерфейсами. При ASYNC_DATABASE
+    # это драйвер asyncpg, иначе синхронные репозитории в пуле потоков.
+    # Единица работы создается на запрос (get_unit_of_work), сервисы
+    # запроса получают ее репозитории через resolve(..., unit_of_work=...).
+    # Эндпоинты чтения берут read_only=True: запросы без BEGIN/COMMIT.
+
+    def init_unit_of_work(read_only: bool = False) -> IUnitOfWork:
+        database = container.resolve(Database)
+        if read_only:
+            return ORMReadOnlyUnitOfWork(database)
+        return ORMUnitOfWork(database)
 
-    def init_diary_service() -> Diary:
-        repository = container.resolve(INotesRepository)
-        return Diary(repository)
+    def init_async_unit_of_work(read_only: bool = False) -> IAsyncUnitOfWork:
+        unit_of_work: IAsyncUnitOfWork
+        if not container.resolve(Settings).ASYNC_DATABASE:
+            unit_of_work = ThreadPoolUnitOfWork(
+                container.resolve(IUnitOfWork, read_only=read_only),
+            )
+        elif read_only:
+            unit_of_work = AsyncORMReadOnlyUnitOfWork(
+                container.resolve(AsyncDatabase),
+            )
+        else:
+            unit_of_work = AsyncORMUnitOfWork(container.resolve(AsyncDatabase))
+        return AsyncCachedUsersUnitOfWork(
+            unit_of_work,
+            container.resolve(UsersCache),
+        )
 
     container.register(
-        Database,
-        factory=init_database,
+        IUnitOfWork,
+        factory=init_unit_of_work,
+        scope=Scope.transient,
+    )
+    container.register(
+        IAsyncUnitOfWork,
+        factory=init_async_unit_of_work,
+        scope=Scope.transient,
+    )
+
+
+def _register_authorization(container: Container) -> None:
+    def init_token_service() -> IUserTokenService:
+        settings = container.resolve(Settings)
+        return UserJWTService(settings, container.resolve(IRevokedTokensStore))
+
+    def init_refresh_token_rotation(
+        unit_of_work: IAsyncUnitOfWork,
+    ) -> AsyncRefreshTokenRotation:
+        return AsyncRefreshTokenRotation(
+            unit_of_work.refresh_tokens,
+            container.resolve(IUserTokenService),
+        )
+
+    # Отозванные токены видны только этому процессу. Для нескольких
+    # процессов здесь регистрируется общее хранилище с тем же интерфейсом.
+    container.register(
+        IRevokedTokensStore,
+        instance=MemoryRevokedTokensStore(),
         scope=Scope.singleton,
     )
     container.register(
@@ -62,20 +182,69 @@ def _init_container() -> Container:
         scope=Scope.singleton,
     )
     container.register(
-        INotesRepository,
-        factory=init_notes_repository,
+        AsyncRefreshTokenRotation,
+        factory=init_refresh_token_rotation,
+        scope=Scope.transient,
+    )
+
+
+def _register_authentication(container: Container) -> None:
+    def init_password_hashing_pool() -> PasswordHashingPool:
+        settings = container.resolve(Settings)
+        return PasswordHashingPool(
+            workers=settings.PASSWORD_HASHING_WORKERS,
+            max_queue=settings.PASSWORD_HASHING_QUEUE,
+        )
+
+    def init_login_throttle() -> LoginThrottle:
+        settings = container.resolve(Settings)
+        return LoginThrottle(
+            container.resolve(ILoginAttemptsStore),
+            username_limit=settings.LOGIN_ATTEMPTS_PER_USERNAME,
+            ip_limit=settings.LOGIN_ATTEMPTS_PER_IP,
+            window=settings.LOGIN_ATTEMPTS_WINDOW_SECONDS,
+        )
+
+    def init_async_authentication_service(
+        unit_of_work: IAsyncUnitOfWork,
+    ) -> IAsyncUserAuthenticationService:
+        # Кэш пользователей - в самой единице работы запроса, его сброс
+        # выполняется после фиксации (AsyncCachedUsersUnitOfWork).
+        return AsyncUserAuthenticationService(
+            unit_of_work.users,
+            container.resolve(PasswordHashingPool),
+            container.resolve(Settings).PASSWORD_HASHING_ROUNDS,
+        )
+
+    container.register(
+        PasswordHashingPool,
+        factory=init_password_hashing_pool,
         scope=Scope.singleton,
     )
+    # Как и отозванные токены, попытки входа видны только этому процессу.
     container.register(
-        IUsersRepository,
-        factory=init_users_repository,
+        ILoginAttemptsStore,
+        instance=MemoryLoginAttemptsStore(),
         scope=Scope.singleton,
     )
-    container.register(Diary, factory=init_diary_service, scope=Scope.singleton)
     container.register(
-        IUserAuthenticationService,
-        factory=init_authentication_service,
+        LoginThrottle,
+        factory=init_login_throttle,
+        scope=Scope.singleton,
+    )
+    container.register(
+        IAsyncUserAuthenticationService,
+        factory=init_async_authentication_service,
         scope=Scope.transient,
     )
 
-    return container
+
+def _register_diary(container: Container) -> None:
+    def init_async_diary_service(unit_of_work: IAsyncUnitOfWork) -> AsyncDiary:
+        return AsyncDiary(unit_of_work.notes, unit_of_work.statistics)
+
+    container.register(
+        AsyncDiary,
+        factory=init_async_diary_service,
+        scope=Scope.transient,
+    )
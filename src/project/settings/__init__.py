@@ -2,11 +2,21 @@ from typing import ClassVar
 
 from pydantic_settings import SettingsConfigDict
 
-from src.project.settings.authentication import AuthJWTSettings
-from src.project.settings.database import PostgresSettings
+from src.project.settings.authentication import (
+    AuthJWTSettings,
+    LoginThrottleSettings,
+    PasswordHashingSettings,
+)
+from src.project.settings.database import PostgresSettings, UsersCacheSettings
 
 
-class Settings(PostgresSettings, AuthJWTSettings):
+class Settings(
+    PostgresSettings,
+    AuthJWTSettings,
+    PasswordHashingSettings,
+    LoginThrottleSettings,
+    UsersCacheSettings,
+):
     model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
         case_sensitive=True,
         env_file=".env",
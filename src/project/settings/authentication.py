@@ -1,14 +1,47 @@
 from pathlib import Path
 
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
 
 BASE_DIR = Path(__file__).parent.parent.parent.parent
 
 
+class JWTVerificationKey(BaseModel):
+    kid: str
+    algorithm: str
+    public_key: str
+
+
 class AuthJWTSettings(BaseSettings):
     PRIVATE_KEY: str = (BASE_DIR / "jwt-private.pem").read_text()
     PUBLIC_KEY: str = (BASE_DIR / "jwt-public.pem").read_text()
+    # RS256, ES256, EdDSA (Ed25519) или HS256 - для него PRIVATE_KEY это секрет.
     ALGORITHM: str = "RS256"
+    # kid в заголовке выпускаемых токенов, пустая строка - без kid.
+    JWT_KEY_ID: str = ""
+    # Прежние ключи, токены которых еще принимаются на время ротации.
+    JWT_PREVIOUS_KEYS: list[JWTVerificationKey] = []
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 3
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Payload'ы токенов с проверенной подписью, 0 - проверять каждый раз.
+    JWT_VERIFIED_CACHE_SIZE: int = 10_000
+
+
+class PasswordHashingSettings(BaseSettings):
+    # Потоки bcrypt и число ожидающих их задач, сверх него вход и регистрация
+    # получают 503.
+    PASSWORD_HASHING_WORKERS: int = 4
+    PASSWORD_HASHING_QUEUE: int = 64
+    # Стоимость bcrypt (2 ** rounds итераций), подбирается командой
+    # calibrate-password-hashing. Хэши с другой стоимостью пересчитываются
+    # при входе.
+    PASSWORD_HASHING_ROUNDS: int = Field(default=12, ge=4, le=31)
+
+
+class LoginThrottleSettings(BaseSettings):
+    # Попытки входа за окно на имя пользователя и на IP клиента, сверх них
+    # вход получает 429 без обращения к БД и bcrypt.
+    LOGIN_ATTEMPTS_PER_USERNAME: int = Field(default=5, ge=1)
+    LOGIN_ATTEMPTS_PER_IP: int = Field(default=30, ge=1)
+    LOGIN_ATTEMPTS_WINDOW_SECONDS: float = Field(default=60.0, gt=0)
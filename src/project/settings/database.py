@@ -1,9 +1,16 @@
 from typing_extensions import Self
 
-from pydantic import model_validator
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
 
+class UsersCacheSettings(BaseSettings):
+    # Пользователи по имени для входа и регистрации, 0 - без кэша. Изменения
+    # в других процессах видны не позже чем через USERS_CACHE_TTL_SECONDS.
+    USERS_CACHE_SIZE: int = Field(default=10_000, ge=0)
+    USERS_CACHE_TTL_SECONDS: float = Field(default=5.0, gt=0)
+
+
 class PostgresSettings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_USER: str
@@ -11,6 +18,8 @@ class PostgresSettings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: str
     POSTGRES_DB_URL: str
+    POSTGRES_ASYNC_DB_URL: str
+    ASYNC_DATABASE: bool = False
 
     @model_validator(mode="before")
     @classmethod
@@ -18,17 +27,21 @@ class PostgresSettings(BaseSettings):
         cls: type["PostgresSettings"],
         values: dict[str, str],
     ) -> dict[str, str]:
-        if values.get("POSTGRES_DB_URL"):
-            return values
-
         username = values.get("POSTGRES_USER")
         password = values.get("POSTGRES_PASSWORD")
         host = values.get("POSTGRES_HOST")
         port = values.get("POSTGRES_PORT")
         db_name = values.get("POSTGRES_DB")
-        values["POSTGRES_DB_URL"] = (
-            f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{db_name}"
-        )
+        if not values.get("POSTGRES_DB_URL"):
+            values["POSTGRES_DB_URL"] = (
+                f"postgresql+psycopg2://{username}:{password}"
+                f"@{host}:{port}/{db_name}"
+            )
+        if not values.get("POSTGRES_ASYNC_DB_URL"):
+            values["POSTGRES_ASYNC_DB_URL"] = (
+                f"postgresql+asyncpg://{username}:{password}"
+                f"@{host}:{port}/{db_name}"
+            )
 
         return values
 
@@ -42,3 +55,10 @@ class PostgresSettings(BaseSettings):
             f"postgresql+psycopg2://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.test_postgres_db}"
         )
+
+    @property
+    def test_postgres_async_url(self: Self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.test_postgres_db}"
+        )
@@ -1,4 +1,4 @@
-from src.service_layer.services.diary import Diary
+from src.service_layer.services.diary import AsyncDiary, Diary
 
 
-__all__ = ("Diary",)
+__all__ = ("Diary", "AsyncDiary")
@@ -3,11 +3,13 @@ from src.service_layer.exceptions.base import (
     NotAuthenticatedException,
 )
 from src.service_layer.exceptions.credentials import UserCredentialsFormatException
+from src.service_layer.exceptions.hashing import PasswordHashingBusyException
 from src.service_layer.exceptions.login import LogInException
 from src.service_layer.exceptions.register import (
     UserNameAlreadyExistException,
     UserRegisterException,
 )
+from src.service_layer.exceptions.throttling import LoginThrottledException
 
 
 __all__ = (
@@ -16,5 +18,7 @@ __all__ = (
     "AuthenticationException",
     "UserCredentialsFormatException",
     "NotAuthenticatedException",
+    "PasswordHashingBusyException",
+    "LoginThrottledException",
     "UserRegisterException",
 )
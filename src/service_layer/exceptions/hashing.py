@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing_extensions import Self
+
+from src.service_layer.exceptions.base import AuthenticationException
+
+
+@dataclass(eq=False)
+class PasswordHashingBusyException(AuthenticationException):
+    @property
+    def message(self: Self) -> str:
+        return "Сервер перегружен проверкой паролей, повторите запрос позже."
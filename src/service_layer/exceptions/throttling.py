@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from math import ceil
+from typing_extensions import Self
+
+from src.service_layer.exceptions.base import AuthenticationException
+
+
+@dataclass(eq=False)
+class LoginThrottledException(AuthenticationException):
+    retry_after: float
+
+    @property
+    def retry_after_seconds(self: Self) -> int:
+        return max(1, ceil(self.retry_after))
+
+    @property
+    def message(self: Self) -> str:
+        return (
+            "Слишком много попыток входа, повторите через "
+            f"{self.retry_after_seconds} с."
+        )
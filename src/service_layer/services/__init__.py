@@ -1,14 +1,46 @@
-from src.service_layer.services.authentication import UserAuthenticationService
+from src.service_layer.services.authentication import (
+    AsyncUserAuthenticationService,
+    UserAuthenticationService,
+)
 from src.service_layer.services.base import (
+    IAsyncUserAuthenticationService,
     IUserAuthenticationService,
     NotAuthenticated,
 )
-from src.service_layer.services.diary import Diary
+from src.service_layer.services.diary import (
+    AsyncDiary,
+    Diary,
+    ImportReport,
+    ImportRowError,
+    NotesPage,
+)
+from src.service_layer.services.hashing import (
+    PasswordHashingMetrics,
+    PasswordHashingPool,
+)
+from src.service_layer.services.throttling import (
+    ILoginAttemptsStore,
+    LoginThrottle,
+    LoginThrottleMetrics,
+    MemoryLoginAttemptsStore,
+)
 
 
 __all__ = (
     "IUserAuthenticationService",
     "UserAuthenticationService",
+    "IAsyncUserAuthenticationService",
+    "AsyncUserAuthenticationService",
     "NotAuthenticated",
+    "PasswordHashingPool",
+    "PasswordHashingMetrics",
+    "ILoginAttemptsStore",
+    "MemoryLoginAttemptsStore",
+    "LoginThrottle",
+    "LoginThrottleMetrics",
     "Diary",
+    "AsyncDiary",
+    "ImportReport",
+    "ImportRowError",
+    "NotesPage",
 )
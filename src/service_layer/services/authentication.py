@@ -1,87 +1,138 @@
-from dataclasses import dataclass
-from typing import ClassVar, cast
+from dataclasses import dataclass, field
+from typing import ClassVar
 from typing_extensions import Self
 
 from bcrypt import checkpw, gensalt, hashpw
 
 from src.domain.entities import UserEntity
-from src.domain.services import IUsersRepository
+from src.domain.services import IAsyncUsersRepository, IUsersRepository
 from src.domain.specifications import UserCredentialsSpecification
 from src.service_layer.exceptions import (
     LogInException,
     NotAuthenticatedException,
+    PasswordHashingBusyException,
     UserCredentialsFormatException,
     UserNameAlreadyExistException,
 )
 from src.service_layer.services.base import (
+    IAsyncUserAuthenticationService,
     IUserAuthenticationService,
     NotAuthenticated,
 )
+from src.service_layer.services.hashing import PasswordHashingPool
 
 
-@dataclass
-class UserAuthenticationService(IUserAuthenticationService):
+class _BaseUserAuthenticationService:
+    """
+    Общие для синхронного и асинхронного сервисов правила без ввода-вывода:
+    bcrypt, проверки перед хэшированием и решение о пересчете хэша.
+    """
+
     DEFAULT_ENCODING: ClassVar[str] = "utf-8"
+    DEFAULT_ROUNDS: ClassVar[int] = 12
+
+    repository: IUsersRepository | IAsyncUsersRepository
+    password_rounds: int
+    _user: UserEntity | NotAuthenticated
+
+    @staticmethod
+    def hash_password(
+        pwd: str,
+        rounds: int = DEFAULT_ROUNDS,
+        encoding: str = DEFAULT_ENCODING,
+    ) -> str:
+        return hashpw(
+            password=pwd.encode(encoding),
+            salt=gensalt(rounds),
+        ).decode(encoding)
+
+    @staticmethod
+    def hashed_password_rounds(hashed_password: str) -> int:
+        """Стоимость из хэша bcrypt вида $2b$<rounds>$<salt и хэш>."""
+        return int(hashed_password.split("$")[2])
+
+    @staticmethod
+    def compare_passwords(
+        password: str,
+        hashed_password: str,
+        encoding: str = DEFAULT_ENCODING,
+    ) -> bool:
+        return checkpw(
+            password=password.encode(encoding),
+            hashed_password=hashed_password.encode(encoding),
+        )
 
+    @staticmethod
+    def _validate_found_user(user: UserEntity | None) -> UserEntity:
+        if user is None:
+            raise LogInException
+
+        return user
+
+    def _validate_new_user(self: Self, username: str, password: str) -> None:
+        """
+        Регистрация - одна операция с БД: занятость имени проверяет
+        add_user_if_absent, атомарно и для параллельных регистраций одного
+        имени. Имя, которое кэш знает как занятое, отсекается до bcrypt без
+        запроса к БД.
+        """
+        if not (specification := UserCredentialsSpecification(username, password)):
+            raise UserCredentialsFormatException(specification)
+
+        if self.repository.is_known_username(username):
+            raise UserNameAlreadyExistException
+
+    def _needs_rehash(self: Self, user: UserEntity) -> bool:
+        """Хэш другой стоимости пересчитывается при входе, пока пароль известен."""
+        return self.hashed_password_rounds(user.password) != self.password_rounds
+
+    def _forget_user(self: Self) -> None:
+        if isinstance(self._user, NotAuthenticated):
+            raise NotAuthenticatedException
+
+        self._user = NotAuthenticated()
+
+
+@dataclass
+class UserAuthenticationService(
+    _BaseUserAuthenticationService,
+    IUserAuthenticationService,
+):
     repository: IUsersRepository
+    password_rounds: int = _BaseUserAuthenticationService.DEFAULT_ROUNDS
 
     def login(self: Self, username: str, password: str) -> None:
         user = self._validate_user(username)
         self._validate_user_password(user, password)
+        if self._needs_rehash(user):
+            self.repository.update_password(
+                username,
+                self.hash_password(password, self.password_rounds),
+            )
         self._user = user
-        cast(UserEntity, self._user)
 
     def logout(self: Self) -> None:
-        if isinstance(self._user, NotAuthenticated):
-            raise NotAuthenticatedException
-
-        self._user = NotAuthenticated()
-        cast(NotAuthenticated, self._user)
+        self._forget_user()
 
     def register(self: Self, username: str, password: str) -> None:
-        if self.repository.get_by_username(username) is not None:
-            raise UserNameAlreadyExistException
-
-        if not (specification := UserCredentialsSpecification(username, password)):
-            raise UserCredentialsFormatException(specification)
-
-        self.repository.add_user(
+        self._validate_new_user(username, password)
+        if not self.repository.add_user_if_absent(
             UserEntity(
                 username=username,
-                password=self.hash_password(password),
+                password=self.hash_password(password, self.password_rounds),
             ),
-        )
+        ):
+            raise UserNameAlreadyExistException
 
     def unregister(self: Self) -> None:
         self.repository.delete_user(self.user.username)
         self.logout()
 
-    @staticmethod
-    def hash_password(pwd: str, encoding: str = DEFAULT_ENCODING) -> str:
-        return hashpw(
-            password=pwd.encode(encoding),
-            salt=gensalt(),
-        ).decode(encoding)
-
-    @staticmethod
-    def compare_passwords(
-        password: str,
-        hashed_password: str,
-        encoding: str = DEFAULT_ENCODING,
-    ) -> bool:
-        return checkpw(
-            password=password.encode(encoding),
-            hashed_password=hashed_password.encode(encoding),
-        )
-
     def _get_user(self: Self, username: str) -> UserEntity | None:
         return self.repository.get_by_username(username)
 
     def _validate_user(self: Self, username: str) -> UserEntity:
-        if (user := self._get_user(username)) is None:
-            raise LogInException
-
-        return user
+        return self._validate_found_user(self._get_user(username))
 
     def _validate_user_password(self: Self, user: UserEntity, password: str) -> None:
         if not self.compare_passwords(
@@ -89,3 +140,67 @@ class UserAuthenticationService(IUserAuthenticationService):
             hashed_password=user.password,
         ):
             raise LogInException
+
+
+@dataclass
+class AsyncUserAuthenticationService(
+    _BaseUserAuthenticationService,
+    IAsyncUserAuthenticationService,
+):
+    """
+    UserAuthenticationService поверх асинхронного репозитория. bcrypt
+    выполняется в отдельном ограниченном пуле потоков hashing_pool.
+    """
+
+    repository: IAsyncUsersRepository
+    hashing_pool: PasswordHashingPool = field(default_factory=PasswordHashingPool)
+    password_rounds: int = _BaseUserAuthenticationService.DEFAULT_ROUNDS
+
+    async def login(self: Self, username: str, password: str) -> None:
+        user = self._validate_found_user(
+            await self.repository.get_by_username(username),
+        )
+        if not await self.hashing_pool.run(
+            self.compare_passwords,
+            password,
+            user.password,
+        ):
+            raise LogInException
+        await self._rehash_password(user, password)
+        self._user = user
+
+    async def logout(self: Self) -> None:
+        self._forget_user()
+
+    async def register(self: Self, username: str, password: str) -> None:
+        self._validate_new_user(username, password)
+        if not await self.repository.add_user_if_absent(
+            UserEntity(
+                username=username,
+                password=await self.hashing_pool.run(
+                    self.hash_password,
+                    password,
+                    self.password_rounds,
+                ),
+            ),
+        ):
+            raise UserNameAlreadyExistException
+
+    async def unregister(self: Self) -> None:
+        await self.repository.delete_user(self.user.username)
+        await self.logout()
+
+    async def _rehash_password(self: Self, user: UserEntity, password: str) -> None:
+        """При занятом пуле вход не задерживается, пересчет - при следующем входе."""
+        if not self._needs_rehash(user):
+            return
+
+        try:
+            hashed_password = await self.hashing_pool.run(
+                self.hash_password,
+                password,
+                self.password_rounds,
+            )
+        except PasswordHashingBusyException:
+            return
+        await self.repository.update_password(user.username, hashed_password)
@@ -16,7 +16,7 @@ class NotAuthenticated:
 
 
 @dataclass
-class IUserAuthenticationService(ABC):
+class _UserState:
     _user: UserEntity | NotAuthenticated = field(
         default_factory=NotAuthenticated,
         init=False,
@@ -28,6 +28,9 @@ class IUserAuthenticationService(ABC):
             raise NotAuthenticatedException
         return self._user
 
+
+@dataclass
+class IUserAuthenticationService(_UserState, ABC):
     @abstractmethod
     def login(self: Self, username: str, password: str) -> None:
         raise NotImplementedError
@@ -43,3 +46,22 @@ class IUserAuthenticationService(ABC):
     @abstractmethod
     def unregister(self: Self) -> None:
         raise NotImplementedError
+
+
+@dataclass
+class IAsyncUserAuthenticationService(_UserState, ABC):
+    @abstractmethod
+    async def login(self: Self, username: str, password: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def logout(self: Self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def register(self: Self, username: str, password: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unregister(self: Self) -> None:
+        raise NotImplementedError
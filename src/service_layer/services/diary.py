@@ -1,18 +1,159 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, time
+from heapq import merge
+from operator import attrgetter
+from typing import Any, AsyncIterator, ClassVar, Iterable, Iterator, Mapping
 from typing_extensions import Self
 from uuid import UUID
 
-from src.domain import services
+from more_itertools import chunked
+
 from src.domain.entities import NoteEntity
-from src.domain.exceptions import NonUniqueNoteBedtimeDateException
-from src.domain.services import INotesRepository
+from src.domain.exceptions import (
+    InvalidDateRangeException,
+    NonUniqueNoteBedtimeDateException,
+    NoteNotFoundException,
+)
+from src.domain.services import (
+    IAsyncNotesRepository,
+    IAsyncStatisticsRepository,
+    INotesRepository,
+    IStatisticsRepository,
+    Period,
+    PeriodStatistics,
+    PointsColumns,
+)
+from src.domain.services.batch import point_to_minutes
+from src.domain.specifications import find_invalid_points
 from src.domain.values.points import Points
 
 
+@dataclass
+class ImportRowError:
+    line: int
+    error: str
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+    def extend(
+        self: Self,
+        other: "ImportReport",
+        errors: Iterable[ImportRowError] = (),
+    ) -> None:
+        """
+        other - отчет следующей пачки, errors - ошибки строк до ее конца.
+        Пачки идут по порядку строк, поэтому весь список не пересортировывается.
+        """
+        self.imported += other.imported
+        self.errors.extend(merge(errors, other.errors, key=attrgetter("line")))
+
+
+@dataclass
+class NotesPage:
+    notes: list[NoteEntity]
+    next_cursor: date | None = None
+
+
+def _make_note(
+    owner_oid: UUID,
+    bedtime_date: date,
+    went_to_bed: time,
+    fell_asleep: time,
+    woke_up: time,
+    got_up: time,
+    no_sleep: time | None = None,
+) -> NoteEntity:
+    return NoteEntity(
+        owner_oid=owner_oid,
+        points=Points(
+            bedtime_date=bedtime_date,
+            went_to_bed=went_to_bed,
+            fell_asleep=fell_asleep,
+            woke_up=woke_up,
+            got_up=got_up,
+            no_sleep=no_sleep or time(),
+        ),
+    )
+
+
+def _validate_date_range(first_date: date, last_date: date) -> None:
+    if first_date > last_date:
+        raise InvalidDateRangeException(first_date, last_date)
+
+
+def _make_page(notes: list[NoteEntity], limit: int) -> NotesPage:
+    """notes - выборка из limit + 1 записи: лишняя говорит о следующей странице."""
+    if len(notes) <= limit:
+        return NotesPage(notes)
+    notes = notes[:limit]
+    return NotesPage(notes, next_cursor=notes[-1].points.bedtime_date)
+
+
+def _unchecked_points(values: Mapping[str, Any]) -> Points:
+    return Points.trusted(
+        values["bedtime_date"],
+        point_to_minutes(values["went_to_bed"]),
+        point_to_minutes(values["fell_asleep"]),
+        point_to_minutes(values["woke_up"]),
+        point_to_minutes(values["got_up"]),
+        point_to_minutes(values.get("no_sleep", time())),
+    )
+
+
+def _parse_batch(
+    owner_oid: UUID,
+    batch: list[tuple[int, Mapping[str, Any]]],
+) -> tuple[ImportReport, dict[NoteEntity, int]]:
+    """
+    Записи пачки с номерами строк и отчет с ошибками валидации и дублей.
+    Точки всех строк проверяются сразу, как массивы минут.
+    """
+    report = ImportReport()
+    lines: dict[NoteEntity, int] = {}
+    points = [_unchecked_points(values) for _, values in batch]
+    exceptions = find_invalid_points(PointsColumns.from_points(points))
+
+    for (line, _), note_points, exception_type in zip(batch, points, exceptions):
+        if exception_type is not None:
+            report.errors.append(ImportRowError(line, exception_type().message))
+            continue
+
+        note = NoteEntity(owner_oid=owner_oid, points=note_points)
+        if note in lines:
+            exception = NonUniqueNoteBedtimeDateException(
+                note.points.bedtime_date,
+            )
+            report.errors.append(ImportRowError(line, exception.message))
+            continue
+        lines[note] = line
+
+    return report, lines
+
+
+def _complete_report(
+    report: ImportReport,
+    lines: dict[NoteEntity, int],
+    not_added: set[NoteEntity],
+) -> ImportReport:
+    for note in not_added:
+        exception = NonUniqueNoteBedtimeDateException(note.points.bedtime_date)
+        report.errors.append(ImportRowError(lines[note], exception.message))
+
+    report.imported = len(lines) - len(not_added)
+    report.errors.sort(key=attrgetter("line"))
+    return report
+
+
 @dataclass
 class Diary:
+    IMPORT_BATCH_SIZE: ClassVar[int] = 1000
+
     repository: INotesRepository
+    statistics_repository: IStatisticsRepository
 
     # user_service: InitVar[UserAuthenticationService]
     # owner_oid: UUID = field(init=False)
@@ -30,23 +171,203 @@ class Diary:
         got_up: time,
         no_sleep: time | None = None,
     ) -> None:
-        note = NoteEntity(
-            owner_oid=owner_oid,
-            points=Points(
-                bedtime_date=bedtime_date,
-                went_to_bed=went_to_bed,
-                fell_asleep=fell_asleep,
-                woke_up=woke_up,
-                got_up=got_up,
-                no_sleep=no_sleep or time(),
-            ),
+        note = _make_note(
+            owner_oid,
+            bedtime_date,
+            went_to_bed,
+            fell_asleep,
+            woke_up,
+            got_up,
+            no_sleep,
+        )
+        self.repository.add(note)
+
+    def rewrite(
+        self: Self,
+        owner_oid: UUID,
+        bedtime_date: date,
+        went_to_bed: time,
+        fell_asleep: time,
+        woke_up: time,
+        got_up: time,
+        no_sleep: time | None = None,
+    ) -> None:
+        note = _make_note(
+            owner_oid,
+            bedtime_date,
+            went_to_bed,
+            fell_asleep,
+            woke_up,
+            got_up,
+            no_sleep,
         )
-        diary = services.DiaryService.create(
-            notes=self.repository.get_all_notes(owner_oid),
+        if self.repository.update(note) is None:
+            raise NoteNotFoundException(bedtime_date)
+
+    def erase(self: Self, owner_oid: UUID, bedtime_date: date) -> None:
+        if self.repository.delete(owner_oid, bedtime_date) is None:
+            raise NoteNotFoundException(bedtime_date)
+
+    def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        """Статистика периодов, пересекающихся с [first_date, last_date]."""
+        _validate_date_range(first_date, last_date)
+        return self.statistics_repository.get_statistics(
+            owner_oid,
+            period,
+            first_date,
+            last_date,
         )
 
-        if not diary.can_write(note):
-            raise NonUniqueNoteBedtimeDateException(note.points.bedtime_date)
+    def get_notes_page(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        cursor: date | None = None,
+    ) -> NotesPage:
+        """
+        Записи от новых к старым. cursor - next_cursor предыдущей страницы,
+        None для первой.
+        """
+        notes = self.repository.get_latest(owner_oid, limit + 1, before=cursor)
+        return _make_page(notes, limit)
 
-        diary.write(note)
-        self.repository.add(note)
+    def export_notes(self: Self, owner_oid: UUID) -> Iterator[NoteEntity]:
+        """Все записи по возрастанию bedtime_date, читаются по мере перебора."""
+        return self.repository.iter_notes(owner_oid)
+
+    def import_notes(
+        self: Self,
+        owner_oid: UUID,
+        rows: Iterable[tuple[int, Mapping[str, Any]]],
+    ) -> ImportReport:
+        """
+        Импорт записей пачками. rows - пары (номер строки, поля Points).
+        Ошибки валидации и совпадения bedtime_date не прерывают импорт, а
+        попадают в отчет с номером строки.
+        """
+        report = ImportReport()
+        for batch in chunked(rows, self.IMPORT_BATCH_SIZE):
+            report.extend(self._import_batch(owner_oid, batch))
+        return report
+
+    def _import_batch(
+        self: Self,
+        owner_oid: UUID,
+        batch: list[tuple[int, Mapping[str, Any]]],
+    ) -> ImportReport:
+        report, lines = _parse_batch(owner_oid, batch)
+        not_added = self.repository.add_many(lines)
+        return _complete_report(report, lines, not_added)
+
+
+@dataclass
+class AsyncDiary:
+    """Diary поверх асинхронных репозиториев, методы те же."""
+
+    IMPORT_BATCH_SIZE: ClassVar[int] = Diary.IMPORT_BATCH_SIZE
+
+    repository: IAsyncNotesRepository
+    statistics_repository: IAsyncStatisticsRepository
+
+    async def write(
+        self: Self,
+        owner_oid: UUID,
+        bedtime_date: date,
+        went_to_bed: time,
+        fell_asleep: time,
+        woke_up: time,
+        got_up: time,
+        no_sleep: time | None = None,
+    ) -> None:
+        note = _make_note(
+            owner_oid,
+            bedtime_date,
+            went_to_bed,
+            fell_asleep,
+            woke_up,
+            got_up,
+            no_sleep,
+        )
+        await self.repository.add(note)
+
+    async def rewrite(
+        self: Self,
+        owner_oid: UUID,
+        bedtime_date: date,
+        went_to_bed: time,
+        fell_asleep: time,
+        woke_up: time,
+        got_up: time,
+        no_sleep: time | None = None,
+    ) -> None:
+        note = _make_note(
+            owner_oid,
+            bedtime_date,
+            went_to_bed,
+            fell_asleep,
+            woke_up,
+            got_up,
+            no_sleep,
+        )
+        if await self.repository.update(note) is None:
+            raise NoteNotFoundException(bedtime_date)
+
+    async def erase(self: Self, owner_oid: UUID, bedtime_date: date) -> None:
+        if await self.repository.delete(owner_oid, bedtime_date) is None:
+            raise NoteNotFoundException(bedtime_date)
+
+    async def get_statistics(
+        self: Self,
+        owner_oid: UUID,
+        period: Period,
+        first_date: date,
+        last_date: date,
+    ) -> list[PeriodStatistics]:
+        _validate_date_range(first_date, last_date)
+        return await self.statistics_repository.get_statistics(
+            owner_oid,
+            period,
+            first_date,
+            last_date,
+        )
+
+    async def get_notes_page(
+        self: Self,
+        owner_oid: UUID,
+        limit: int,
+        cursor: date | None = None,
+    ) -> NotesPage:
+        notes = await self.repository.get_latest(
+            owner_oid,
+            limit + 1,
+            before=cursor,
+        )
+        return _make_page(notes, limit)
+
+    def export_notes(self: Self, owner_oid: UUID) -> AsyncIterator[NoteEntity]:
+        return self.repository.iter_notes(owner_oid)
+
+    async def import_notes(
+        self: Self,
+        owner_oid: UUID,
+        rows: Iterable[tuple[int, Mapping[str, Any]]],
+    ) -> ImportReport:
+        report = ImportReport()
+        for batch in chunked(rows, self.IMPORT_BATCH_SIZE):
+            report.extend(await self._import_batch(owner_oid, batch))
+        return report
+
+    async def _import_batch(
+        self: Self,
+        owner_oid: UUID,
+        batch: list[tuple[int, Mapping[str, Any]]],
+    ) -> ImportReport:
+        report, lines = _parse_batch(owner_oid, batch)
+        not_added = await self.repository.add_many(lines)
+        return _complete_report(report, lines, not_added)
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import Callable, TypeVar
+from typing_extensions import Self
+
+from anyio import CapacityLimiter
+from anyio.to_thread import run_sync
+
+from src.service_layer.exceptions import PasswordHashingBusyException
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PasswordHashingMetrics:
+    queue_depth: int
+    in_progress: int
+    completed: int
+    rejected: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    hash_seconds_total: float
+    hash_seconds_max: float
+
+    @property
+    def wait_seconds_avg(self: Self) -> float:
+        return self.wait_seconds_total / self.completed if self.completed else 0.0
+
+    @property
+    def hash_seconds_avg(self: Self) -> float:
+        return self.hash_seconds_total / self.completed if self.completed else 0.0
+
+
+@dataclass
+class PasswordHashingPool:
+    """
+    Отдельный ограниченный пул потоков для bcrypt (он отпускает GIL). Вход и
+    регистрация не занимают общий пул потоков anyio, а при max_queue
+    ожидающих задач новые сразу отклоняются PasswordHashingBusyException.
+    """
+
+    workers: int = 4
+    max_queue: int = 64
+    _limiter: CapacityLimiter = field(init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+    _waiting: int = field(default=0, init=False)
+    _in_progress: int = field(default=0, init=False)
+    _completed: int = field(default=0, init=False)
+    _rejected: int = field(default=0, init=False)
+    _wait_total: float = field(default=0.0, init=False)
+    _wait_max: float = field(default=0.0, init=False)
+    _hash_total: float = field(default=0.0, init=False)
+    _hash_max: float = field(default=0.0, init=False)
+
+    def __post_init__(self: Self) -> None:
+        self._limiter = CapacityLimiter(self.workers)
+
+    async def run(self: Self, function: Callable[..., T], *args: object) -> T:
+        with self._lock:
+            if self._waiting + self._in_progress >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHashingBusyException
+            self._waiting += 1
+
+        queued_at = perf_counter()
+        started_at: float | None = None
+
+        def measured() -> T:
+            nonlocal started_at
+            started_at = perf_counter()
+            with self._lock:
+                self._waiting -= 1
+                self._in_progress += 1
+            return function(*args)
+
+        try:
+            return await run_sync(measured, limiter=self._limiter)
+        finally:
+            self._record(queued_at, started_at, perf_counter())
+
+    def _record(
+        self: Self,
+        queued_at: float,
+        started_at: float | None,
+        done_at: float,
+    ) -> None:
+        with self._lock:
+            if started_at is None:
+                # Задача отменена до запуска в потоке.
+                self._waiting -= 1
+                return
+
+            self._in_progress -= 1
+            self._completed += 1
+            wait, hashing = started_at - queued_at, done_at - started_at
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._hash_total += hashing
+            self._hash_max = max(self._hash_max, hashing)
+
+    @property
+    def metrics(self: Self) -> PasswordHashingMetrics:
+        with self._lock:
+            return PasswordHashingMetrics(
+                queue_depth=self._waiting,
+                in_progress=self._in_progress,
+                completed=self._completed,
+                rejected=self._rejected,
+                wait_seconds_total=self._wait_total,
+                wait_seconds_max=self._wait_max,
+                hash_seconds_total=self._hash_total,
+                hash_seconds_max=self._hash_max,
+            )
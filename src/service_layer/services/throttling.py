@@ -0,0 +1,145 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Callable
+from typing_extensions import Self
+
+from src.service_layer.exceptions import LoginThrottledException
+
+
+@dataclass
+class ILoginAttemptsStore(ABC):
+    """
+    Скользящие окна попыток входа по ключам. Общее хранилище процессов
+    (например, Redis: sorted set времен попыток и Lua-скрипт с
+    ZREMRANGEBYSCORE, ZCARD и ZADD) реализует этот же интерфейс,
+    MemoryLoginAttemptsStore - его замена в одном процессе и в тестах.
+    """
+
+    @abstractmethod
+    def acquire(
+        self: Self,
+        limits: dict[str, int],
+        window: float,
+    ) -> tuple[str, float] | None:
+        """
+        Атомарно учитывает попытку во всех окнах limits (ключ - предел), если
+        в каждом за window секунд попыток меньше предела. Иначе попытка не
+        учитывается ни в одном окне и возвращается ключ заполненного окна и
+        секунды до его освобождения.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset(self: Self, key: str) -> None:
+        raise NotImplementedError
+
+
+@dataclass
+class MemoryLoginAttemptsStore(ILoginAttemptsStore):
+    """
+    Для каждого ключа хранятся времена последних limit попыток. Ключи
+    вытесняются в порядке последней попытки сверх max_keys, так что
+    перебор случайных имен пользователей не расходует память без предела.
+    """
+
+    max_keys: int = 100_000
+    clock: Callable[[], float] = field(default=monotonic, repr=False)
+    _attempts: dict[str, deque[float]] = field(default_factory=dict)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def __len__(self: Self) -> int:
+        return len(self._attempts)
+
+    def acquire(
+        self: Self,
+        limits: dict[str, int],
+        window: float,
+    ) -> tuple[str, float] | None:
+        now = self.clock()
+        with self._lock:
+            windows = {
+                key: self._window(key, limit) for key, limit in limits.items()
+            }
+            for key, attempts in windows.items():
+                if (
+                    len(attempts) == limits[key]
+                    and (retry := attempts[0] + window - now) > 0
+                ):
+                    return key, retry
+
+            for attempts in windows.values():
+                attempts.append(now)
+            return None
+
+    def _window(self: Self, key: str, limit: int) -> deque[float]:
+        attempts = self._attempts.pop(key, None)
+        if attempts is None or attempts.maxlen != limit:
+            attempts = deque(attempts or (), maxlen=limit)
+        self._attempts[key] = attempts
+        if len(self._attempts) > self.max_keys:
+            del self._attempts[next(iter(self._attempts))]
+        return attempts
+
+    def reset(self: Self, key: str) -> None:
+        with self._lock:
+            self._attempts.pop(key, None)
+
+
+@dataclass(frozen=True)
+class LoginThrottleMetrics:
+    allowed: int
+    rejected_by_username: int
+    rejected_by_ip: int
+
+
+@dataclass
+class LoginThrottle:
+    """
+    Ограничивает попытки входа по имени пользователя и по IP клиента до
+    чтения пользователя и bcrypt. Успешный вход сбрасывает окно имени, окно
+    IP - нет: с одного адреса перебирают пароли разных пользователей.
+    """
+
+    store: ILoginAttemptsStore
+    username_limit: int = 5
+    ip_limit: int = 30
+    window: float = 60.0
+    _lock: Lock = field(default_factory=Lock, repr=False)
+    _allowed: int = field(default=0, init=False)
+    _rejected_by_username: int = field(default=0, init=False)
+    _rejected_by_ip: int = field(default=0, init=False)
+
+    def acquire(self: Self, username: str, client_ip: str) -> None:
+        """Отклоненная попытка не расходует ни одно из окон."""
+        ip_key = f"ip:{client_ip}"
+        if rejected := self.store.acquire(
+            {ip_key: self.ip_limit, f"username:{username}": self.username_limit},
+            self.window,
+        ):
+            key, retry = rejected
+            if key == ip_key:
+                self._count("_rejected_by_ip")
+            else:
+                self._count("_rejected_by_username")
+            raise LoginThrottledException(retry)
+
+        self._count("_allowed")
+
+    def reset(self: Self, username: str) -> None:
+        self.store.reset(f"username:{username}")
+
+    def _count(self: Self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @property
+    def metrics(self: Self) -> LoginThrottleMetrics:
+        with self._lock:
+            return LoginThrottleMetrics(
+                allowed=self._allowed,
+                rejected_by_username=self._rejected_by_username,
+                rejected_by_ip=self._rejected_by_ip,
+            )
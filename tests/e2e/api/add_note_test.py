@@ -26,11 +26,15 @@ from tests.use_cases import (
 )
 
 
-def test_add_note_201(app: FastAPI, client: TestClient, user: ORMUser):
+def test_add_note_201(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
     response: Response = client.post(
         url=app.url_path_for("Добавить запись"),
         json=convert_points_to_json(Points(*points_order_desc_from_went_to_bed)),
-        headers={"owner_oid": str(user.oid)},
+        headers=auth_headers,
         # auth=jwt_access,
     )
     assert response.status_code == status.HTTP_201_CREATED, response.json()
@@ -53,14 +57,14 @@ def test_add_note_201(app: FastAPI, client: TestClient, user: ORMUser):
 def test_add_note_400_note_exceptions(
     app: FastAPI,
     client: TestClient,
-    user: ORMUser,
+    auth_headers: dict[str, str],
     points: T | TN,
     exception: NoteException,
 ):
     response: Response = client.post(
         url=app.url_path_for("Добавить запись"),
         json=convert_points_to_json(FakePoints(*points)),
-        headers={"owner_oid": str(user.oid)},
+        headers=auth_headers,
         # auth=jwt_access,
     )
     assert status.HTTP_400_BAD_REQUEST == response.status_code
@@ -74,6 +78,7 @@ def test_add_note_400_write_note_twice_exception(
     app: FastAPI,
     client: TestClient,
     user: ORMUser,
+    auth_headers: dict[str, str],
     diary: Diary,
 ):
     points = Points(*points_order_desc_from_went_to_bed)
@@ -83,13 +88,13 @@ def test_add_note_400_write_note_twice_exception(
     client.post(
         url=url,
         json=convert_points_to_json(points),
-        headers={"owner_oid": str(user.oid)},
+        headers=auth_headers,
         # auth=jwt_access,
     )
     response: Response = client.post(
         url=url,
         json=convert_points_to_json(points),
-        headers={"owner_oid": str(user.oid)},
+        headers=auth_headers,
         # auth=jwt_access,
     )
 
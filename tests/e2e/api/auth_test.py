@@ -0,0 +1,260 @@
+import pytest
+
+from fastapi import FastAPI
+from httpx import Response
+from punq import Container
+from starlette import status
+from starlette.testclient import TestClient
+
+from src.infra.authorization import (
+    RefreshTokenReuseException,
+    RefreshTokenRevokedException,
+)
+from src.infra.database import AsyncDatabase, Database
+from src.infra.instrumentation import StatementCounter
+from src.service_layer.services import LoginThrottle, PasswordHashingPool
+
+
+CREDENTIALS = {"username": "new_user", "password": "new_password"}
+
+
+def test_register_and_login_201(app: FastAPI, client: TestClient):
+    response: Response = client.post(
+        url=app.url_path_for("register_user"),
+        data=CREDENTIALS,
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+
+    response = client.post(
+        url=app.url_path_for("authenticate_user_and_issue_jwt"),
+        data=CREDENTIALS,
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+    assert response.json()["access_token"]
+
+
+def test_register_single_statement(
+    app: FastAPI,
+    client: TestClient,
+    database: Database,
+    async_database: AsyncDatabase,
+):
+    with (
+        StatementCounter(database.engine) as counter,
+        StatementCounter(async_database.engine) as async_counter,
+    ):
+        response: Response = client.post(
+            url=app.url_path_for("register_user"),
+            data=CREDENTIALS,
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+    assert (counter.counts + async_counter.counts)["statement"] == 1
+
+
+def test_register_twice_400(app: FastAPI, client: TestClient):
+    url = app.url_path_for("register_user")
+    client.post(url=url, data=CREDENTIALS)
+
+    response: Response = client.post(url=url, data=CREDENTIALS)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.json()
+
+
+def test_login_with_wrong_password_401(app: FastAPI, client: TestClient):
+    client.post(url=app.url_path_for("register_user"), data=CREDENTIALS)
+
+    response: Response = client.post(
+        url=app.url_path_for("authenticate_user_and_issue_jwt"),
+        data={**CREDENTIALS, "password": "wrong_password"},
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.json()
+
+
+def test_me_info_200(app: FastAPI, client: TestClient):
+    client.post(url=app.url_path_for("register_user"), data=CREDENTIALS)
+    token = client.post(
+        url=app.url_path_for("authenticate_user_and_issue_jwt"),
+        data=CREDENTIALS,
+    ).json()["access_token"]
+
+    for _ in range(2):
+        response: Response = client.get(
+            url=app.url_path_for("me_info"),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json()["username"] == CREDENTIALS["username"]
+
+
+def test_me_info_with_invalid_token_401(app: FastAPI, client: TestClient):
+    response: Response = client.get(
+        url=app.url_path_for("me_info"),
+        headers={"Authorization": "Bearer invalid"},
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.json()
+
+
+def test_password_hashing_metrics_200(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    url = app.url_path_for("get_password_hashing_metrics")
+    completed = client.get(url, headers=auth_headers).json()["completed"]
+
+    client.post(url=app.url_path_for("register_user"), data=CREDENTIALS)
+    client.post(
+        url=app.url_path_for("authenticate_user_and_issue_jwt"),
+        data=CREDENTIALS,
+    )
+    response: Response = client.get(url, headers=auth_headers)
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["completed"] == completed + 2
+    assert response.json()["queue_depth"] == 0
+
+
+def test_register_with_saturated_password_hashing_503(
+    app: FastAPI,
+    client: TestClient,
+    container: Container,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    pool = container.resolve(PasswordHashingPool)
+    monkeypatch.setattr(pool, "workers", 0)
+    monkeypatch.setattr(pool, "max_queue", 0)
+
+    response: Response = client.post(
+        url=app.url_path_for("register_user"),
+        data=CREDENTIALS,
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_login_reads_user_from_cache(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    url = app.url_path_for("get_users_cache_metrics")
+    before = client.get(url, headers=auth_headers).json()
+
+    client.post(url=app.url_path_for("register_user"), data=CREDENTIALS)
+    for _ in range(2):
+        response: Response = client.post(
+            url=app.url_path_for("authenticate_user_and_issue_jwt"),
+            data=CREDENTIALS,
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.json()
+    response = client.get(url, headers=auth_headers)
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["misses"] == before["misses"] + 1
+    assert response.json()["hits"] == before["hits"] + 1
+
+
+def test_login_throttled_429(
+    app: FastAPI,
+    client: TestClient,
+    container: Container,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    throttle = container.resolve(LoginThrottle)
+    monkeypatch.setattr(throttle, "username_limit", 2)
+    url = app.url_path_for("authenticate_user_and_issue_jwt")
+    credentials = {"username": "throttled_user", "password": "wrong_password"}
+
+    for _ in range(2):
+        response: Response = client.post(url=url, data=credentials)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post(url=url, data=credentials)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS, response.json()
+    assert int(response.headers["Retry-After"]) > 0
+    metrics = client.get(
+        url=app.url_path_for("get_login_throttle_metrics"),
+        headers=auth_headers,
+    ).json()
+    assert metrics["rejected_by_username"] >= 1
+
+
+def test_logout_revokes_token_204(app: FastAPI, client: TestClient):
+    client.post(url=app.url_path_for("register_user"), data=CREDENTIALS)
+    token = client.post(
+        url=app.url_path_for("authenticate_user_and_issue_jwt"),
+        data=CREDENTIALS,
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response: Response = client.post(
+        url=app.url_path_for("logout_user"),
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = client.get(url=app.url_path_for("me_info"), headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.json()
+
+
+def test_logout_ends_refresh_family_401(app: FastAPI, client: TestClient):
+    client.post(url=app.url_path_for("register_user"), data=CREDENTIALS)
+    issued = client.post(
+        url=app.url_path_for("authenticate_user_and_issue_jwt"),
+        data=CREDENTIALS,
+    ).json()
+
+    response: Response = client.post(
+        url=app.url_path_for("logout_user"),
+        headers={"Authorization": f"Bearer {issued['access_token']}"},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = client.post(
+        url=app.url_path_for("refresh_jwt"),
+        data={"refresh_token": issued["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.json()
+    assert (
+        response.json()["detail"]["error"] == RefreshTokenRevokedException().message
+    )
+
+
+def test_refresh_rotates_and_detects_reuse(app: FastAPI, client: TestClient):
+    client.post(url=app.url_path_for("register_user"), data=CREDENTIALS)
+    issued = client.post(
+        url=app.url_path_for("authenticate_user_and_issue_jwt"),
+        data=CREDENTIALS,
+    ).json()
+    url = app.url_path_for("refresh_jwt")
+
+    response: Response = client.post(
+        url=url,
+        data={"refresh_token": issued["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+    refreshed = response.json()
+    response = client.get(
+        url=app.url_path_for("me_info"),
+        headers={"Authorization": f"Bearer {refreshed['access_token']}"},
+    )
+    assert response.json()["username"] == CREDENTIALS["username"]
+
+    response = client.post(url=url, data={"refresh_token": issued["refresh_token"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.json()
+    assert response.json()["detail"]["error"] == RefreshTokenReuseException().message
+    # Повторное использование отозвало все семейство.
+    response = client.post(
+        url=url,
+        data={"refresh_token": refreshed["refresh_token"]},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.json()
+    assert (
+        response.json()["detail"]["error"] == RefreshTokenRevokedException().message
+    )
@@ -0,0 +1,60 @@
+from json import loads
+
+from fastapi import FastAPI
+from httpx import Response
+from starlette import status
+from starlette.testclient import TestClient
+
+from src.domain.values.points import Points
+from src.infra.converters import convert_points_to_json
+from src.infra.orm import ORMUser
+from src.service_layer import Diary
+from tests.use_cases import points_of_two_weeks
+
+
+def test_export_notes_ndjson(
+    app: FastAPI,
+    client: TestClient,
+    user: ORMUser,
+    auth_headers: dict[str, str],
+    diary: Diary,
+):
+    for points in reversed(points_of_two_weeks):
+        diary.write(user.oid, *points)
+
+    response: Response = client.get(
+        url=app.url_path_for("Экспортировать записи"),
+        headers=auth_headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [loads(line) for line in response.text.splitlines()] == [
+        convert_points_to_json(Points(*points)) for points in points_of_two_weeks
+    ]
+
+
+def test_exported_notes_can_be_imported(
+    app: FastAPI,
+    client: TestClient,
+    user: ORMUser,
+    auth_headers: dict[str, str],
+    diary: Diary,
+):
+    for points in points_of_two_weeks:
+        diary.write(user.oid, *points)
+    exported = client.get(
+        url=app.url_path_for("Экспортировать записи"),
+        headers=auth_headers,
+    )
+    for note in diary.repository.get_all_notes(user.oid):
+        diary.erase(user.oid, note.points.bedtime_date)
+
+    response: Response = client.post(
+        url=app.url_path_for("Импортировать записи"),
+        content=exported.content,
+        headers={**auth_headers, "content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["imported"] == len(points_of_two_weeks)
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from fastapi import FastAPI
+from httpx import Response
+from starlette import status
+from starlette.testclient import TestClient
+
+from src.infra.database import AsyncDatabase, Database
+from src.infra.instrumentation import StatementCounter
+from src.infra.orm import ORMUser
+from src.service_layer import Diary
+from tests.use_cases import points_of_two_weeks
+
+
+def test_get_notes_pages_200(
+    app: FastAPI,
+    client: TestClient,
+    user: ORMUser,
+    auth_headers: dict[str, str],
+    diary: Diary,
+):
+    for points in points_of_two_weeks:
+        diary.write(user.oid, *points)
+    url = app.url_path_for("Получить записи")
+
+    response: Response = client.get(
+        url=url,
+        params={"limit": 2},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    first_page = response.json()
+    assert [note["points"]["bedtime_date"] for note in first_page["notes"]] == [
+        "2020-12-14",
+        "2020-12-13",
+    ]
+    assert first_page["notes"][0]["points"]["no_sleep"] == "00:20:00"
+    created_at = datetime.fromisoformat(first_page["notes"][0]["created_at"])
+    assert created_at.microsecond == 0
+    assert first_page["next_cursor"] == "2020-12-13"
+
+    response = client.get(
+        url=url,
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    last_page = response.json()
+    assert [note["points"]["bedtime_date"] for note in last_page["notes"]] == [
+        "2020-12-12",
+    ]
+    assert last_page["next_cursor"] is None
+
+
+def test_get_notes_without_transaction(
+    app: FastAPI,
+    client: TestClient,
+    user: ORMUser,
+    auth_headers: dict[str, str],
+    diary: Diary,
+    database: Database,
+    async_database: AsyncDatabase,
+):
+    for points in points_of_two_weeks:
+        diary.write(user.oid, *points)
+
+    with (
+        StatementCounter(database.engine) as counter,
+        StatementCounter(async_database.engine) as async_counter,
+    ):
+        response: Response = client.get(
+            url=app.url_path_for("Получить записи"),
+            headers=auth_headers,
+        )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert counter.counts + async_counter.counts == {"statement": 1}
+
+
+def test_get_notes_wrong_limit_422(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    response: Response = client.get(
+        url=app.url_path_for("Получить записи"),
+        params={"limit": 0},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_get_notes_without_token_401(app: FastAPI, client: TestClient):
+    response: Response = client.get(url=app.url_path_for("Получить записи"))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
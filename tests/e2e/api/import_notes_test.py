@@ -0,0 +1,115 @@
+from datetime import timedelta
+from json import dumps
+
+from fastapi import FastAPI
+from httpx import Response
+from starlette import status
+from starlette.testclient import TestClient
+
+from src.domain.exceptions import (
+    NonUniqueNoteBedtimeDateException,
+    TimePointsSequenceException,
+)
+from src.domain.values.points import Points
+from src.infra.converters import convert_points_to_json
+from src.infra.orm import ORMUser
+from src.service_layer import Diary
+from tests.unit.conftest import FakePoints
+from tests.use_cases import (
+    points_order_desc_from_went_to_bed,
+    wrong_points_went_to_bed_gt_fell_asleep_and_lt_other_time_points,
+)
+
+
+def test_import_notes_ndjson(
+    app: FastAPI,
+    client: TestClient,
+    user: ORMUser,
+    auth_headers: dict[str, str],
+    diary: Diary,
+):
+    bedtime_date, *time_points = points_order_desc_from_went_to_bed
+    notes = [
+        convert_points_to_json(
+            Points(bedtime_date + timedelta(days=day), *time_points),
+        )
+        for day in range(3)
+    ]
+    wrong_note = convert_points_to_json(
+        FakePoints(
+            *wrong_points_went_to_bed_gt_fell_asleep_and_lt_other_time_points,
+        ),
+    )
+    wrong_note["bedtime_date"] = (bedtime_date + timedelta(days=3)).isoformat()
+    lines = [dumps(note) for note in (*notes, wrong_note, notes[0])]
+    lines.insert(1, '{"bedtime_date": "not a date"}')
+
+    response: Response = client.post(
+        url=app.url_path_for("Импортировать записи"),
+        content="\n".join(lines),
+        headers={**auth_headers, "content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    report = response.json()
+    assert report["imported"] == 3
+    assert [error["line"] for error in report["errors"]] == [2, 5, 6]
+    assert report["errors"][1]["error"] == TimePointsSequenceException().message
+    assert (
+        report["errors"][2]["error"]
+        == NonUniqueNoteBedtimeDateException(bedtime_date).message
+    )
+    assert len(diary.repository.get_all_notes(user.oid)) == 3
+
+
+def test_import_notes_csv(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    note = convert_points_to_json(Points(*points_order_desc_from_went_to_bed))
+    body = "\r\n".join((",".join(note), ",".join(note.values()), ""))
+
+    response: Response = client.post(
+        url=app.url_path_for("Импортировать записи"),
+        content=body,
+        headers={**auth_headers, "content-type": "text/csv"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json() == {"imported": 1, "errors": []}
+
+
+def test_import_notes_reports_not_utf8_line(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    note = convert_points_to_json(Points(*points_order_desc_from_went_to_bed))
+    body = b"\n".join((b'{"bedtime_date": "\xff"}', dumps(note).encode()))
+
+    response: Response = client.post(
+        url=app.url_path_for("Импортировать записи"),
+        content=body,
+        headers={**auth_headers, "content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json() == {
+        "imported": 1,
+        "errors": [{"line": 1, "error": "Строка не в кодировке UTF-8."}],
+    }
+
+
+def test_import_notes_415_unsupported_media_type(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    response: Response = client.post(
+        url=app.url_path_for("Импортировать записи"),
+        content="<notes/>",
+        headers={**auth_headers, "content-type": "application/xml"},
+    )
+
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
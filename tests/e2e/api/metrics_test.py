@@ -0,0 +1,32 @@
+import pytest
+
+from fastapi import FastAPI
+from httpx import Response
+from starlette import status
+from starlette.testclient import TestClient
+
+
+METRICS = [
+    "get_password_hashing_metrics",
+    "get_login_throttle_metrics",
+    "get_users_cache_metrics",
+]
+
+
+@pytest.mark.parametrize("name", METRICS)
+def test_metrics_200(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+    name: str,
+):
+    response: Response = client.get(url=app.url_path_for(name), headers=auth_headers)
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+
+
+@pytest.mark.parametrize("name", METRICS)
+def test_metrics_without_token_401(app: FastAPI, client: TestClient, name: str):
+    response: Response = client.get(url=app.url_path_for(name))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.json()
@@ -0,0 +1,93 @@
+from datetime import date
+
+from fastapi import FastAPI
+from httpx import Response
+from starlette import status
+from starlette.testclient import TestClient
+
+from src.domain.exceptions import InvalidDateRangeException
+from src.infra.orm import ORMUser
+from src.service_layer import Diary
+from tests.use_cases import points_of_two_weeks
+
+
+def test_get_weekly_statistics_200(
+    app: FastAPI,
+    client: TestClient,
+    user: ORMUser,
+    auth_headers: dict[str, str],
+    diary: Diary,
+):
+    for points in points_of_two_weeks:
+        diary.write(user.oid, *points)
+
+    response: Response = client.get(
+        url=app.url_path_for("Получить недельную статистику"),
+        params={"first_date": "2020-12-01", "last_date": "2020-12-31"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json() == [
+        {
+            "period_start": "2020-12-07",
+            "notes_count": 2,
+            "average_sleep": "08:00:00",
+            "average_in_bed": "12:00:00",
+            "sleep_efficiency": 0.62,
+        },
+        {
+            "period_start": "2020-12-14",
+            "notes_count": 1,
+            "average_sleep": "07:15:00",
+            "average_in_bed": "08:20:00",
+            "sleep_efficiency": 0.83,
+        },
+    ]
+
+
+def test_get_monthly_statistics_200(
+    app: FastAPI,
+    client: TestClient,
+    user: ORMUser,
+    auth_headers: dict[str, str],
+    diary: Diary,
+):
+    for points in points_of_two_weeks:
+        diary.write(user.oid, *points)
+
+    response: Response = client.get(
+        url=app.url_path_for("Получить месячную статистику"),
+        params={"first_date": "2020-12-31", "last_date": "2020-12-31"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json() == [
+        {
+            "period_start": "2020-12-01",
+            "notes_count": 3,
+            "average_sleep": "07:45:00",
+            "average_in_bed": "10:47:00",
+            "sleep_efficiency": 0.68,
+        },
+    ]
+
+
+def test_get_weekly_statistics_400_wrong_date_range(
+    app: FastAPI,
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    first_date, last_date = date(2020, 12, 31), date(2020, 12, 1)
+
+    response: Response = client.get(
+        url=app.url_path_for("Получить недельную статистику"),
+        params={"first_date": str(first_date), "last_date": str(last_date)},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["error"] == (
+        InvalidDateRangeException(first_date, last_date).message
+    )
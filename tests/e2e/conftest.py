@@ -1,3 +1,5 @@
+from typing import Generator
+
 import pytest
 
 from fastapi import FastAPI
@@ -6,9 +8,11 @@ from sqlalchemy import Engine, create_engine, text
 from starlette.testclient import TestClient
 
 from src.application.api.main import create_app
-from src.domain.services import INotesRepository
-from src.infra.database import Database
+from src.domain.services import INotesRepository, IStatisticsRepository
+from src.infra.authorization import IUserTokenService
+from src.infra.database import AsyncDatabase, Database
 from src.infra.orm import ORMUser, metadata
+from src.infra.repository import UsersCache
 from src.project.containers import get_container
 from src.project.settings import Settings
 from src.service_layer import Diary
@@ -58,7 +62,12 @@ def database(settings: Settings) -> Database:
 
 
 @pytest.fixture(scope="session")
-def container(database: Database) -> Container:
+def async_database(settings: Settings) -> AsyncDatabase:
+    return AsyncDatabase(settings.test_postgres_async_url)
+
+
+@pytest.fixture(scope="session")
+def container(database: Database, async_database: AsyncDatabase) -> Container:
     container = init_dummy_container()
 
     container.register(
@@ -66,6 +75,11 @@ def container(database: Database) -> Container:
         instance=database,
         scope=Scope.singleton,
     )
+    container.register(
+        AsyncDatabase,
+        instance=async_database,
+        scope=Scope.singleton,
+    )
     return container
 
 
@@ -75,8 +89,8 @@ def repository(container: Container) -> INotesRepository:
 
 
 @pytest.fixture(scope="session")
-def diary(container: Container) -> Diary:
-    return container.resolve(Diary)
+def diary(container: Container, repository: INotesRepository) -> Diary:
+    return Diary(repository, container.resolve(IStatisticsRepository))
 
 
 @pytest.fixture(scope="session")
@@ -92,14 +106,18 @@ def app() -> FastAPI:
 
 
 @pytest.fixture(scope="session")
-def client(app: FastAPI) -> TestClient:
-    return TestClient(app)
+def client(app: FastAPI) -> Generator[TestClient, None, None]:
+    # Один цикл событий на все запросы: соединения asyncpg к нему привязаны.
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(autouse=True)
-def _recreate_tables(engine: Engine) -> None:
+def _recreate_tables(engine: Engine, container: Container) -> None:
     metadata.drop_all(engine)
     metadata.create_all(engine)
+    # Таблицы пересоздаются мимо репозиториев, кэш о них не знает.
+    container.resolve(UsersCache).clear()
 
 
 @pytest.fixture
@@ -115,3 +133,10 @@ def user(container: Container) -> ORMUser:
         session.commit()
         session.refresh(user)
     return user
+
+
+@pytest.fixture
+def auth_headers(container: Container, user: ORMUser) -> dict[str, str]:
+    token_service: IUserTokenService = container.resolve(IUserTokenService)
+    token = token_service.create_access(user.to_entity()).access_token
+    return {"Authorization": f"Bearer {token}"}
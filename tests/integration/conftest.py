@@ -2,7 +2,7 @@ import pytest
 
 from sqlalchemy import text
 
-from src.infra.database import Database
+from src.infra.database import AsyncDatabase, Database
 from src.infra.orm import ORMUser, metadata
 
 
@@ -22,6 +22,14 @@ def memory_database() -> Database:
     return database
 
 
+@pytest.fixture
+async def async_memory_database() -> AsyncDatabase:
+    database = AsyncDatabase(url="sqlite+aiosqlite://")
+    async with database.engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+    return database
+
+
 @pytest.fixture
 def user(memory_database: Database) -> ORMUser:
     user = ORMUser(
@@ -27,7 +27,9 @@ def test_note_orm_from_time_points(memory_database: Database, user: ORMUser):
     assert note_orm.updated_at
     assert note_orm.owner_oid
     assert note_orm.bedtime_date == note.points.bedtime_date
-    assert note_orm.went_to_bed == note.points.went_to_bed
-    assert note_orm.fell_asleep == note.points.fell_asleep
-    assert note_orm.woke_up == note.points.woke_up
-    assert note_orm.got_up == note.points.got_up
+    assert note_orm.went_to_bed == note.points.went_to_bed_minutes
+    assert note_orm.fell_asleep == note.points.fell_asleep_minutes
+    assert note_orm.woke_up == note.points.woke_up_minutes
+    assert note_orm.got_up == note.points.got_up_minutes
+    assert note_orm.no_sleep == note.points.no_sleep_minutes
+    assert note_orm.to_entity().points == note.points
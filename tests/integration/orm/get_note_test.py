@@ -1,5 +1,6 @@
 from uuid import uuid4
 
+from src.domain.services.batch import point_to_minutes
 from src.infra.database import Database
 from src.infra.orm import ORMNote, ORMUser
 from tests.integration.conftest import stmt_insert_note
@@ -23,11 +24,11 @@ def test_get_note(memory_database: Database, user: ORMUser):
                     "oid": f"{expected_note_oid}",
                     "owner_oid": f"{user.oid}",
                     "bedtime_date": bedtime_date.isoformat(),
-                    "went_to_bed": went_to_bed.isoformat(),
-                    "fell_asleep": fell_asleep.isoformat(),
-                    "woke_up": woke_up.isoformat(),
-                    "got_up": got_up.isoformat(),
-                    "no_sleep": no_sleep.isoformat(),
+                    "went_to_bed": point_to_minutes(went_to_bed),
+                    "fell_asleep": point_to_minutes(fell_asleep),
+                    "woke_up": point_to_minutes(woke_up),
+                    "got_up": point_to_minutes(got_up),
+                    "no_sleep": point_to_minutes(no_sleep),
                 },
                 {
                     "oid": f"{uuid4()}",
@@ -35,15 +36,11 @@ def test_get_note(memory_database: Database, user: ORMUser):
                     "bedtime_date": bedtime_date.replace(
                         day=bedtime_date.day + 1,
                     ).isoformat(),
-                    "went_to_bed": went_to_bed.replace(
-                        hour=went_to_bed.hour + 1,
-                    ).isoformat(),
-                    "fell_asleep": fell_asleep.replace(
-                        hour=fell_asleep.hour + 1,
-                    ).isoformat(),
-                    "woke_up": woke_up.replace(hour=woke_up.hour + 1).isoformat(),
-                    "got_up": got_up.replace(hour=got_up.hour + 1).isoformat(),
-                    "no_sleep": no_sleep.replace(hour=no_sleep.hour + 1).isoformat(),
+                    "went_to_bed": point_to_minutes(went_to_bed) + 60,
+                    "fell_asleep": point_to_minutes(fell_asleep) + 60,
+                    "woke_up": point_to_minutes(woke_up) + 60,
+                    "got_up": point_to_minutes(got_up) + 60,
+                    "no_sleep": point_to_minutes(no_sleep) + 60,
                 },
                 {
                     "oid": f"{uuid4()}",
@@ -51,15 +48,11 @@ def test_get_note(memory_database: Database, user: ORMUser):
                     "bedtime_date": bedtime_date.replace(
                         day=bedtime_date.day + 2,
                     ).isoformat(),
-                    "went_to_bed": went_to_bed.replace(
-                        hour=went_to_bed.hour + 2,
-                    ).isoformat(),
-                    "fell_asleep": fell_asleep.replace(
-                        hour=fell_asleep.hour + 2,
-                    ).isoformat(),
-                    "woke_up": woke_up.replace(hour=woke_up.hour + 2).isoformat(),
-                    "got_up": got_up.replace(hour=got_up.hour + 2).isoformat(),
-                    "no_sleep": no_sleep.replace(hour=no_sleep.hour + 2).isoformat(),
+                    "went_to_bed": point_to_minutes(went_to_bed) + 120,
+                    "fell_asleep": point_to_minutes(fell_asleep) + 120,
+                    "woke_up": point_to_minutes(woke_up) + 120,
+                    "got_up": point_to_minutes(got_up) + 120,
+                    "no_sleep": point_to_minutes(no_sleep) + 120,
                 },
             ),
         )
@@ -70,8 +63,8 @@ def test_get_note(memory_database: Database, user: ORMUser):
     assert db_note.oid == expected_note_oid
     assert db_note.owner_oid == user.oid
     assert db_note.bedtime_date == bedtime_date
-    assert db_note.went_to_bed.replace(tzinfo=None) == went_to_bed
-    assert db_note.fell_asleep.replace(tzinfo=None) == fell_asleep
-    assert db_note.woke_up.replace(tzinfo=None) == woke_up
-    assert db_note.got_up.replace(tzinfo=None) == got_up
-    assert db_note.no_sleep.replace(tzinfo=None) == no_sleep
+    assert db_note.went_to_bed == point_to_minutes(went_to_bed)
+    assert db_note.fell_asleep == point_to_minutes(fell_asleep)
+    assert db_note.woke_up == point_to_minutes(woke_up)
+    assert db_note.got_up == point_to_minutes(got_up)
+    assert db_note.no_sleep == point_to_minutes(no_sleep)
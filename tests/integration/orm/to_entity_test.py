@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 from src.domain.entities import NoteEntity
+from src.domain.services.batch import point_to_minutes
 from src.domain.values.points import Points
 from src.infra.database import Database
 from src.infra.orm import ORMNote, ORMUser
@@ -19,11 +20,11 @@ def test_note_orm_to_entity(memory_database: Database, user: ORMUser):
         "oid": str(note_oid),
         "bedtime_date": bedtime_date.isoformat(),
         "owner_oid": str(user.oid),
-        "went_to_bed": went_to_bed.isoformat(),
-        "fell_asleep": fell_asleep.isoformat(),
-        "woke_up": woke_up.isoformat(),
-        "got_up": got_up.isoformat(),
-        "no_sleep": no_sleep.isoformat(),
+        "went_to_bed": point_to_minutes(went_to_bed),
+        "fell_asleep": point_to_minutes(fell_asleep),
+        "woke_up": point_to_minutes(woke_up),
+        "got_up": point_to_minutes(got_up),
+        "no_sleep": point_to_minutes(no_sleep),
     }
 
     with memory_database.get_session() as session:
@@ -0,0 +1,194 @@
+from datetime import date, time
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import NoteEntity, UserEntity
+from src.domain.exceptions import NonUniqueNoteBedtimeDateException
+from src.domain.services import Period
+from src.domain.values.points import Points
+from src.infra.database import AsyncDatabase
+from src.infra.repository import (
+    AsyncORMNotesRepository,
+    AsyncORMRefreshTokensRepository,
+    AsyncORMStatisticsRepository,
+    AsyncORMUsersRepository,
+)
+from tests.use_cases import points_of_two_weeks
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def async_user(async_memory_database: AsyncDatabase) -> UserEntity:
+    repository = AsyncORMUsersRepository(async_memory_database)
+    await repository.add_user(
+        UserEntity(username="test_user", password="test_password"),
+    )
+    user = await repository.get_by_username("test_user")
+    assert user is not None
+    return user
+
+
+async def test_async_users_repo_returns_none_for_unknown_username(
+    async_memory_database: AsyncDatabase,
+):
+    repository = AsyncORMUsersRepository(async_memory_database)
+
+    assert await repository.get_by_username("unknown") is None
+
+
+async def test_async_users_repo_update_password(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMUsersRepository(async_memory_database)
+
+    await repository.update_password(async_user.username, "new_password")
+
+    user = await repository.get_by_username(async_user.username)
+    assert user is not None
+    assert (user.oid, user.password) == (async_user.oid, "new_password")
+
+
+async def test_async_users_repo_add_user_if_absent(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMUsersRepository(async_memory_database)
+
+    assert not await repository.add_user_if_absent(
+        UserEntity(username=async_user.username, password="other_password"),
+    )
+    assert await repository.add_user_if_absent(
+        UserEntity(username="other_user", password="other_password"),
+    )
+
+    user = await repository.get_by_username(async_user.username)
+    assert user is not None and user.password == async_user.password
+
+
+async def test_async_refresh_tokens_repo_rotate(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMRefreshTokensRepository(async_memory_database)
+    family_oid = uuid4()
+    await repository.add_family(family_oid, async_user.oid, "first", exp=100)
+
+    assert await repository.rotate(family_oid, "first", "second", exp=200)
+    assert not await repository.rotate(family_oid, "first", "third", exp=300)
+
+
+async def test_async_notes_repo_add_and_get(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMNotesRepository(async_memory_database)
+    note = NoteEntity(
+        owner_oid=async_user.oid,
+        points=Points(*points_of_two_weeks[0]),
+    )
+
+    await repository.add(note)
+
+    assert await repository.get_by_oid(note.oid) == note
+    bedtime_date = note.points.bedtime_date
+    assert await repository.get_by_bedtime_date(bedtime_date, note.owner_oid) == note
+    assert await repository.get_all_notes(async_user.oid) == {note}
+
+
+async def test_async_notes_repo_cannot_add_same_bedtime_date(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMNotesRepository(async_memory_database)
+    points = Points(*points_of_two_weeks[0])
+    await repository.add(NoteEntity(owner_oid=async_user.oid, points=points))
+
+    with pytest.raises(NonUniqueNoteBedtimeDateException):
+        await repository.add(NoteEntity(owner_oid=async_user.oid, points=points))
+
+    duplicate = NoteEntity(owner_oid=async_user.oid, points=points)
+    assert await repository.add_many([duplicate]) == {duplicate}
+    assert len(await repository.get_all_notes(async_user.oid)) == 1
+
+
+async def test_async_repos_keep_statistics_with_notes(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMNotesRepository(async_memory_database)
+    statistics_repository = AsyncORMStatisticsRepository(async_memory_database)
+    notes = [
+        NoteEntity(owner_oid=async_user.oid, points=Points(*points))
+        for points in points_of_two_weeks
+    ]
+    first_date, last_date = date(2000, 1, 1), date(2100, 1, 1)
+
+    assert await repository.add_many(notes) == set()
+    expected = await statistics_repository.get_statistics(
+        async_user.oid,
+        Period.WEEK,
+        first_date,
+        last_date,
+    )
+    assert sum(statistics.notes_count for statistics in expected) == len(notes)
+
+    bedtime_date = notes[-1].points.bedtime_date
+    assert await repository.delete(async_user.oid, bedtime_date) == notes[-1]
+    assert await repository.delete(async_user.oid, bedtime_date) is None
+    await repository.add(notes[-1])
+    assert (
+        await statistics_repository.get_statistics(
+            async_user.oid,
+            Period.WEEK,
+            first_date,
+            last_date,
+        )
+        == expected
+    )
+    assert await statistics_repository.rebuild(async_user.oid) == 3
+
+
+async def test_async_notes_repo_update(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMNotesRepository(async_memory_database)
+    note = NoteEntity(
+        owner_oid=async_user.oid,
+        points=Points(*points_of_two_weeks[0]),
+    )
+    await repository.add(note)
+    points = note.points
+    updated = NoteEntity(
+        owner_oid=async_user.oid,
+        points=Points(
+            points.bedtime_date,
+            points.went_to_bed,
+            points.fell_asleep,
+            points.woke_up,
+            points.got_up,
+            time(0, 30),
+        ),
+    )
+
+    assert await repository.update(updated) == note
+    result = await repository.get_by_oid(note.oid)
+    assert result is not None and result.points.no_sleep == time(0, 30)
+
+
+async def test_async_notes_repo_iter_notes(
+    async_memory_database: AsyncDatabase,
+    async_user: UserEntity,
+):
+    repository = AsyncORMNotesRepository(async_memory_database)
+    notes = [
+        NoteEntity(owner_oid=async_user.oid, points=Points(*points))
+        for points in points_of_two_weeks
+    ]
+    await repository.add_many(reversed(notes))
+
+    assert [note async for note in repository.iter_notes(async_user.oid)] == notes
@@ -1,12 +1,15 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 
-from sqlalchemy import text
+import pytest
+
+from sqlalchemy import select, text, update
 
 from src.domain.entities import NoteEntity
+from src.domain.exceptions import NonUniqueNoteBedtimeDateException
 from src.domain.services import DiaryService
 from src.domain.values.points import Points
-from src.infra.database import Database
+from src.infra.database import Database, SessionScope
 from src.infra.orm import ORMNote, ORMUser
 from src.infra.repository import ORMNotesRepository
 from tests.use_cases import points_order_desc_from_went_to_bed
@@ -33,13 +36,28 @@ def test_repo_can_add_and_save_note(memory_database: Database, user: ORMUser):
         )
     assert result == (
         points.bedtime_date.isoformat(),
-        points.went_to_bed.isoformat("microseconds"),
-        points.fell_asleep.isoformat("microseconds"),
-        points.woke_up.isoformat("microseconds"),
-        points.got_up.isoformat("microseconds"),
+        points.went_to_bed_minutes,
+        points.fell_asleep_minutes,
+        points.woke_up_minutes,
+        points.got_up_minutes,
     )
 
 
+def test_repo_cannot_add_note_with_same_bedtime_date(
+    memory_database: Database,
+    user: ORMUser,
+):
+    points = Points(*points_order_desc_from_went_to_bed)
+    repository = ORMNotesRepository(memory_database)
+    repository.add(NoteEntity(owner_oid=user.oid, points=points))
+
+    with pytest.raises(NonUniqueNoteBedtimeDateException) as excinfo:
+        repository.add(NoteEntity(owner_oid=user.oid, points=points))
+
+    assert excinfo.value.bedtime_date == points.bedtime_date
+    assert len(repository.get_all_notes(user.oid)) == 1
+
+
 def insert_note(memory_database: Database, user: ORMUser, points: Points) -> ORMNote:
     note = NoteEntity(
         oid=uuid4(),
@@ -81,6 +99,29 @@ def test_repo_can_retrieve_note_entity_by_oid(
     assert retrieved_entity.points.no_sleep == points.no_sleep
 
 
+def test_repo_reads_timestamps_like_orm_note(
+    memory_database: Database,
+    user: ORMUser,
+):
+    inserted_note_orm = insert_note(
+        memory_database,
+        user,
+        Points(*points_order_desc_from_went_to_bed),
+    )
+    timestamp = datetime(2020, 12, 1, 12, 30, 15, 123456)
+    with memory_database.get_session() as session:
+        session.execute(
+            update(ORMNote).values(created_at=timestamp, updated_at=timestamp),
+        )
+        expected = session.scalars(select(ORMNote)).one().to_entity()
+
+    note = ORMNotesRepository(memory_database).get_by_oid(inserted_note_orm.oid)
+
+    assert note is not None
+    assert note.created_at == expected.created_at == timestamp.replace(microsecond=0)
+    assert note.updated_at == expected.updated_at
+
+
 def test_repo_can_retrieve_note_entity_by_bedtime_date(
     memory_database: Database,
     user: ORMUser,
@@ -122,3 +163,114 @@ def test_repo_can_retrieve_diary(memory_database: Database, user: ORMUser):
     assert diary.notes_list == {
         NoteEntity(oid=fake_oid, owner_oid=user.oid, points=points),
     }
+
+
+def test_repo_add_many_returns_not_added_notes(
+    memory_database: Database,
+    user: ORMUser,
+):
+    bedtime_date, *time_points = points_order_desc_from_went_to_bed
+    notes = [
+        NoteEntity(
+            owner_oid=user.oid,
+            points=Points(bedtime_date + timedelta(days=day), *time_points),
+        )
+        for day in range(3)
+    ]
+    repository = ORMNotesRepository(memory_database)
+    repository.add(notes[0])
+
+    not_added = repository.add_many(notes)
+
+    assert not_added == {notes[0]}
+    assert repository.get_all_notes(user.oid) == set(notes)
+    assert repository.add_many([]) == set()
+
+
+def test_repo_date_range_and_latest_pages(memory_database: Database, user: ORMUser):
+    repository = ORMNotesRepository(memory_database)
+    bedtime_date, *time_points = points_order_desc_from_went_to_bed
+    notes = [
+        NoteEntity(
+            owner_oid=user.oid,
+            points=Points(bedtime_date + timedelta(days=day), *time_points),
+        )
+        for day in range(5)
+    ]
+    repository.add_many(notes)
+
+    assert (
+        repository.get_by_date_range(
+            user.oid,
+            notes[1].points.bedtime_date,
+            notes[3].points.bedtime_date,
+        )
+        == notes[1:4]
+    )
+
+    pages, before = [], None
+    while page := repository.get_latest(user.oid, 2, before=before):
+        pages.append(page)
+        before = page[-1].points.bedtime_date
+    assert pages == [notes[4:2:-1], notes[2:0:-1], notes[:1]]
+
+
+def test_repo_iter_notes_in_batches(
+    memory_database: Database,
+    user: ORMUser,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(ORMNotesRepository, "STREAM_BATCH_SIZE", 2)
+    repository = ORMNotesRepository(memory_database)
+    bedtime_date, *time_points = points_order_desc_from_went_to_bed
+    notes = [
+        NoteEntity(
+            owner_oid=user.oid,
+            points=Points(bedtime_date + timedelta(days=day), *time_points),
+        )
+        for day in range(5)
+    ]
+    repository.add_many(reversed(notes))
+
+    assert list(repository.iter_notes(user.oid)) == notes
+
+
+def test_repo_reads_do_not_revalidate_points(
+    memory_database: Database,
+    user: ORMUser,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repository = ORMNotesRepository(memory_database)
+    note = NoteEntity(
+        owner_oid=user.oid,
+        points=Points(*points_order_desc_from_went_to_bed),
+    )
+    repository.add(note)
+
+    def validate(self: Points) -> None:
+        raise AssertionError("Points проверены при записи")
+
+    monkeypatch.setattr(Points, "validate", validate)
+
+    assert repository.get_all_notes(user.oid) == {note}
+    stored = repository.get_by_oid(note.oid)
+    assert stored is not None and stored.points == note.points
+
+
+def test_repo_reads_do_not_fill_identity_map(
+    memory_database: Database,
+    user: ORMUser,
+):
+    note = NoteEntity(
+        owner_oid=user.oid,
+        points=Points(*points_order_desc_from_went_to_bed),
+    )
+    ORMNotesRepository(memory_database).add(note)
+
+    with memory_database.get_session() as session:
+        repository = ORMNotesRepository(SessionScope(session))
+
+        assert repository.get_all_notes(user.oid) == {note}
+        assert repository.get_by_oid(note.oid) == note
+        assert repository.get_latest(user.oid, 1) == [note]
+        assert list(session.identity_map.values()) == []
@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from src.infra.database import Database
+from src.infra.orm import ORMUser
+from src.infra.repository import ORMRefreshTokensRepository
+
+
+def test_rotate_replaces_current_jti_once(memory_database: Database, user: ORMUser):
+    repository = ORMRefreshTokensRepository(memory_database)
+    family_oid = uuid4()
+    repository.add_family(family_oid, user.oid, "first", exp=100)
+
+    assert repository.rotate(family_oid, "first", "second", exp=200)
+    assert not repository.rotate(family_oid, "first", "third", exp=300)
+    assert repository.rotate(family_oid, "second", "third", exp=300)
+
+
+def test_delete_family_and_expired(memory_database: Database, user: ORMUser):
+    repository = ORMRefreshTokensRepository(memory_database)
+    deleted, expired, active = uuid4(), uuid4(), uuid4()
+    repository.add_family(deleted, user.oid, "deleted", exp=500)
+    repository.add_family(expired, user.oid, "expired", exp=100)
+    repository.add_family(active, user.oid, "active", exp=500)
+
+    assert repository.delete_family(deleted)
+    assert not repository.delete_family(deleted)
+
+    assert repository.delete_expired(now=200) == 1
+    assert not repository.rotate(deleted, "deleted", "new", exp=600)
+    assert not repository.rotate(expired, "expired", "new", exp=600)
+    assert repository.rotate(active, "active", "new", exp=600)
@@ -0,0 +1,106 @@
+from datetime import date, time, timedelta
+
+from sqlalchemy import delete
+
+from src.domain.entities import NoteEntity
+from src.domain.services import Period
+from src.domain.values.points import Points
+from src.infra.database import Database
+from src.infra.orm import ORMNoteStatistics, ORMUser
+from src.infra.repository import (
+    MemoryNotesRepository,
+    ORMNotesRepository,
+    ORMStatisticsRepository,
+)
+from tests.use_cases import (
+    correct_points_4_different_order_of_sequences_and_one_hour_no_sleep,
+    points_of_two_weeks,
+)
+
+
+FIRST_DATE, LAST_DATE = date(2020, 12, 1), date(2021, 1, 31)
+
+
+def create_notes(user: ORMUser) -> list[NoteEntity]:
+    notes = [
+        NoteEntity(owner_oid=user.oid, points=Points(*points))
+        for points in points_of_two_weeks
+    ]
+    for day, (bedtime_date, *time_points) in enumerate(
+        correct_points_4_different_order_of_sequences_and_one_hour_no_sleep * 6,
+        start=3,
+    ):
+        notes.append(
+            NoteEntity(
+                owner_oid=user.oid,
+                points=Points(bedtime_date + timedelta(days=day), *time_points),
+            ),
+        )
+    return notes
+
+
+def test_repo_statistics_are_updated_with_notes(
+    memory_database: Database,
+    user: ORMUser,
+):
+    notes = create_notes(user)
+    first_note, *other_notes = notes
+    updated_note = NoteEntity(
+        owner_oid=user.oid,
+        points=Points(*points_of_two_weeks[1][:-1], time(0, 30)),
+    )
+    notes_repository = ORMNotesRepository(memory_database)
+    statistics_repository = ORMStatisticsRepository(memory_database)
+    memory_notes_repository = MemoryNotesRepository()
+
+    for repository in (notes_repository, memory_notes_repository):
+        repository.add(first_note)
+        repository.add_many(other_notes)
+        repository.update(updated_note)
+        repository.delete(user.oid, notes[-1].points.bedtime_date)
+
+    for period in Period:
+        statistics = statistics_repository.get_statistics(
+            user.oid,
+            period,
+            FIRST_DATE,
+            LAST_DATE,
+        )
+        expected = memory_notes_repository.statistics_repository.get_statistics(
+            user.oid,
+            period,
+            FIRST_DATE,
+            LAST_DATE,
+        )
+        assert statistics
+        assert statistics == expected
+
+
+def test_repo_statistics_rebuild(memory_database: Database, user: ORMUser):
+    notes_repository = ORMNotesRepository(memory_database)
+    statistics_repository = ORMStatisticsRepository(memory_database)
+    notes_repository.add_many(create_notes(user))
+    expected = {
+        period: statistics_repository.get_statistics(
+            user.oid,
+            period,
+            FIRST_DATE,
+            LAST_DATE,
+        )
+        for period in Period
+    }
+
+    with memory_database.get_session() as session:
+        session.execute(delete(ORMNoteStatistics))
+
+    rebuilt = statistics_repository.rebuild()
+
+    assert rebuilt == sum(map(len, expected.values()))
+    for period in Period:
+        assert expected[period] == statistics_repository.get_statistics(
+            user.oid,
+            period,
+            FIRST_DATE,
+            LAST_DATE,
+        )
+    assert statistics_repository.rebuild(user.oid) == rebuilt
@@ -0,0 +1,17 @@
+from src.domain.entities import UserEntity
+from src.infra.database import Database
+from src.infra.repository import ORMUsersRepository
+
+
+def test_add_user_if_absent_keeps_existing_user(memory_database: Database):
+    repository = ORMUsersRepository(memory_database)
+    first = UserEntity(username="test_user", password="first_password")
+
+    assert repository.add_user_if_absent(first)
+    assert not repository.add_user_if_absent(
+        UserEntity(username="test_user", password="second_password"),
+    )
+
+    user = repository.get_by_username("test_user")
+    assert user is not None
+    assert (user.oid, user.password) == (first.oid, "first_password")
@@ -0,0 +1,71 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import NoteEntity
+from src.domain.services import Period
+from src.domain.values.points import Points
+from src.infra.database import AsyncDatabase, Database
+from src.infra.instrumentation import StatementCounter
+from src.infra.orm import ORMUser
+from src.infra.repository import (
+    AsyncORMNotesRepository,
+    ORMNotesRepository,
+    ORMStatisticsRepository,
+    ORMUsersRepository,
+)
+from tests.use_cases import points_order_desc_from_went_to_bed
+
+
+def test_reads_send_only_select(memory_database: Database, user: ORMUser):
+    notes_repository = ORMNotesRepository(memory_database)
+    note = NoteEntity(
+        owner_oid=user.oid,
+        points=Points(*points_order_desc_from_went_to_bed),
+    )
+    notes_repository.add(note)
+    reads = (
+        lambda: notes_repository.get_by_oid(note.oid),
+        lambda: notes_repository.get_by_bedtime_date(
+            note.points.bedtime_date,
+            user.oid,
+        ),
+        lambda: notes_repository.get_all_notes(user.oid),
+        lambda: ORMUsersRepository(memory_database).get_by_username(user.username),
+        lambda: ORMStatisticsRepository(memory_database).get_statistics(
+            user.oid,
+            Period.WEEK,
+            date.min,
+            date.max,
+        ),
+    )
+
+    for read in reads:
+        with StatementCounter(memory_database.engine) as counter:
+            assert read()
+        assert counter.counts == {"statement": 1}
+
+
+def test_writes_keep_transaction(memory_database: Database, user: ORMUser):
+    repository = ORMNotesRepository(memory_database)
+    note = NoteEntity(
+        owner_oid=user.oid,
+        points=Points(*points_order_desc_from_went_to_bed),
+    )
+
+    with StatementCounter(memory_database.engine) as counter:
+        repository.add(note)
+
+    assert counter.counts["begin"] == counter.counts["commit"] == 1
+
+
+@pytest.mark.anyio
+async def test_async_reads_send_only_select(async_memory_database: AsyncDatabase):
+    repository = AsyncORMNotesRepository(async_memory_database)
+
+    with StatementCounter(async_memory_database.engine) as counter:
+        assert await repository.get_by_oid(uuid4()) is None
+        assert await repository.get_all_notes(uuid4()) == set()
+
+    assert counter.counts == {"statement": 2}
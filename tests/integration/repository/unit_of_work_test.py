@@ -0,0 +1,95 @@
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import Engine, event
+
+from src.domain.entities import NoteEntity, UserEntity
+from src.domain.values.points import Points
+from src.infra.database import AsyncDatabase, Database
+from src.infra.orm import ORMUser, metadata
+from src.infra.repository import ORMNotesRepository
+from src.infra.unit_of_work import (
+    AsyncORMUnitOfWork,
+    ORMUnitOfWork,
+    ThreadPoolUnitOfWork,
+)
+from tests.use_cases import points_order_desc_from_went_to_bed
+
+
+class Rollback(Exception):
+    pass
+
+
+def count_checkouts(engine: Engine) -> Counter[str]:
+    checkouts: Counter[str] = Counter()
+    event.listen(
+        engine,
+        "checkout",
+        lambda *args: checkouts.update(["checkout"]),
+    )
+    return checkouts
+
+
+def test_unit_of_work_uses_one_connection(memory_database: Database):
+    checkouts = count_checkouts(memory_database.engine)
+    user = UserEntity(username="new_user", password="password")
+
+    with ORMUnitOfWork(memory_database) as unit_of_work:
+        assert unit_of_work.users.get_by_username(user.username) is None
+        unit_of_work.users.add_user(user)
+        assert unit_of_work.users.get_by_username(user.username) == user
+
+    assert checkouts["checkout"] == 1
+    with ORMUnitOfWork(memory_database) as unit_of_work:
+        assert unit_of_work.users.get_by_username(user.username) == user
+
+
+def test_unit_of_work_rollback_on_exception(
+    memory_database: Database,
+    user: ORMUser,
+):
+    note = NoteEntity(
+        owner_oid=user.oid,
+        points=Points(*points_order_desc_from_went_to_bed),
+    )
+
+    with pytest.raises(Rollback), ORMUnitOfWork(memory_database) as unit_of_work:
+        unit_of_work.notes.add(note)
+        assert unit_of_work.notes.get_by_oid(note.oid) == note
+        raise Rollback
+
+    assert ORMNotesRepository(memory_database).get_by_oid(note.oid) is None
+
+
+@pytest.mark.anyio
+async def test_async_unit_of_work(async_memory_database: AsyncDatabase):
+    user = UserEntity(username="new_user", password="password")
+
+    with pytest.raises(Rollback):
+        async with AsyncORMUnitOfWork(async_memory_database) as unit_of_work:
+            await unit_of_work.users.add_user(user)
+            assert await unit_of_work.users.get_by_username(user.username) == user
+            raise Rollback
+
+    async with AsyncORMUnitOfWork(async_memory_database) as unit_of_work:
+        assert await unit_of_work.users.get_by_username(user.username) is None
+        await unit_of_work.users.add_user(user)
+
+    async with AsyncORMUnitOfWork(async_memory_database) as unit_of_work:
+        assert await unit_of_work.users.get_by_username(user.username) == user
+
+
+@pytest.mark.anyio
+async def test_thread_pool_unit_of_work(tmp_path: Path):
+    # sqlite в памяти у каждого потока своя, поэтому база в файле.
+    database = Database(url=f"sqlite:///{tmp_path / 'database.sqlite3'}")
+    metadata.create_all(database.engine)
+    user = UserEntity(username="new_user", password="password")
+
+    async with ThreadPoolUnitOfWork(ORMUnitOfWork(database)) as unit_of_work:
+        await unit_of_work.users.add_user(user)
+
+    with ORMUnitOfWork(database) as unit_of_work:
+        assert unit_of_work.users.get_by_username(user.username) == user
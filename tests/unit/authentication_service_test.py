@@ -1,9 +1,16 @@
+from typing import Any, Callable
+
 import pytest
 
 from src.domain.entities import UserEntity
-from src.domain.services import IUsersRepository
+from src.domain.services import IAsyncUsersRepository, IUsersRepository
 from src.domain.specifications import UserCredentialsSpecification
-from src.infra.repository import MemoryUsersRepository
+from src.infra.repository import (
+    AsyncCachedUsersRepository,
+    MemoryUsersRepository,
+    ThreadPoolUsersRepository,
+    UsersCache,
+)
 from src.service_layer.exceptions import (
     LogInException,
     NotAuthenticatedException,
@@ -11,6 +18,8 @@ from src.service_layer.exceptions import (
     UserNameAlreadyExistException,
 )
 from src.service_layer.services import (
+    AsyncUserAuthenticationService,
+    IAsyncUserAuthenticationService,
     IUserAuthenticationService,
     NotAuthenticated,
     UserAuthenticationService,
@@ -248,6 +257,59 @@ def test_register_username_already_exist_exception(
     assert len(user_repository._saved_users) == 1
 
 
+def test_register_fresh_username_single_repository_call(
+    created_user: UserEntity,
+    user_repository: MemoryUsersRepository,
+    authentication_service: IUserAuthenticationService,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls: list[str] = []
+
+    def spy(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        def call(*args: Any) -> Any:
+            calls.append(name)
+            return method(*args)
+
+        return call
+
+    for name in ("get_by_username", "add_user", "add_user_if_absent"):
+        method = getattr(user_repository, name)
+        monkeypatch.setattr(user_repository, name, spy(name, method))
+
+    authentication_service.register(created_user.username, created_user.password)
+
+    assert calls == ["add_user_if_absent"]
+
+
+@pytest.mark.anyio
+async def test_async_register_username_known_to_cache_skips_hashing(
+    created_user: UserEntity,
+    created_user_with_hashed_password: UserEntity,
+    user_repository: IUsersRepository,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    user_repository.add_user(created_user_with_hashed_password)
+    repository = AsyncCachedUsersRepository(
+        ThreadPoolUsersRepository(user_repository),
+        UsersCache(),
+    )
+    await repository.get_by_username(created_user.username)
+    hashed: list[tuple[object, ...]] = []
+    monkeypatch.setattr(
+        AsyncUserAuthenticationService,
+        "hash_password",
+        staticmethod(lambda *args: hashed.append(args)),
+    )
+
+    with pytest.raises(UserNameAlreadyExistException):
+        await AsyncUserAuthenticationService(repository).register(
+            created_user.username,
+            created_user.password,
+        )
+
+    assert hashed == []
+
+
 @pytest.mark.parametrize(
     "wrong_format_credentials",
     [
@@ -301,3 +363,83 @@ def test_correct_unregister(
     authentication_service.unregister()
 
     assert user_repository.get_by_username(created_user.username) is None
+
+
+@pytest.mark.anyio
+async def test_async_register_and_login(
+    created_user: UserEntity,
+    user_repository: IUsersRepository,
+    async_authentication_service: IAsyncUserAuthenticationService,
+):
+    with pytest.raises(LogInException):
+        await async_authentication_service.login(
+            created_user.username,
+            created_user.password,
+        )
+
+    await async_authentication_service.register(
+        created_user.username,
+        created_user.password,
+    )
+    with pytest.raises(UserNameAlreadyExistException):
+        await async_authentication_service.register(
+            created_user.username,
+            created_user.password,
+        )
+    with pytest.raises(LogInException):
+        await async_authentication_service.login(created_user.username, "wrong")
+    await async_authentication_service.login(
+        created_user.username,
+        created_user.password,
+    )
+
+    assert async_authentication_service.user == user_repository.get_by_username(
+        created_user.username,
+    )
+    await async_authentication_service.logout()
+    with pytest.raises(NotAuthenticatedException):
+        await async_authentication_service.logout()
+
+
+def test_login_rehashes_password_with_configured_rounds(
+    created_user: UserEntity,
+    user_repository: IUsersRepository,
+):
+    UserAuthenticationService(user_repository, password_rounds=4).register(
+        created_user.username,
+        created_user.password,
+    )
+    service = UserAuthenticationService(user_repository, password_rounds=5)
+
+    service.login(created_user.username, created_user.password)
+    service.login(created_user.username, created_user.password)
+
+    user = user_repository.get_by_username(created_user.username)
+    assert user is not None
+    hashed_password = user.password
+    assert UserAuthenticationService.hashed_password_rounds(hashed_password) == 5
+
+
+@pytest.mark.anyio
+async def test_async_login_rehashes_password_with_configured_rounds(
+    created_user: UserEntity,
+    user_repository: IUsersRepository,
+    async_user_repository: IAsyncUsersRepository,
+):
+    await AsyncUserAuthenticationService(
+        async_user_repository,
+        password_rounds=4,
+    ).register(created_user.username, created_user.password)
+    service = AsyncUserAuthenticationService(
+        async_user_repository,
+        password_rounds=5,
+    )
+
+    await service.login(created_user.username, created_user.password)
+
+    user = user_repository.get_by_username(created_user.username)
+    assert user is not None
+    hashed_password = user.password
+    assert UserAuthenticationService.hashed_password_rounds(hashed_password) == 5
+    with pytest.raises(LogInException):
+        await service.login(created_user.username, "wrong_password")
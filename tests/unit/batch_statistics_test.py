@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.domain.services import BatchStatistics, Durations, PointsColumns, Statistics
+from src.domain.services.batch import MINUTES_IN_DAY, round_efficiency
+from tests import use_cases
+from tests.unit.conftest import FakePoints
+
+
+def _use_cases_points() -> list[FakePoints]:
+    cases = []
+    for value in vars(use_cases).values():
+        if not isinstance(value, tuple) or not value:
+            continue
+        if isinstance(value[0], date):
+            cases.append(value)
+        elif all(isinstance(case, tuple) for case in value):
+            cases.extend(value)
+    return [FakePoints(*case) for case in cases]
+
+
+def _minutes(duration: timedelta) -> int:
+    return duration.seconds // 60
+
+
+def test_batch_statistics_matches_scalar_statistics_for_all_use_cases():
+    points = _use_cases_points()
+    statistics = BatchStatistics(PointsColumns.from_points(points))
+
+    for index, note_points in enumerate(points):
+        durations = Durations(note_points)
+        assert statistics.sleep[index] == _minutes(durations.sleep)
+        assert statistics.in_bed[index] == _minutes(durations.in_bed)
+        assert statistics.without_sleep[index] == _minutes(durations.without_sleep)
+        assert statistics.sleep_minus_no_sleep[index] == _minutes(
+            durations.sleep_minus_without_sleep,
+        )
+        assert (
+            statistics.sleep_efficiency[index]
+            == Statistics(durations).sleep_efficiency
+        )
+
+
+def test_batch_statistics_of_empty_batch():
+    statistics = BatchStatistics(PointsColumns.from_points([]))
+
+    assert len(statistics.sleep_efficiency) == 0
+
+
+def test_round_efficiency_matches_builtin_round_for_all_minutes_ratios():
+    small, big = np.meshgrid(
+        np.arange(MINUTES_IN_DAY),
+        np.arange(1, MINUTES_IN_DAY),
+        indexing="ij",
+    )
+    small, big = small.ravel(), big.ravel()
+    ratios = small / big
+
+    expected = [round(ratio, 2) for ratio in ratios.tolist()]
+
+    assert round_efficiency(ratios).tolist() == expected
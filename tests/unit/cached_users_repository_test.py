@@ -0,0 +1,145 @@
+from dataclasses import dataclass, field
+from typing_extensions import Self
+
+import pytest
+
+from src.domain.entities import UserEntity
+from src.domain.services import IUsersRepository
+from src.infra.repository import (
+    AsyncCachedUsersRepository,
+    MemoryUsersRepository,
+    ThreadPoolUsersRepository,
+    UsersCache,
+)
+from tests.unit.conftest import FakeClock
+
+
+@dataclass
+class CountingUsersRepository(IUsersRepository):
+    repository: MemoryUsersRepository = field(default_factory=MemoryUsersRepository)
+    reads: int = 0
+
+    def get_by_username(self: Self, username: str) -> UserEntity | None:
+        self.reads += 1
+        return self.repository.get_by_username(username)
+
+    def add_user(self: Self, user: UserEntity) -> None:
+        self.repository.add_user(user)
+
+    def add_user_if_absent(self: Self, user: UserEntity) -> bool:
+        return self.repository.add_user_if_absent(user)
+
+    def update_password(self: Self, username: str, password: str) -> None:
+        self.repository.update_password(username, password)
+
+    def delete_user(self: Self, username: str) -> None:
+        self.repository.delete_user(username)
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> UsersCache:
+    return UsersCache(max_size=2, ttl=5, clock=clock)
+
+
+@pytest.fixture
+def origin() -> CountingUsersRepository:
+    return CountingUsersRepository()
+
+
+@pytest.fixture
+def repository(
+    origin: CountingUsersRepository,
+    cache: UsersCache,
+) -> AsyncCachedUsersRepository:
+    return AsyncCachedUsersRepository(ThreadPoolUsersRepository(origin), cache)
+
+
+@pytest.mark.anyio
+async def test_unknown_username_cached_until_add_user(
+    repository: AsyncCachedUsersRepository,
+    origin: CountingUsersRepository,
+    cache: UsersCache,
+):
+    assert await repository.get_by_username("user") is None
+    assert await repository.get_by_username("user") is None
+    assert origin.reads == 1
+
+    await repository.add_user(UserEntity(username="user", password="hash"))
+    repository.invalidate_written()
+    assert await repository.get_by_username("user") is not None
+    assert await repository.get_by_username("user") is not None
+
+    assert origin.reads == 2
+    metrics = cache.metrics
+    assert (metrics.hits, metrics.negative_hits, metrics.misses) == (1, 1, 2)
+
+
+@pytest.mark.anyio
+async def test_update_and_delete_invalidate(
+    repository: AsyncCachedUsersRepository,
+    origin: CountingUsersRepository,
+):
+    await repository.add_user(UserEntity(username="user", password="hash"))
+    repository.invalidate_written()
+    await repository.get_by_username("user")
+
+    await repository.update_password("user", "new_hash")
+    repository.invalidate_written()
+    user = await repository.get_by_username("user")
+    assert user is not None and user.password == "new_hash"
+
+    await repository.delete_user("user")
+    repository.invalidate_written()
+    assert await repository.get_by_username("user") is None
+    assert origin.reads == 3
+
+
+@pytest.mark.anyio
+async def test_entries_expire_and_evict_least_recent(
+    repository: AsyncCachedUsersRepository,
+    origin: CountingUsersRepository,
+    cache: UsersCache,
+    clock: FakeClock,
+):
+    await repository.get_by_username("first")
+    clock.now = 5
+    await repository.get_by_username("first")
+    assert origin.reads == 2
+
+    await repository.get_by_username("second")
+    await repository.get_by_username("third")
+
+    assert len(cache) == 2
+    await repository.get_by_username("first")
+    assert origin.reads == 5
+
+
+@pytest.mark.anyio
+async def test_async_writes_reach_cache_after_invalidate_written(
+    repository: AsyncCachedUsersRepository,
+    origin: CountingUsersRepository,
+    cache: UsersCache,
+):
+    assert await repository.get_by_username("user") is None
+
+    await repository.add_user(UserEntity(username="user", password="hash"))
+    assert await repository.get_by_username("user") is not None
+    assert cache.get("user")[:2] == (True, None)
+
+    repository.invalidate_written()
+    assert cache.get("user")[:2] == (False, None)
+    assert await repository.get_by_username("user") is not None
+    assert origin.reads == 3
+
+
+def test_put_after_invalidate_keeps_stale_read_out(cache: UsersCache):
+    found, _, generation = cache.get("user")
+    assert not found
+
+    cache.invalidate("user")
+    cache.put("user", None, generation)
+    assert cache.get("user")[0] is False
+
+    _, _, generation = cache.get("user")
+    cache.put("user", None, generation)
+    assert cache.get("user")[:2] == (True, None)
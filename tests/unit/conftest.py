@@ -3,11 +3,24 @@ from typing_extensions import Self
 import pytest
 
 from src.domain.entities import UserEntity
-from src.domain.services import INotesRepository, IUsersRepository
+from src.domain.services import (
+    IAsyncUsersRepository,
+    INotesRepository,
+    IStatisticsRepository,
+    IUsersRepository,
+)
 from src.domain.values.points import Points
-from src.infra.repository import MemoryNotesRepository, MemoryUsersRepository
-from src.service_layer import Diary
+from src.infra.repository import (
+    MemoryNotesRepository,
+    MemoryUsersRepository,
+    ThreadPoolNotesRepository,
+    ThreadPoolStatisticsRepository,
+    ThreadPoolUsersRepository,
+)
+from src.service_layer import AsyncDiary, Diary
 from src.service_layer.services import (
+    AsyncUserAuthenticationService,
+    IAsyncUserAuthenticationService,
     IUserAuthenticationService,
     UserAuthenticationService,
 )
@@ -17,11 +30,31 @@ class FakePoints(Points):
     def validate(self: Self) -> None: ...
 
 
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
 @pytest.fixture
 def notes_repository() -> INotesRepository:
     return MemoryNotesRepository()
 
 
+@pytest.fixture
+def statistics_repository(
+    notes_repository: MemoryNotesRepository,
+) -> IStatisticsRepository:
+    return notes_repository.statistics_repository
+
+
 @pytest.fixture(scope="session")
 def created_user() -> UserEntity:
     return UserEntity(username="correct_username", password="correct_password")
@@ -48,5 +81,33 @@ def authentication_service(
 
 
 @pytest.fixture
-def diary(notes_repository: INotesRepository) -> Diary:
-    return Diary(notes_repository)
+def diary(
+    notes_repository: INotesRepository,
+    statistics_repository: IStatisticsRepository,
+) -> Diary:
+    return Diary(notes_repository, statistics_repository)
+
+
+@pytest.fixture
+def async_diary(
+    notes_repository: INotesRepository,
+    statistics_repository: IStatisticsRepository,
+) -> AsyncDiary:
+    return AsyncDiary(
+        ThreadPoolNotesRepository(notes_repository),
+        ThreadPoolStatisticsRepository(statistics_repository),
+    )
+
+
+@pytest.fixture
+def async_user_repository(
+    user_repository: IUsersRepository,
+) -> IAsyncUsersRepository:
+    return ThreadPoolUsersRepository(user_repository)
+
+
+@pytest.fixture
+def async_authentication_service(
+    async_user_repository: IAsyncUsersRepository,
+) -> IAsyncUserAuthenticationService:
+    return AsyncUserAuthenticationService(async_user_repository)
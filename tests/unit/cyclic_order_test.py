@@ -0,0 +1,95 @@
+from datetime import date, time
+from itertools import chain, product
+
+import pytest
+
+from src.domain.exceptions import (
+    NoSleepDurationException,
+    TimePointsSequenceException,
+)
+from src.domain.services import Durations, PointsColumns
+from src.domain.specifications import (
+    NoSleepHasValidTime,
+    PointsHasValidAnyAllowedSortedSequences,
+    find_invalid_points,
+    no_sleep_fits_sleep,
+    points_in_cyclic_order,
+)
+from tests.unit.conftest import FakePoints
+from tests.use_cases import (
+    correct_points_4_different_order_of_sequences,
+    points_all_zero,
+    points_order_desc_from_fell_asleep_and_one_hour_no_sleep,
+    points_order_desc_from_got_up_and_one_hour_no_sleep,
+    points_order_desc_from_went_to_bed_and_one_hour_no_sleep,
+    points_order_desc_from_woke_up_and_one_hour_no_sleep,
+    points_with_zeros_and_some_big_no_sleep,
+    wrong_points_where_fell_asleep_is_wrong,
+    wrong_points_where_got_up_is_wrong,
+    wrong_points_where_no_sleep_gt_sleep,
+    wrong_points_where_went_to_bed_is_wrong,
+    wrong_points_where_woke_up_is_wrong,
+)
+
+
+use_cases = list(
+    chain(
+        correct_points_4_different_order_of_sequences,
+        wrong_points_where_went_to_bed_is_wrong,
+        wrong_points_where_fell_asleep_is_wrong,
+        wrong_points_where_woke_up_is_wrong,
+        wrong_points_where_got_up_is_wrong,
+        wrong_points_where_no_sleep_gt_sleep,
+        (
+            points_all_zero,
+            points_with_zeros_and_some_big_no_sleep,
+            points_order_desc_from_went_to_bed_and_one_hour_no_sleep,
+            points_order_desc_from_got_up_and_one_hour_no_sleep,
+            points_order_desc_from_woke_up_and_one_hour_no_sleep,
+            points_order_desc_from_fell_asleep_and_one_hour_no_sleep,
+        ),
+    ),
+)
+# Все сочетания четырех точек и времени без сна с шагом в 4 часа.
+grid = [
+    (date(2020, 12, 12), *map(time, hours))
+    for hours in product(range(0, 24, 4), repeat=5)
+]
+
+
+def expected_exception(points: FakePoints) -> type[Exception] | None:
+    if not NoSleepHasValidTime(Durations(points)):
+        return NoSleepDurationException
+    if not PointsHasValidAnyAllowedSortedSequences(points):
+        return TimePointsSequenceException
+    return None
+
+
+@pytest.mark.parametrize("values", use_cases)
+def test_single_pass_checks_match_specifications(values: tuple):
+    points = FakePoints(*values)
+
+    assert points_in_cyclic_order(
+        points.went_to_bed_minutes,
+        points.fell_asleep_minutes,
+        points.woke_up_minutes,
+        points.got_up_minutes,
+    ) == bool(PointsHasValidAnyAllowedSortedSequences(points))
+    assert no_sleep_fits_sleep(
+        points.fell_asleep_minutes,
+        points.woke_up_minutes,
+        points.no_sleep_minutes,
+    ) == bool(NoSleepHasValidTime(Durations(points)))
+
+
+@pytest.mark.parametrize("cases", [use_cases, grid], ids=["use_cases", "grid"])
+def test_batch_check_matches_specifications(cases: list[tuple]):
+    points = [FakePoints(*values) for values in cases]
+
+    assert find_invalid_points(PointsColumns.from_points(points)) == [
+        expected_exception(note_points) for note_points in points
+    ]
+
+
+def test_batch_check_of_empty_columns():
+    assert find_invalid_points(PointsColumns.from_points([])) == []
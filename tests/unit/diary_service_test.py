@@ -1,13 +1,23 @@
-from datetime import date, time
+from datetime import date, time, timedelta
+from typing import Any
 from uuid import uuid4
 
 import pytest
 
 from src.domain.entities import NoteEntity
-from src.domain.exceptions import NonUniqueNoteBedtimeDateException
-from src.domain.services import INotesRepository
-from src.service_layer import Diary
-from tests.use_cases import points_order_desc_from_went_to_bed
+from src.domain.exceptions import (
+    InvalidDateRangeException,
+    NonUniqueNoteBedtimeDateException,
+    NoteNotFoundException,
+    TimePointsSequenceException,
+)
+from src.domain.services import INotesRepository, Period, PeriodStatistics
+from src.service_layer import AsyncDiary, Diary
+from tests.use_cases import (
+    points_of_two_weeks,
+    points_order_desc_from_went_to_bed,
+    wrong_points_went_to_bed_gt_fell_asleep_and_lt_other_time_points,
+)
 
 
 @pytest.mark.parametrize(
@@ -102,3 +112,261 @@ def test_write_different_note_in_diary(
     assert note_in_diary_2.points.fell_asleep in points_2
     assert note_in_diary_2.points.woke_up in points_2
     assert note_in_diary_2.points.got_up in points_2
+
+
+def test_import_notes_in_diary(
+    diary: Diary,
+    notes_repository: INotesRepository,
+):
+    fake_owner_oid = uuid4()
+    bedtime_date: date
+    bedtime_date, *time_points = points_order_desc_from_went_to_bed
+    fields = ("went_to_bed", "fell_asleep", "woke_up", "got_up")
+    rows = [
+        (
+            line,
+            {
+                "bedtime_date": bedtime_date + timedelta(days=line),
+                **dict(zip(fields, time_points)),
+            },
+        )
+        for line in range(1, 2 * Diary.IMPORT_BATCH_SIZE + 2)
+    ]
+
+    report = diary.import_notes(fake_owner_oid, rows)
+
+    assert report.imported == len(rows)
+    assert report.errors == []
+    assert len(notes_repository.get_all_notes(fake_owner_oid)) == len(rows)
+
+
+def test_import_notes_reports_wrong_and_non_unique_rows(
+    diary: Diary,
+    notes_repository: INotesRepository,
+):
+    fake_owner_oid = uuid4()
+    fields = ("bedtime_date", "went_to_bed", "fell_asleep", "woke_up", "got_up")
+    correct_values: dict[str, Any] = dict(
+        zip(fields, points_order_desc_from_went_to_bed),
+    )
+    next_day_values = {
+        **correct_values,
+        "bedtime_date": correct_values["bedtime_date"] + timedelta(days=1),
+    }
+    wrong_values = {
+        **dict(
+            zip(
+                fields,
+                wrong_points_went_to_bed_gt_fell_asleep_and_lt_other_time_points,
+            ),
+        ),
+        "bedtime_date": correct_values["bedtime_date"] + timedelta(days=2),
+    }
+    diary.write(fake_owner_oid, *points_order_desc_from_went_to_bed)
+
+    report = diary.import_notes(
+        fake_owner_oid,
+        [
+            (1, correct_values),
+            (2, next_day_values),
+            (3, wrong_values),
+            (4, next_day_values),
+        ],
+    )
+
+    assert report.imported == 1
+    assert [error.line for error in report.errors] == [1, 3, 4]
+    assert (
+        report.errors[0].error
+        == NonUniqueNoteBedtimeDateException(
+            correct_values["bedtime_date"],
+        ).message
+    )
+    assert report.errors[1].error == TimePointsSequenceException().message
+    assert (
+        report.errors[2].error
+        == NonUniqueNoteBedtimeDateException(
+            next_day_values["bedtime_date"],
+        ).message
+    )
+    assert len(notes_repository.get_all_notes(fake_owner_oid)) == 2
+
+
+def test_weekly_statistics_of_diary(diary: Diary):
+    fake_owner_oid = uuid4()
+    for points in points_of_two_weeks:
+        diary.write(fake_owner_oid, *points)
+    diary.write(uuid4(), *points_order_desc_from_went_to_bed)
+
+    weeks = diary.get_statistics(
+        fake_owner_oid,
+        Period.WEEK,
+        date(2020, 12, 1),
+        date(2020, 12, 31),
+    )
+
+    assert weeks == [
+        PeriodStatistics(date(2020, 12, 7), 2, 960, 1440, 60, 900),
+        PeriodStatistics(date(2020, 12, 14), 1, 435, 500, 20, 415),
+    ]
+    assert weeks[0].average_sleep == time(8)
+    assert weeks[0].average_in_bed == time(12)
+    assert weeks[0].sleep_efficiency == 0.62
+    assert weeks[1].average_sleep == time(7, 15)
+    assert weeks[1].average_in_bed == time(8, 20)
+    assert weeks[1].sleep_efficiency == 0.83
+
+
+def test_statistics_of_periods_intersecting_date_range(diary: Diary):
+    fake_owner_oid = uuid4()
+    for points in points_of_two_weeks:
+        diary.write(fake_owner_oid, *points)
+
+    weeks = diary.get_statistics(
+        fake_owner_oid,
+        Period.WEEK,
+        date(2020, 12, 13),
+        date(2020, 12, 13),
+    )
+    months = diary.get_statistics(
+        fake_owner_oid,
+        Period.MONTH,
+        date(2020, 12, 13),
+        date(2020, 12, 13),
+    )
+
+    assert weeks == [PeriodStatistics(date(2020, 12, 7), 2, 960, 1440, 60, 900)]
+    assert months == [PeriodStatistics(date(2020, 12, 1), 3, 1395, 1940, 80, 1315)]
+
+
+def test_statistics_follow_rewrite_and_erase(diary: Diary):
+    fake_owner_oid = uuid4()
+    for points in points_of_two_weeks:
+        diary.write(fake_owner_oid, *points)
+    first_points, second_points, third_points = points_of_two_weeks
+
+    diary.rewrite(fake_owner_oid, *first_points[:-1], time(1))
+    diary.erase(fake_owner_oid, third_points[0])
+
+    weeks = diary.get_statistics(
+        fake_owner_oid,
+        Period.WEEK,
+        date(2020, 12, 1),
+        date(2020, 12, 31),
+    )
+    assert weeks == [PeriodStatistics(date(2020, 12, 7), 2, 960, 1440, 120, 840)]
+
+    diary.erase(fake_owner_oid, first_points[0])
+    diary.erase(fake_owner_oid, second_points[0])
+
+    assert (
+        diary.get_statistics(
+            fake_owner_oid,
+            Period.MONTH,
+            date(2020, 12, 1),
+            date(2020, 12, 31),
+        )
+        == []
+    )
+
+
+def test_rewrite_and_erase_not_existing_note(diary: Diary):
+    bedtime_date, *_ = points_order_desc_from_went_to_bed
+
+    with pytest.raises(NoteNotFoundException):
+        diary.rewrite(uuid4(), *points_order_desc_from_went_to_bed)
+    with pytest.raises(NoteNotFoundException):
+        diary.erase(uuid4(), bedtime_date)
+
+
+def test_statistics_with_wrong_date_range(diary: Diary):
+    with pytest.raises(InvalidDateRangeException):
+        diary.get_statistics(
+            uuid4(),
+            Period.WEEK,
+            date(2020, 12, 2),
+            date(2020, 12, 1),
+        )
+
+
+@pytest.mark.anyio
+async def test_async_diary_matches_diary(async_diary: AsyncDiary):
+    fake_owner_oid = uuid4()
+    first_points, *_, third_points = points_of_two_weeks
+    for points in points_of_two_weeks:
+        await async_diary.write(fake_owner_oid, *points)
+
+    with pytest.raises(NonUniqueNoteBedtimeDateException):
+        await async_diary.write(fake_owner_oid, *first_points)
+    await async_diary.rewrite(fake_owner_oid, *first_points[:-1], time(1))
+    await async_diary.erase(fake_owner_oid, third_points[0])
+    with pytest.raises(NoteNotFoundException):
+        await async_diary.erase(fake_owner_oid, third_points[0])
+
+    weeks = await async_diary.get_statistics(
+        fake_owner_oid,
+        Period.WEEK,
+        date(2020, 12, 1),
+        date(2020, 12, 31),
+    )
+    assert weeks == [PeriodStatistics(date(2020, 12, 7), 2, 960, 1440, 120, 840)]
+    with pytest.raises(InvalidDateRangeException):
+        await async_diary.get_statistics(
+            fake_owner_oid,
+            Period.WEEK,
+            date(2020, 12, 2),
+            date(2020, 12, 1),
+        )
+
+
+@pytest.mark.anyio
+async def test_async_diary_import_notes(
+    async_diary: AsyncDiary,
+    notes_repository: INotesRepository,
+):
+    fake_owner_oid = uuid4()
+    bedtime_date, *time_points = points_order_desc_from_went_to_bed
+    fields = ("went_to_bed", "fell_asleep", "woke_up", "got_up")
+    values = {"bedtime_date": bedtime_date, **dict(zip(fields, time_points))}
+
+    rows = [(1, values), (2, values)]
+
+    report = await async_diary.import_notes(fake_owner_oid, rows)
+
+    assert report.imported == 1
+    assert [error.line for error in report.errors] == [2]
+    assert len(notes_repository.get_all_notes(fake_owner_oid)) == 1
+
+
+def test_notes_pages_of_diary(diary: Diary):
+    fake_owner_oid = uuid4()
+    for points in points_of_two_weeks:
+        diary.write(fake_owner_oid, *points)
+    first_date, second_date, third_date = (
+        points[0] for points in points_of_two_weeks
+    )
+
+    first_page = diary.get_notes_page(fake_owner_oid, 2)
+    last_page = diary.get_notes_page(fake_owner_oid, 2, first_page.next_cursor)
+
+    assert [note.points.bedtime_date for note in first_page.notes] == [
+        third_date,
+        second_date,
+    ]
+    assert first_page.next_cursor == second_date
+    assert [note.points.bedtime_date for note in last_page.notes] == [first_date]
+    assert last_page.next_cursor is None
+    assert diary.get_notes_page(fake_owner_oid, 3).next_cursor is None
+
+
+@pytest.mark.anyio
+async def test_async_diary_export_notes(async_diary: AsyncDiary):
+    fake_owner_oid = uuid4()
+    for points in reversed(points_of_two_weeks):
+        await async_diary.write(fake_owner_oid, *points)
+
+    notes = [note async for note in async_diary.export_notes(fake_owner_oid)]
+
+    assert [note.points.bedtime_date for note in notes] == [
+        points[0] for points in points_of_two_weeks
+    ]
@@ -0,0 +1,220 @@
+from datetime import UTC, datetime
+from typing import Any, Callable
+
+import pytest
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+from jwt import decode
+
+from src.domain.entities import UserEntity
+from src.infra.authorization import (
+    JWTAuthorizationException,
+    JWTKeyException,
+    JWTRevokedException,
+    MemoryRevokedTokensStore,
+    UserJWTService,
+    VerifiedTokensCache,
+)
+from src.infra.authorization.base import TokenType, UserJWTPayload
+from src.infra.authorization.exceptions import JWTTypeException
+from src.project.settings import AuthJWTSettings
+from src.project.settings.authentication import JWTVerificationKey
+
+
+PrivateKey = (
+    rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey
+)
+
+PRIVATE_KEYS: dict[str, Callable[[], PrivateKey]] = {
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate,
+}
+
+
+def payload(exp: float) -> UserJWTPayload:
+    return UserJWTPayload(
+        sub="sub",
+        username="user",
+        token_type=TokenType.ACCESS,
+        exp=exp,
+    )
+
+
+def in_future() -> float:
+    return datetime.now(UTC).timestamp() + 3600
+
+
+def key_settings(algorithm: str, **kw: Any) -> AuthJWTSettings:
+    if algorithm == "HS256":
+        return AuthJWTSettings(ALGORITHM=algorithm, PRIVATE_KEY="s" * 32, **kw)
+
+    private_key = PRIVATE_KEYS[algorithm]()
+    return AuthJWTSettings(
+        ALGORITHM=algorithm,
+        PRIVATE_KEY=private_key.private_bytes(
+            Encoding.PEM,
+            PrivateFormat.PKCS8,
+            NoEncryption(),
+        ).decode(),
+        PUBLIC_KEY=private_key.public_key()
+        .public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
+        .decode(),
+        **kw,
+    )
+
+
+@pytest.fixture
+def service() -> UserJWTService:
+    return UserJWTService(AuthJWTSettings())
+
+
+@pytest.fixture
+def user() -> UserEntity:
+    return UserEntity(username="user", password=b"password")
+
+
+def test_cache_evicts_least_recently_used():
+    cache = VerifiedTokensCache(max_size=2)
+    cache.put("first", payload(in_future()))
+    cache.put("second", payload(in_future()))
+    cache.get("first")
+
+    cache.put("third", payload(in_future()))
+
+    assert len(cache) == 2
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+
+
+def test_cache_drops_expired_payload():
+    cache = VerifiedTokensCache()
+    cache.put("expired", payload(datetime.now(UTC).timestamp() - 1))
+    cache.put("valid", payload(in_future()))
+
+    assert cache.get("expired") is None
+    assert len(cache) == 1
+
+
+def test_authenticate_verifies_signature_once(
+    service: UserJWTService,
+    user: UserEntity,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    decode_calls = []
+
+    def counting_decode(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        decode_calls.append(args)
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr("src.infra.authorization.jwt.decode", counting_decode)
+    token = service.create_access(user).access_token
+
+    first = service.authenticate(token)
+    second = service.authenticate(token)
+
+    assert len(decode_calls) == 1
+    assert first.user_oid == second.user_oid == user.oid
+    assert first.username == user.username
+
+
+def test_authenticate_wrong_token_type(service: UserJWTService, user: UserEntity):
+    token = service.create_refresh(user).refresh_token
+
+    with pytest.raises(JWTTypeException):
+        service.authenticate(token)
+    assert service.authenticate(token, TokenType.REFRESH).user_oid == user.oid
+
+
+def test_authenticate_invalid_token(service: UserJWTService):
+    with pytest.raises(JWTAuthorizationException):
+        service.authenticate("not.a.token")
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256", "EdDSA", "HS256"])
+def test_authenticate_with_algorithm(algorithm: str, user: UserEntity):
+    service = UserJWTService(key_settings(algorithm, JWT_KEY_ID="current"))
+    token = service.create_access(user).access_token
+
+    assert service.authenticate(token).user_oid == user.oid
+    assert service.signing_key.kid == "current"
+
+
+def test_authenticate_with_previous_key_after_rotation(user: UserEntity):
+    previous_settings = key_settings("RS256", JWT_KEY_ID="previous")
+    token = UserJWTService(previous_settings).create_access(user).access_token
+    previous_key = JWTVerificationKey(
+        kid="previous",
+        algorithm="RS256",
+        public_key=previous_settings.PUBLIC_KEY,
+    )
+
+    rotated_settings = key_settings(
+        "EdDSA",
+        JWT_KEY_ID="current",
+        JWT_PREVIOUS_KEYS=[previous_key],
+    )
+    rotated = UserJWTService(rotated_settings)
+
+    assert rotated.authenticate(token).user_oid == user.oid
+    with pytest.raises(JWTAuthorizationException):
+        UserJWTService(key_settings("EdDSA", JWT_KEY_ID="current")).authenticate(
+            token,
+        )
+
+
+def test_key_not_matching_algorithm():
+    settings = key_settings("RS256")
+
+    with pytest.raises(JWTKeyException):
+        UserJWTService(settings.model_copy(update={"ALGORITHM": "HS256"}))
+    with pytest.raises(JWTKeyException):
+        UserJWTService(settings.model_copy(update={"ALGORITHM": "EdDSA"}))
+
+
+def test_signing_key_requires_private_key():
+    settings = key_settings("ES256")
+
+    with pytest.raises(JWTKeyException):
+        UserJWTService(settings.model_copy(update={"PRIVATE_KEY": ""}))
+    with pytest.raises(JWTKeyException):
+        UserJWTService(
+            settings.model_copy(
+                update={"PRIVATE_KEY": settings.PUBLIC_KEY, "PUBLIC_KEY": ""},
+            ),
+        )
+
+
+def test_revoked_tokens_store_expires_at_exp(monkeypatch: pytest.MonkeyPatch):
+    store = MemoryRevokedTokensStore()
+    now = datetime.now(UTC).timestamp()
+    store.revoke("expired", now - 1)
+    store.revoke("soon", now + 10)
+    store.revoke("later", now + 3600)
+
+    assert not store.is_revoked("expired")
+    assert store.is_revoked("soon") and store.is_revoked("later")
+
+    monkeypatch.setattr(store, "_now", lambda: now + 11)
+    store.purge_expired()
+
+    assert not store.is_revoked("soon")
+    assert store.is_revoked("later")
+    assert len(store) == 1
+
+
+def test_deauthorize_revokes_token(service: UserJWTService, user: UserEntity):
+    token = service.create_access(user).access_token
+    other_token = service.create_access(user).access_token
+
+    service.deauthorize(service.authenticate(token))
+
+    with pytest.raises(JWTRevokedException):
+        service.authenticate(token)
+    assert service.authenticate(other_token).user_oid == user.oid
@@ -0,0 +1,79 @@
+import pytest
+
+from src.service_layer.exceptions import LoginThrottledException
+from src.service_layer.services import LoginThrottle, MemoryLoginAttemptsStore
+from tests.unit.conftest import FakeClock
+
+
+@pytest.fixture
+def store(clock: FakeClock) -> MemoryLoginAttemptsStore:
+    return MemoryLoginAttemptsStore(max_keys=3, clock=clock)
+
+
+def test_store_sliding_window(store: MemoryLoginAttemptsStore, clock: FakeClock):
+    assert store.acquire({"key": 2}, 10) is None
+    clock.now = 4
+    assert store.acquire({"key": 2}, 10) is None
+    assert store.acquire({"key": 2}, 10) == ("key", 6)
+
+    clock.now = 10
+    assert store.acquire({"key": 2}, 10) is None
+    assert store.acquire({"key": 2}, 10) == ("key", 4)
+
+
+def test_store_evicts_least_recent_keys(store: MemoryLoginAttemptsStore):
+    for key in ("first", "second", "third"):
+        store.acquire({key: 1}, 10)
+    assert store.acquire({"first": 1}, 10) is not None
+
+    store.acquire({"fourth": 1}, 10)
+
+    assert len(store) == 3
+    assert store.acquire({"second": 1}, 10) is None
+
+
+def test_store_rejected_attempt_not_recorded_in_other_windows(
+    store: MemoryLoginAttemptsStore,
+):
+    store.acquire({"username": 1}, 10)
+
+    assert store.acquire({"ip": 1, "username": 1}, 10) == ("username", 10)
+    assert store.acquire({"ip": 1}, 10) is None
+
+
+def test_throttle_by_username_and_ip(clock: FakeClock):
+    store = MemoryLoginAttemptsStore(clock=clock)
+    throttle = LoginThrottle(store, username_limit=2, ip_limit=3, window=60)
+
+    throttle.acquire("user", "10.0.0.1")
+    throttle.acquire("user", "10.0.0.2")
+    with pytest.raises(LoginThrottledException) as exception:
+        throttle.acquire("user", "10.0.0.3")
+    assert exception.value.retry_after_seconds == 60
+
+    throttle.acquire("other", "10.0.0.1")
+    throttle.acquire("another", "10.0.0.1")
+    with pytest.raises(LoginThrottledException):
+        throttle.acquire("one_more", "10.0.0.1")
+
+    throttle.reset("user")
+    throttle.acquire("user", "10.0.0.4")
+
+    metrics = throttle.metrics
+    assert metrics.allowed == 5
+    assert metrics.rejected_by_username == metrics.rejected_by_ip == 1
+
+
+def test_throttle_by_username_keeps_ip_window(clock: FakeClock):
+    store = MemoryLoginAttemptsStore(clock=clock)
+    throttle = LoginThrottle(store, username_limit=1, ip_limit=2, window=60)
+
+    throttle.acquire("user", "10.0.0.1")
+    for _ in range(3):
+        with pytest.raises(LoginThrottledException):
+            throttle.acquire("user", "10.0.0.1")
+    throttle.acquire("other", "10.0.0.1")
+
+    metrics = throttle.metrics
+    assert (metrics.allowed, metrics.rejected_by_username) == (2, 3)
+    assert metrics.rejected_by_ip == 0
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from uuid import uuid4
+
+from src.domain.entities import NoteEntity
+from src.domain.values.points import Points
+from src.infra.repository import MemoryNotesRepository
+from tests.use_cases import points_order_desc_from_went_to_bed
+
+
+def create_notes(owner_oid, days: int) -> list[NoteEntity]:
+    bedtime_date, *time_points = points_order_desc_from_went_to_bed
+    return [
+        NoteEntity(
+            owner_oid=owner_oid,
+            points=Points(bedtime_date + timedelta(days=day), *time_points),
+        )
+        for day in range(days)
+    ]
+
+
+def test_memory_repository_indexes_follow_add_update_delete():
+    repository = MemoryNotesRepository()
+    owner_oid = uuid4()
+    first_note, second_note, third_note = create_notes(owner_oid, 3)
+    repository.add_many([third_note, first_note])
+    repository.add(second_note)
+
+    updated = NoteEntity(owner_oid=owner_oid, points=second_note.points)
+    assert repository.update(updated) is second_note
+    assert repository.delete(owner_oid, first_note.points.bedtime_date) is first_note
+    assert repository.delete(owner_oid, first_note.points.bedtime_date) is None
+
+    assert repository.get_by_oid(first_note.oid) is None
+    stored = repository.get_by_oid(second_note.oid)
+    assert stored is not None and stored.points == second_note.points
+    assert repository.get_by_oid(third_note.oid) is third_note
+    assert (
+        repository.get_by_bedtime_date(first_note.points.bedtime_date, owner_oid)
+        is None
+    )
+    assert repository.get_all_notes(owner_oid) == {second_note, third_note}
+    assert repository.get_all_notes(uuid4()) == set()
+    assert [note.points.bedtime_date for note in repository] == [
+        second_note.points.bedtime_date,
+        third_note.points.bedtime_date,
+    ]
+
+
+def test_memory_repository_concurrent_writes():
+    repository = MemoryNotesRepository()
+    owner_oid = uuid4()
+    notes = create_notes(owner_oid, 400)
+
+    batches = [notes[::2], notes, notes, notes]
+
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        not_added = list(executor.map(repository.add_many, batches))
+
+    assert sum(map(len, not_added)) == sum(map(len, batches)) - len(notes)
+    assert repository.get_all_notes(owner_oid) == set(notes)
+    assert list(repository) == sorted(notes)
+
+
+def test_memory_repository_date_range_and_latest():
+    repository = MemoryNotesRepository()
+    owner_oid = uuid4()
+    notes = create_notes(owner_oid, 10)
+    repository.add_many(reversed(notes))
+    repository.add_many(create_notes(uuid4(), 10))
+
+    assert (
+        repository.get_by_date_range(
+            owner_oid,
+            notes[2].points.bedtime_date,
+            notes[5].points.bedtime_date,
+        )
+        == notes[2:6]
+    )
+    assert repository.get_latest(owner_oid, 3) == notes[:-4:-1]
+    assert (
+        repository.get_latest(owner_oid, 3, before=notes[2].points.bedtime_date)
+        == notes[1::-1]
+    )
+    assert repository.get_latest(uuid4(), 3) == []
+
+
+def test_memory_repository_iter_notes():
+    repository = MemoryNotesRepository()
+    owner_oid = uuid4()
+    notes = create_notes(owner_oid, 10)
+    repository.add_many(reversed(notes))
+    repository.add_many(create_notes(uuid4(), 10))
+
+    assert list(repository.iter_notes(owner_oid)) == notes
+    assert list(repository.iter_notes(uuid4())) == []
@@ -0,0 +1,44 @@
+from threading import Event
+
+import pytest
+
+from anyio import create_task_group, sleep, wait_all_tasks_blocked
+from anyio.to_thread import run_sync
+
+from src.service_layer.exceptions import PasswordHashingBusyException
+from src.service_layer.services import PasswordHashingPool
+
+
+@pytest.mark.anyio
+async def test_pool_runs_function_and_records_latency():
+    pool = PasswordHashingPool(workers=1, max_queue=1)
+
+    assert await pool.run(pow, 2, 10) == 1024
+
+    metrics = pool.metrics
+    assert metrics.completed == 1
+    assert metrics.queue_depth == metrics.in_progress == 0
+    assert metrics.hash_seconds_max >= metrics.hash_seconds_avg > 0
+
+
+@pytest.mark.anyio
+async def test_saturated_pool_rejects_immediately():
+    pool = PasswordHashingPool(workers=1, max_queue=1)
+    release = Event()
+
+    async with create_task_group() as task_group:
+        task_group.start_soon(pool.run, release.wait)
+        task_group.start_soon(pool.run, release.wait)
+        await wait_all_tasks_blocked()
+        while pool.metrics.in_progress != 1:
+            await sleep(0.001)
+
+        assert pool.metrics.queue_depth == 1
+        with pytest.raises(PasswordHashingBusyException):
+            await pool.run(release.wait)
+
+        await run_sync(release.set)
+
+    metrics = pool.metrics
+    assert (metrics.completed, metrics.rejected, metrics.queue_depth) == (2, 1, 0)
+    assert metrics.wait_seconds_max > 0
@@ -2,9 +2,12 @@ from datetime import date, time
 
 import pytest
 
+from src.domain.exceptions import TimePointsSequenceException
+from src.domain.services.batch import point_to_minutes
 from src.domain.values.points import Points
 from tests.use_cases import (
     correct_points_4_different_order_of_sequences,
+    wrong_points_went_to_bed_gt_fell_asleep_and_lt_other_time_points,
 )
 
 
@@ -36,3 +39,58 @@ def test_create_points_with_different_first_point(
     assert isinstance(points.woke_up, time)
     assert isinstance(points.got_up, time)
     assert isinstance(points.no_sleep, time)
+
+
+@pytest.mark.parametrize(
+    "correct_points",
+    correct_points_4_different_order_of_sequences,
+)
+def test_points_keep_time_points_as_minutes(
+    correct_points: tuple[date, time, time, time, time],
+):
+    points = Points(*correct_points, time(0, 10))
+
+    assert points.no_sleep_minutes == 10
+    assert (
+        points.bedtime_date,
+        points.went_to_bed,
+        points.fell_asleep,
+        points.woke_up,
+        points.got_up,
+        points.no_sleep,
+    ) == (*correct_points, time(0, 10))
+    assert not hasattr(points, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "correct_points",
+    correct_points_4_different_order_of_sequences,
+)
+def test_trusted_points_equal_validated_points(
+    correct_points: tuple[date, time, time, time, time],
+):
+    points = Points(*correct_points)
+
+    assert (
+        Points.trusted(
+            points.bedtime_date,
+            points.went_to_bed_minutes,
+            points.fell_asleep_minutes,
+            points.woke_up_minutes,
+            points.got_up_minutes,
+            points.no_sleep_minutes,
+        )
+        == points
+    )
+
+
+def test_trusted_points_skip_validation():
+    with pytest.raises(TimePointsSequenceException):
+        Points(*wrong_points_went_to_bed_gt_fell_asleep_and_lt_other_time_points)
+
+    bedtime_date, *time_points = (
+        wrong_points_went_to_bed_gt_fell_asleep_and_lt_other_time_points
+    )
+    points = Points.trusted(bedtime_date, *map(point_to_minutes, time_points), 0)
+
+    assert points.no_sleep == time(0, 0)
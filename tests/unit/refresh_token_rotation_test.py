@@ -0,0 +1,107 @@
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import UserEntity
+from src.infra.authorization import (
+    AsyncRefreshTokenRotation,
+    JWTAuthorizationException,
+    RefreshTokenReuseException,
+    RefreshTokenRevokedException,
+    UserJWTService,
+)
+from src.infra.repository import (
+    MemoryRefreshTokensRepository,
+    ThreadPoolRefreshTokensRepository,
+)
+from src.project.settings import AuthJWTSettings
+
+
+@pytest.fixture
+def repository() -> MemoryRefreshTokensRepository:
+    return MemoryRefreshTokensRepository()
+
+
+@pytest.fixture
+def rotation(repository: MemoryRefreshTokensRepository) -> AsyncRefreshTokenRotation:
+    return AsyncRefreshTokenRotation(
+        ThreadPoolRefreshTokensRepository(repository),
+        UserJWTService(AuthJWTSettings()),
+    )
+
+
+@pytest.fixture
+def user() -> UserEntity:
+    return UserEntity(username="user", password="password")
+
+
+@pytest.mark.anyio
+async def test_refresh_rotates_tokens(
+    rotation: AsyncRefreshTokenRotation,
+    user: UserEntity,
+):
+    issued = await rotation.issue(user)
+
+    refreshed = await rotation.refresh(issued.refresh_token)
+
+    assert refreshed.refresh_token != issued.refresh_token
+    principal = rotation.token_service.authenticate(refreshed.access_token)
+    assert (principal.user_oid, principal.username) == (user.oid, user.username)
+    assert await rotation.refresh(refreshed.refresh_token)
+
+
+@pytest.mark.anyio
+async def test_refresh_token_reuse_revokes_family(
+    rotation: AsyncRefreshTokenRotation,
+    repository: MemoryRefreshTokensRepository,
+    user: UserEntity,
+):
+    issued = await rotation.issue(user)
+    refreshed = await rotation.refresh(issued.refresh_token)
+
+    with pytest.raises(RefreshTokenReuseException):
+        await rotation.refresh(issued.refresh_token)
+    with pytest.raises(RefreshTokenRevokedException):
+        await rotation.refresh(refreshed.refresh_token)
+    assert repository.delete_expired(now=float("inf")) == 0
+
+
+@pytest.mark.anyio
+async def test_refresh_with_access_token(
+    rotation: AsyncRefreshTokenRotation,
+    user: UserEntity,
+):
+    issued = await rotation.issue(user)
+
+    with pytest.raises(JWTAuthorizationException):
+        await rotation.refresh(issued.access_token)
+
+
+@pytest.mark.anyio
+async def test_end_deletes_family_of_access_token(
+    rotation: AsyncRefreshTokenRotation,
+    repository: MemoryRefreshTokensRepository,
+    user: UserEntity,
+):
+    issued = await rotation.issue(user)
+
+    await rotation.end(rotation.token_service.authenticate(issued.access_token))
+
+    assert repository.delete_expired(now=float("inf")) == 0
+    with pytest.raises(RefreshTokenRevokedException):
+        await rotation.refresh(issued.refresh_token)
+
+
+def test_memory_repository_keeps_recently_rotated_families():
+    repository = MemoryRefreshTokensRepository(max_families=2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    repository.add_family(first, uuid4(), "first", 10)
+    repository.add_family(second, uuid4(), "second", 20)
+    assert repository.rotate(first, "first", "first-2", 30)
+    assert not repository.rotate(first, "first", "first-3", 40)
+
+    repository.add_family(third, uuid4(), "third", 50)
+
+    assert not repository.rotate(second, "second", "second-2", 60)
+    assert repository.rotate(first, "first-2", "first-3", 70)
+    assert repository.delete_expired(now=50) == 1
@@ -306,6 +306,19 @@ correct_points_4_different_order_of_sequences_and_one_hour_no_sleep: TTN = (
     points_order_desc_from_woke_up_and_one_hour_no_sleep,
     points_order_desc_from_fell_asleep_and_one_hour_no_sleep,
 )
+# Записи двух ISO недель: суббота и воскресенье одной недели, понедельник следующей
+points_of_two_weeks: tuple[TN, ...] = (
+    (date_point, time(1), time(3), time(11), time(13), time()),
+    (date(2020, 12, 13), time(1), time(3), time(11), time(13), time(1)),
+    (
+        date(2020, 12, 14),
+        time(23, 30),
+        time(0, 10),
+        time(7, 25),
+        time(7, 50),
+        time(0, 20),
+    ),
+)
 
 all_correct_points_sequences: list[Points] = [
     Points(*points) for points in correct_points_4_different_order_of_sequences